@@ -1,4 +1,17 @@
-from .api import app
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api import app
 
 __all__ = ["app"]
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
+
+
+def __getattr__(name: str):
+    # Imported on first access, so importing `app.config` or `app.server`
+    # alone does not build the application and its per-process state
+    if name == "app":
+        from .api import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
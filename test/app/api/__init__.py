@@ -1,10 +1,42 @@
-from fastapi import FastAPI
+import time
+
+# Taken before the other imports, to time the import of the application
+_import_started = time.perf_counter()
+
+from dataclasses import asdict
+
+from fastapi import Depends, FastAPI, HTTPException, Query
 from fastapi.concurrency import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
-from ..infraestructure.database.mongodb import init_beanie, init_db_dev_connection
-from ..infraestructure.database.seed import create_db_placeholders
+from ..config import settings
+from ..infraestructure.cache import MISSING, get_cache_stats
+from ..infraestructure.coalescing import get_batch_loader_stats, get_single_flight_stats
+from ..infraestructure.database.mongodb import (
+    create_indexes,
+    init_beanie,
+    init_db_dev_connection,
+    warm_up,
+)
+from ..infraestructure.database.pool_metrics import CHECKOUT_WAIT_BUCKETS, pool_metrics
+from ..infraestructure.database.seed import seed_database
+from ..infraestructure.database.slow_queries import slow_queries
+from ..infraestructure.monitoring import (
+    CONTENT_TYPE,
+    LoopWatchdog,
+    configure_logging,
+    metrics_registry,
+)
+from .admin import require_admin
+from .auth import password_hasher
+from .metrics import MetricsMiddleware, active_route
+from .profiling import ProfilingMiddleware, profiles
 from .routes import build_routers
+from .startup import startup_timer
+
+
+configure_logging()
 
 
 @asynccontextmanager
@@ -16,9 +48,29 @@ async def lifespan(app: FastAPI):
     """
     # Initialize the database connection
     database_client = init_db_dev_connection()
-    await init_beanie(database_client)
-    await create_db_placeholders()
+    with startup_timer.phase("beanie_init"):
+        await init_beanie(database_client, indexes=False)
+    with startup_timer.phase("index_creation"):
+        await create_indexes(database_client)
+    with startup_timer.phase("warm_up"):
+        await warm_up(database_client, connections=settings.mongo_min_pool_size)
+    if settings.seed_database:
+        with startup_timer.phase("seed"):
+            await seed_database()
+    startup_timer.report()
+    watchdog = None
+    if settings.loop_watchdog_enabled:
+        watchdog = LoopWatchdog(
+            threshold=settings.loop_watchdog_threshold_seconds,
+            interval=settings.loop_watchdog_interval_seconds,
+            describe_task=active_route,
+        )
+        watchdog.start()
     yield
+    if watchdog is not None:
+        await watchdog.stop()
+    password_hasher.shutdown()
+    database_client.close()
 
 
 app = FastAPI(
@@ -48,7 +100,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "X-Total-Count", "X-Profile-Id"],
 )
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware)
+# Outermost, so the latency includes every other middleware
+app.add_middleware(MetricsMiddleware)
+
+startup_timer.record("import", time.perf_counter() - _import_started)
 
 # Health check endpoint
 
@@ -61,3 +120,130 @@ async def health_check() -> dict:
         dict: Health status
     """
     return {"status": "API is running! :)"}
+
+
+@app.get("/health/caches", tags=["health"])
+async def cache_stats() -> dict:
+    """Counters of the in-process caches, for monitoring.
+
+    Returns:
+        dict: Hits, misses, evictions and size of each cache
+    """
+    return {
+        name: {**asdict(stats), "hit_ratio": stats.hit_ratio}
+        for name, stats in get_cache_stats().items()
+    }
+
+
+@app.get("/health/coalescing", tags=["health"])
+async def single_flight_stats() -> dict:
+    """Counters of the coalesced repository reads, for monitoring.
+
+    Returns:
+        dict: Per repository method, the calls run and the calls served by
+            an identical call already in flight
+    """
+    return {
+        name: {**asdict(stats), "shared_ratio": stats.shared_ratio}
+        for name, stats in get_single_flight_stats().items()
+    }
+
+
+@app.get("/health/batching", tags=["health"])
+async def batch_loader_stats() -> dict:
+    """Counters of the batched lookups by ID, for monitoring.
+
+    Returns:
+        dict: Per repository method, the lookups requested, the queries run
+            and the distinct IDs they fetched
+    """
+    return {
+        name: {**asdict(stats), "mean_batch_size": stats.mean_batch_size}
+        for name, stats in get_batch_loader_stats().items()
+    }
+
+
+@app.get("/health/startup", tags=["health"])
+async def startup_timings() -> dict:
+    """Duration of the startup phases of this worker, for tracking cold starts.
+
+    Returns:
+        dict: Milliseconds spent importing the application, initializing
+            Beanie, creating the indexes, warming up the client and seeding
+    """
+    return {
+        "total_ms": startup_timer.total * 1000,
+        "phases_ms": {phase: seconds * 1000 for phase, seconds in startup_timer.phases.items()},
+    }
+
+
+@app.get("/health/mongo-pool", tags=["health"])
+async def mongo_pool_stats() -> dict:
+    """Counters of the MongoDB connection pool, for sizing it.
+
+    Returns:
+        dict: Connections open and in use, and how long checkouts waited,
+            with cumulative checkout counts per wait upper bound in seconds
+    """
+    stats = pool_metrics.stats
+    return {
+        **asdict(stats),
+        "checkout_wait_seconds_mean": stats.checkout_wait_seconds_mean,
+        "checkout_wait_buckets": dict(
+            zip([*map(str, CHECKOUT_WAIT_BUCKETS), "+Inf"], stats.checkout_wait_buckets)
+        ),
+    }
+
+
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Metrics of this worker, in the Prometheus text exposition format.
+
+    Returns:
+        PlainTextResponse: Request and MongoDB command latency histograms,
+            requests in flight, cache counters and connection pool counters
+    """
+    return PlainTextResponse(metrics_registry.render(), media_type=CONTENT_TYPE)
+
+
+@app.get("/admin/profiles/{profile_id}", tags=["admin"], dependencies=[Depends(require_admin)])
+async def get_profile(profile_id: str) -> dict:
+    """Profile of a request that sent the X-Profile header.
+
+    Returns:
+        dict: Top functions by cumulative time, top allocations when traced,
+            and the MongoDB commands run while the request was served
+    """
+    profile = profiles.get(profile_id)
+    if profile is MISSING:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile  # type: ignore[return-value]
+
+
+@app.get("/admin/slow-queries", tags=["admin"], dependencies=[Depends(require_admin)])
+async def get_slow_queries(limit: int = Query(20, ge=1, le=1000)) -> dict:
+    """MongoDB query shapes of this worker that spent the most time in slow commands.
+
+    Returns:
+        dict: The slowness threshold, and per collection, command, query shape
+            and repository function the count, total, mean and maximum
+            duration, and documents returned of the slow commands
+    """
+    return {
+        "threshold_ms": settings.slow_query_threshold_ms,
+        "dropped": slow_queries.dropped,
+        "shapes": [
+            {**asdict(stats), "mean_ms": stats.mean_ms} for stats in slow_queries.top(limit)
+        ],
+    }
+
+
+@app.delete(
+    "/admin/slow-queries",
+    tags=["admin"],
+    status_code=204,
+    dependencies=[Depends(require_admin)],
+)
+async def reset_slow_queries() -> None:
+    """Forget the slow commands recorded so far, e.g. after adding an index."""
+    slow_queries.reset()
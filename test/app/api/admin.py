@@ -0,0 +1,32 @@
+import hmac
+from typing import Optional
+
+from fastapi import Header, HTTPException
+
+from ..config import settings
+
+ADMIN_SECRET_HEADER = "X-Admin-Secret"
+
+
+def is_admin_secret(value: Optional[str]) -> bool:
+    """Check a secret against the admin secret, in constant time.
+
+    Always False when no admin secret is configured.
+    """
+    if settings.admin_secret is None or value is None:
+        return False
+    return hmac.compare_digest(value.encode(), settings.admin_secret.get_secret_value().encode())
+
+
+async def require_admin(
+    x_admin_secret: Optional[str] = Header(None, alias=ADMIN_SECRET_HEADER),
+) -> None:
+    """Dependency rejecting the requests without the admin secret.
+
+    Raises:
+        HTTPException: 404 when admin endpoints are disabled, 403 on a wrong secret.
+    """
+    if settings.admin_secret is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not is_admin_secret(x_admin_secret):
+        raise HTTPException(status_code=403, detail="Invalid admin secret")
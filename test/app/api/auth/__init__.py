@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 from uuid import UUID
 
 import jwt
@@ -8,7 +9,16 @@ from pydantic import BaseModel, Field, SecretStr
 from app.config import settings
 from app.core.users.entities.user import UserRegistry
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from .password_hasher import PasswordHasher, PasswordHasherBusy
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds
+)
+password_hasher = PasswordHasher(
+    pwd_context,
+    max_concurrency=settings.password_hash_max_concurrency,
+    queue_timeout=settings.password_hash_queue_timeout_seconds,
+)
 
 
 class Token(BaseModel):
@@ -24,14 +34,35 @@ class UserTokenData(BaseModel):
     sub: UUID = Field(..., description="Subject of the token")
 
 
-def verify_password(plain_password: SecretStr, hashed_password: SecretStr) -> bool:
-    return pwd_context.verify(
+async def verify_password(
+    plain_password: SecretStr, hashed_password: SecretStr
+) -> tuple[bool, Optional[SecretStr]]:
+    """Verify a password off the event loop.
+
+    Args:
+        plain_password (SecretStr): The password received from the user.
+        hashed_password (SecretStr): The stored hash.
+
+    Raises:
+        PasswordHasherBusy: If the hashing queue is saturated.
+
+    Returns:
+        tuple[bool, Optional[SecretStr]]: Whether the password matches, and a new
+            hash to store when the stored one uses an outdated bcrypt cost.
+    """
+    valid, new_hash = await password_hasher.verify_and_update(
         plain_password.get_secret_value(), hashed_password.get_secret_value()
     )
+    return valid, SecretStr(new_hash) if new_hash else None
 
 
-def get_password_hash(password: SecretStr) -> SecretStr:
-    return SecretStr(pwd_context.hash(password.get_secret_value()))
+async def get_password_hash(password: SecretStr) -> SecretStr:
+    """Hash a password off the event loop.
+
+    Raises:
+        PasswordHasherBusy: If the hashing queue is saturated.
+    """
+    return SecretStr(await password_hasher.hash(password.get_secret_value()))
 
 
 def create_access_token(user_registry: UserRegistry) -> str:
@@ -0,0 +1,86 @@
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from passlib.context import CryptContext
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """Exception raised when no hashing slot frees up within the queue timeout."""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        super().__init__(f"No password hashing slot available within {timeout}s.")
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing and verification off the event loop.
+
+    Work is done in a dedicated thread pool (bcrypt releases the GIL), and at
+    most `max_concurrency` operations run at once. Callers wait at most
+    `queue_timeout` seconds for a free slot before `PasswordHasherBusy` is
+    raised, so a burst of logins fails fast instead of piling up.
+    """
+
+    def __init__(
+        self,
+        crypt_context: CryptContext,
+        max_concurrency: int,
+        queue_timeout: float,
+    ):
+        """
+        Args:
+            crypt_context (CryptContext): The passlib context holding the hashing policy.
+            max_concurrency (int): Maximum number of hashing operations running at once.
+            queue_timeout (float): Maximum time to wait for a free slot, in seconds.
+        """
+        self.crypt_context = crypt_context
+        self._max_concurrency = max_concurrency
+        self._queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="password-hasher"
+        )
+        # Semaphores are bound to the loop they are first used on
+        self._slots: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    async def _run(self, fn: Callable[..., T], *args) -> T:
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self._max_concurrency)
+
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self._queue_timeout)
+        except TimeoutError:
+            raise PasswordHasherBusy(self._queue_timeout)
+
+        try:
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            slots.release()
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the current policy."""
+        return await self._run(self.crypt_context.hash, password)
+
+    async def verify_and_update(
+        self, password: str, hashed_password: str
+    ) -> tuple[bool, Optional[str]]:
+        """Verify a password and rehash it if its hash uses an outdated policy.
+
+        Returns:
+            tuple[bool, Optional[str]]: Whether the password matches, and the new
+                hash when it matched and needs to be stored again.
+        """
+        return await self._run(
+            self.crypt_context.verify_and_update, password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        """Stop the hashing threads."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
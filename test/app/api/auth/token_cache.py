@@ -0,0 +1,57 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from app.core.users.entities.user import UserRegistry
+from app.infraestructure.cache import MISSING, TTLCache
+
+
+class TokenCache:
+    """Cache of verified access tokens, until their expiration.
+
+    Entries are keyed by a SHA-256 digest of the token, so raw tokens are not
+    kept in memory. The cache is cleared whenever the signing key or algorithm
+    changes, so tokens signed with a rotated key are verified again.
+    """
+
+    def __init__(
+        self,
+        cache: TTLCache[bytes, UserRegistry],
+        signing_key: Callable[[], tuple[str, str]],
+    ):
+        """
+        Args:
+            cache (TTLCache): The cache holding the verified tokens.
+            signing_key (Callable[[], tuple[str, str]]): Returns the current secret key and algorithm.
+        """
+        self._cache = cache
+        self._signing_key = signing_key
+        self._cached_signing_key = signing_key()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def _check_signing_key(self) -> None:
+        signing_key = self._signing_key()
+        if signing_key != self._cached_signing_key:
+            self._cache.clear()
+            self._cached_signing_key = signing_key
+
+    def get(self, token: str) -> Optional[UserRegistry]:
+        """Return the user of an already verified, unexpired token."""
+        self._check_signing_key()
+        registry = self._cache.get(self._key(token))
+        return None if registry is MISSING else registry
+
+    def set(self, token: str, registry: UserRegistry, expires_at: datetime) -> None:
+        """Remember a verified token until it expires.
+
+        Args:
+            token (str): The verified token.
+            registry (UserRegistry): The user the token was issued to.
+            expires_at (datetime): The expiration time of the token.
+        """
+        ttl = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        if ttl > 0:
+            self._cache.set(self._key(token), registry, ttl=ttl)
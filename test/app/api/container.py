@@ -5,22 +5,57 @@ from datetime import datetime, timezone
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 
+from app.config import settings
+
 # Protocols
 from app.core.news.protocols.news_repository import NewsArticleRepository
 from app.core.users.entities.user import UserRegistry
 from app.core.users.protocols.user_repository import UserRepository
 
 # Implementations
+from app.infraestructure.cache import TTLCache, register_cache
+from app.infraestructure.cache.news_articles_repository import CachedNewsArticleRepository
+from app.infraestructure.cache.news_counts_repository import CachedNewsArticleCountsRepository
+from app.infraestructure.coalescing import (
+    BatchLoadingRepository,
+    SingleFlightRepository,
+    register_batch_loader,
+    register_single_flights,
+)
 from app.infraestructure.database.repositories import (
     news_articles_repository,
     user_repository,
 )
+from app.infraestructure.search.news_articles_repository import InMemorySearchNewsArticleRepository
 from jwt import ExpiredSignatureError
 
 from .auth import decode_access_token
+from .auth.token_cache import TokenCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/auth")
 
+# Methods whose identical concurrent calls share one query
+NEWS_ARTICLE_READS = (
+    "fetch_by_id",
+    "fetch_many_by_ids",
+    "fetch_all_by_category",
+    "fetch_page_by_category",
+    "search",
+    "count_by_category",
+    "estimated_count",
+    "count_per_category",
+)
+USER_READS = ("fetch_by_id", "fetch_many_by_ids", "fetch_by_username", "fetch_user_interests")
+
+token_cache = TokenCache(
+    register_cache(
+        "tokens",
+        # Entries carry the remaining lifetime of their token as TTL
+        TTLCache(max_size=settings.token_cache_max_size, ttl=0),
+    ),
+    signing_key=lambda: (settings.secret_key, settings.algorithm),
+)
+
 
 @dataclass(frozen=True)
 class Dependencies:
@@ -36,9 +71,74 @@ def _build_dependencies() -> Callable[[], Dependencies]:
     Returns:
         Callable[[], Dependencies]: Dependency container
     """
+    news_article_repository = cast(NewsArticleRepository, news_articles_repository)
+    if settings.testing:
+        # mongomock does not implement $text queries
+        news_article_repository = cast(
+            NewsArticleRepository,
+            InMemorySearchNewsArticleRepository(news_article_repository),
+        )
+    users_repository = cast(UserRepository, user_repository)
+    if settings.batch_loading_enabled:
+        # Under the single flights, which share the batches still being loaded
+        batched_news = BatchLoadingRepository(
+            news_article_repository, max_batch_size=settings.batch_loading_max_size
+        )
+        batched_users = BatchLoadingRepository(
+            users_repository, max_batch_size=settings.batch_loading_max_size
+        )
+        register_batch_loader("news_articles.fetch_by_id", batched_news.loader)
+        register_batch_loader("users.fetch_by_id", batched_users.loader)
+        news_article_repository = cast(NewsArticleRepository, batched_news)
+        users_repository = cast(UserRepository, batched_users)
+
+    if settings.single_flight_enabled:
+        # Under the caches, so cache hits do not pay for it
+        coalesced_news = SingleFlightRepository(
+            news_article_repository, name="news_articles", reads=NEWS_ARTICLE_READS
+        )
+        coalesced_users = SingleFlightRepository(
+            users_repository, name="users", reads=USER_READS
+        )
+        register_single_flights(coalesced_news.flights)
+        register_single_flights(coalesced_users.flights)
+        news_article_repository = cast(NewsArticleRepository, coalesced_news)
+        users_repository = cast(UserRepository, coalesced_users)
+
+    if settings.news_cache_enabled:
+        news_article_repository = cast(
+            NewsArticleRepository,
+            CachedNewsArticleRepository(
+                news_article_repository,
+                cache=register_cache(
+                    "news_articles",
+                    TTLCache(
+                        max_size=settings.news_cache_max_size,
+                        ttl=settings.news_cache_ttl_seconds,
+                    ),
+                ),
+                negative_ttl=settings.news_cache_negative_ttl_seconds,
+            ),
+        )
+
+    if settings.news_counts_cache_enabled:
+        news_article_repository = cast(
+            NewsArticleRepository,
+            CachedNewsArticleCountsRepository(
+                news_article_repository,
+                cache=register_cache(
+                    "news_counts",
+                    TTLCache(
+                        max_size=settings.news_counts_cache_max_size,
+                        ttl=settings.news_counts_cache_ttl_seconds,
+                    ),
+                ),
+            ),
+        )
+
     deps = Dependencies(
-        user_repository=cast(UserRepository, user_repository),
-        news_article_repository=cast(NewsArticleRepository, news_articles_repository),
+        user_repository=users_repository,
+        news_article_repository=news_article_repository,
     )
 
     def fn() -> Dependencies:
@@ -52,19 +152,28 @@ async def get_current_user(
 ) -> UserRegistry:
     """Get the current user from the token.
 
+    Tokens already verified are served from `token_cache` until they expire,
+    skipping the signature check.
+
     Args:
         token (str): The JWT token to decode.
 
     Returns:
         UserRegistry: The user registry instance.
     """
+    user = token_cache.get(token)
+    if user is not None:
+        return user
+
     try:
      payload = decode_access_token(token)
     
     except ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired")
-  
-    return UserRegistry(id=payload.sub)
+
+    user = UserRegistry(id=payload.sub)
+    token_cache.set(token, user, expires_at=payload.exp)
+    return user
 
 
 dependencies = _build_dependencies()
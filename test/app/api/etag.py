@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Sequence
+from uuid import UUID
+
+from fastapi import Response
+
+from app.core.news.entities.news_article import NewsArticle
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp_ms(value: datetime) -> int:
+    # MongoDB stores datetimes as UTC milliseconds and returns them naive,
+    # so an entity reads the same before and after a round trip. Integer
+    # math, as a float timestamp can round to another millisecond.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(milliseconds=1)
+
+
+def entity_etag(id: UUID, version: int) -> str:
+    """Strong ETag of an entity, from its ID and version.
+
+    The same value is accepted back in `If-Match` by `parse_entity_etag`.
+
+    Args:
+        id (UUID): The ID of the entity.
+        version (int): The version of the entity, bumped by every update.
+    """
+    return f'"{id.hex}-{version}"'
+
+
+def parse_entity_etag(id: UUID, etag: str) -> int | None:
+    """Version of an entity named by one of its ETags, or a bare version.
+
+    Args:
+        id (UUID): The ID of the entity.
+        etag (str): An ETag made by `entity_etag`, or a version such as `"3"`.
+
+    Returns:
+        int | None: The version, or None if the ETag is of another entity.
+
+    Raises:
+        ValueError: If `etag` is neither an entity ETag nor a version.
+    """
+    value = etag.strip().removeprefix("W/").strip('"')
+    entity, separator, version = value.rpartition("-")
+    if separator and entity != id.hex:
+        return None
+    return int(version)
+
+
+def listing_etag(
+    articles: Sequence[NewsArticle], total: int, params: Iterable[tuple[str, str]]
+) -> str:
+    """Strong ETag of a listing, from the articles it returned.
+
+    Derived from the ID, version and last update time of every article of the
+    page, and from the total count, so computing it needs no other query. Any
+    writer, including the ones outside the repositories, must set `updated_at`
+    when changing an article, or listings including it keep their ETag.
+
+    Args:
+        articles (Sequence[NewsArticle]): The articles of the page, in order.
+        total (int): The total count sent with the page.
+        params (Iterable[tuple[str, str]]): The query parameters selecting the listing.
+    """
+    items = [
+        (article.id.hex, article.version, _timestamp_ms(article.updated_at))
+        for article in articles
+    ]
+    digest = hashlib.sha256(repr((items, total, sorted(params))).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an If-None-Match header matches an ETag.
+
+    Uses the weak comparison required for If-None-Match.
+
+    Args:
+        if_none_match (str | None): The If-None-Match header of the request.
+        etag (str): The current ETag of the resource.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response confirming that the client copy is current."""
+    return Response(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,188 @@
+import asyncio
+import time
+from typing import Iterable, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..infraestructure.cache import get_cache_stats
+from ..infraestructure.coalescing import get_batch_loader_stats, get_single_flight_stats
+from ..infraestructure.database.pool_metrics import CHECKOUT_WAIT_BUCKETS, pool_metrics
+from ..infraestructure.monitoring import metrics_registry, render_family
+
+# Route label of the requests matching no route, so unknown paths add no series
+UNMATCHED_ROUTE = "<unmatched>"
+
+request_duration = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "Latency of the HTTP requests, per route template and status code.",
+    ("method", "route", "status"),
+)
+requests_in_flight = metrics_registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests being served.",
+    ("method",),
+)
+
+
+# Scope of the request served by each task, read by the loop watchdog thread
+_active_requests: dict[asyncio.Task, Scope] = {}
+
+
+def active_route(task: asyncio.Task) -> Optional[str]:
+    """Method and route template of the request a task is serving, if any."""
+    scope = _active_requests.get(task)
+    if scope is None:
+        return None
+    return f"{scope['method']} {getattr(scope.get('route'), 'path', scope['path'])}"
+
+
+class MetricsMiddleware:
+    """Records the latency and status code of every HTTP request.
+
+    Requests are labelled with the template of the route they matched, e.g.
+    `/news/{news_id}`, never with their path. Recording runs on the event
+    loop thread and takes no lock.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # Reported when the application fails before responding
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        task = asyncio.current_task()
+        if task is not None:
+            _active_requests[task] = scope
+        requests_in_flight.inc(method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _active_requests.pop(task, None)  # type: ignore[arg-type]
+            # Set on the scope by the router once a route matched
+            route = scope.get("route")
+            request_duration.observe(
+                time.perf_counter() - start,
+                method,
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code),
+            )
+            requests_in_flight.dec(method)
+
+
+def _cache_families() -> Iterable[str]:
+    stats = get_cache_stats()
+    counters = {
+        "hits": "Lookups that found a live entry.",
+        "misses": "Lookups that found no live entry.",
+        "evictions": "Entries evicted to make room.",
+        "expirations": "Entries dropped once expired.",
+        "invalidations": "Entries dropped by writes.",
+    }
+    for field, documentation in counters.items():
+        yield render_family(
+            f"cache_{field}_total",
+            "counter",
+            documentation,
+            (("", {"cache": name}, getattr(cache, field)) for name, cache in stats.items()),
+        )
+    yield render_family(
+        "cache_entries",
+        "gauge",
+        "Entries held by the cache.",
+        (("", {"cache": name}, cache.size) for name, cache in stats.items()),
+    )
+    yield render_family(
+        "cache_hit_ratio",
+        "gauge",
+        "Share of the lookups that found a live entry.",
+        (("", {"cache": name}, cache.hit_ratio) for name, cache in stats.items()),
+    )
+
+
+def _single_flight_families() -> Iterable[str]:
+    stats = get_single_flight_stats()
+    counters = {
+        "calls": "Repository reads run.",
+        "shared": "Repository reads served by an identical read already in flight.",
+    }
+    for field, documentation in counters.items():
+        yield render_family(
+            f"single_flight_{field}_total",
+            "counter",
+            documentation,
+            (("", {"method": name}, getattr(flight, field)) for name, flight in stats.items()),
+        )
+
+
+def _batch_loader_families() -> Iterable[str]:
+    stats = get_batch_loader_stats()
+    counters = {
+        "loads": "Lookups by ID requested.",
+        "batches": "Queries run for the lookups.",
+        "keys": "Distinct IDs fetched by the queries.",
+    }
+    for field, documentation in counters.items():
+        yield render_family(
+            f"batch_loader_{field}_total",
+            "counter",
+            documentation,
+            (("", {"method": name}, getattr(loader, field)) for name, loader in stats.items()),
+        )
+
+
+def _pool_families() -> Iterable[str]:
+    stats = pool_metrics.stats
+    gauges = {
+        "connections_open": "Connections to the database servers.",
+        "connections_in_use": "Connections checked out of the pool.",
+    }
+    counters = {
+        "connections_created": "Connections opened.",
+        "connections_closed": "Connections closed.",
+        "checkouts": "Connections checked out of the pool.",
+        "checkout_failures": "Checkouts that failed, e.g. on a wait queue timeout.",
+    }
+    for field, documentation in gauges.items():
+        yield render_family(
+            f"mongodb_pool_{field}", "gauge", documentation, [("", {}, getattr(stats, field))]
+        )
+    for field, documentation in counters.items():
+        yield render_family(
+            f"mongodb_pool_{field}_total",
+            "counter",
+            documentation,
+            [("", {}, getattr(stats, field))],
+        )
+    bounds = [*map(str, CHECKOUT_WAIT_BUCKETS), "+Inf"]
+    yield render_family(
+        "mongodb_pool_checkout_wait_seconds",
+        "histogram",
+        "Time spent waiting to check a connection out of the pool.",
+        [
+            *(
+                ("_bucket", {"le": bound}, count)
+                for bound, count in zip(bounds, stats.checkout_wait_buckets)
+            ),
+            ("_sum", {}, stats.checkout_wait_seconds_total),
+            ("_count", {}, stats.checkout_wait_buckets[-1]),
+        ],
+    )
+
+
+metrics_registry.register_collector(_cache_families)
+metrics_registry.register_collector(_single_flight_families)
+metrics_registry.register_collector(_batch_loader_families)
+metrics_registry.register_collector(_pool_families)
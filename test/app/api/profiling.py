@@ -0,0 +1,220 @@
+"""Profiling of single requests, on demand.
+
+A request sending `X-Profile: cpu` (or `memory`, to also trace allocations)
+with the admin secret in `X-Admin-Secret` runs under `cProfile`. Its
+response carries an `X-Profile-Id` header, and the profile is kept in
+memory for `GET /admin/profiles/{id}`. The profile holds:
+- the functions with the highest cumulative time
+- with `memory`, the lines that allocated the most memory still held
+  when the response was sent
+- the MongoDB commands that finished while the request was served
+
+Only the MongoDB commands of the profiled request are kept, through a
+request-scoped context variable. The profilers see the whole worker though:
+functions and allocations of requests served concurrently on the same event
+loop appear in the profile too, so profile on a quiet worker. The profile
+states this in its `scope`.
+One request is profiled at a time; another request asking for a profile
+meanwhile is served unprofiled, with `X-Profile-Id: busy`.
+
+The middleware is only installed when profiling is enabled. Other requests
+then only pay for a scan of their headers.
+"""
+
+import cProfile
+import pstats
+import time
+import tracemalloc
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import settings
+from ..infraestructure.cache import TTLCache, register_cache
+from ..infraestructure.monitoring import command_metrics
+from .admin import ADMIN_SECRET_HEADER, is_admin_secret
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_MODES = ("cpu", "memory")
+
+_PROFILE_HEADER = PROFILE_HEADER.lower().encode()
+_PROFILE_ID_HEADER = PROFILE_ID_HEADER.lower().encode()
+_ADMIN_SECRET_HEADER = ADMIN_SECRET_HEADER.lower().encode()
+
+# What each part of a profile covers
+PROFILE_SCOPE = {
+    "functions": "worker: includes the requests served concurrently",
+    "allocations": "worker: includes the requests served concurrently",
+    "mongo_commands": "request",
+}
+
+# Profile ID of the request being served, seen by the MongoDB command
+# listeners through the context Motor copies into its threads
+_profile_id: ContextVar[Optional[str]] = ContextVar("profile_id", default=None)
+
+profiles: TTLCache[str, dict[str, Any]] = register_cache(
+    "profiles",
+    TTLCache(max_size=settings.profiling_max_stored, ttl=settings.profiling_ttl_seconds),
+)
+
+
+def _top_functions(profiler: cProfile.Profile, limit: int) -> list[dict[str, Any]]:
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    # (file, line, function) -> (primitive calls, calls, own time, cumulative time, callers)
+    entries = sorted(stats.items(), key=lambda entry: entry[1][3], reverse=True)[:limit]
+    return [
+        {
+            "function": f"{file}:{line}({function})",
+            "calls": calls,
+            "own_ms": own * 1000,
+            "cumulative_ms": cumulative * 1000,
+        }
+        for (file, line, function), (_, calls, own, cumulative, _) in entries
+    ]
+
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, limit: int) -> list[dict[str, Any]]:
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    return [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+class ProfilingMiddleware:
+    """Profiles the requests asking for it with the admin secret."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self._profiling = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        mode = self._requested_mode(scope) if scope["type"] == "http" else None
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+        if self._profiling:
+            await self.app(scope, receive, self._with_profile_id(send, "busy"))
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler, e.g. a coverage tool, is active on this thread
+            await self.app(scope, receive, self._with_profile_id(send, "busy"))
+            return
+
+        self._profiling = True
+        try:
+            await self._profile(scope, receive, send, mode, profiler)
+        finally:
+            self._profiling = False
+
+    @staticmethod
+    def _requested_mode(scope: Scope) -> Optional[str]:
+        mode = secret = None
+        for name, value in scope["headers"]:
+            if name == _PROFILE_HEADER:
+                mode = value.decode("latin-1").strip().lower()
+            elif name == _ADMIN_SECRET_HEADER:
+                secret = value.decode("latin-1")
+        if mode not in PROFILE_MODES or not is_admin_secret(secret):
+            return None
+        return mode
+
+    @staticmethod
+    def _with_profile_id(send: Send, profile_id: str) -> Send:
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (_PROFILE_ID_HEADER, profile_id.encode()),
+                ]
+            await send(message)
+
+        return send_with_profile_id
+
+    async def _profile(
+        self, scope: Scope, receive: Receive, send: Send, mode: str, profiler: cProfile.Profile
+    ) -> None:
+        """Serve the request with `profiler` enabled, then store the profile."""
+        profile_id = uuid.uuid4().hex
+        status_code = 500
+        commands: list[dict[str, Any]] = []
+
+        def record_command(
+            collection: str, command: str, duration: float, succeeded: bool
+        ) -> None:
+            if _profile_id.get() != profile_id:
+                # A command of another request
+                return
+            commands.append(
+                {
+                    "collection": collection,
+                    "command": command,
+                    "duration_ms": duration * 1000,
+                    "succeeded": succeeded,
+                }
+            )
+
+        send_with_profile_id = self._with_profile_id(send, profile_id)
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send_with_profile_id(message)
+
+        # Tracing started by someone else, e.g. PYTHONTRACEMALLOC, is left running
+        trace_memory = mode == "memory" and not tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.start()
+        elif mode == "memory":
+            tracemalloc.reset_peak()
+        command_metrics.add_observer(record_command)
+        token = _profile_id.set(profile_id)
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            profiler.disable()
+            _profile_id.reset(token)
+            duration = time.perf_counter() - start
+            command_metrics.remove_observer(record_command)
+            allocations = None
+            if mode == "memory":
+                snapshot = tracemalloc.take_snapshot()
+                allocations = {
+                    "peak_bytes": tracemalloc.get_traced_memory()[1],
+                    "top": _top_allocations(snapshot, settings.profiling_top_entries),
+                }
+            if trace_memory:
+                tracemalloc.stop()
+
+            route = scope.get("route")
+            profiles.set(
+                profile_id,
+                {
+                    "id": profile_id,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "status_code": status_code,
+                    "started_at": started_at.isoformat(),
+                    "duration_ms": duration * 1000,
+                    "scope": PROFILE_SCOPE,
+                    "functions": _top_functions(profiler, settings.profiling_top_entries),
+                    "allocations": allocations,
+                    "mongo_commands": commands,
+                },
+            )
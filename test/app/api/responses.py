@@ -0,0 +1,40 @@
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@cache
+def _type_adapter(content_type: Any) -> TypeAdapter:
+    return TypeAdapter(content_type)
+
+
+def json_response(
+    content: Any, content_type: Any, response: Response | None = None
+) -> Response:
+    """Serialize already validated content straight to a JSON response.
+
+    Returning a `Response` skips FastAPI's response model validation and
+    `jsonable_encoder` pass: the content is dumped to bytes in one go by a
+    cached `TypeAdapter`. Routes keep declaring their `response_model`, so the
+    OpenAPI schema is unchanged.
+
+    Args:
+        content (Any): The content to serialize, already an instance of `content_type`.
+        content_type (Any): The type describing the content, e.g. `list[NewsArticle]`.
+        response (Response | None): The response injected in the route, whose
+            status code and headers are carried over.
+    """
+    status_code, headers = 200, None
+    if response is not None:
+        # FastAPI leaves the status code of the injected response unset
+        status_code = response.status_code or 200
+        headers = dict(response.headers)
+
+    return Response(
+        content=_type_adapter(content_type).dump_json(content),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
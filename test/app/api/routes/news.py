@@ -1,10 +1,26 @@
+import logging
+from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Body, Depends, Header, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.core.news.entities.news_article import NewsArticle, NewsCategory, UpdateNewsArticleDto,CreateNewsArticleDto
+from app.core.news.entities.news_article import (
+    MAX_BATCH_SIZE,
+    BatchGetNewsArticlesDto,
+    BulkDeleteNewsArticlesDto,
+    NewsArticle,
+    NewsArticleBulkCreateResult,
+    NewsArticleSearchHit,
+    NewsCategory,
+    NewsCategoryCount,
+    UpdateNewsArticleDto,
+    CreateNewsArticleDto,
+)
+from app.config import settings
 from app.core.news.services import news_article_service
-from app.core.news.services.exceptions import NewsArticleNotFound
+from app.core.news.services.exceptions import InvalidCursor, NewsArticleNotFound, NewsArticleVersionConflict
 from pydantic import BaseModel
 
 
@@ -13,6 +29,10 @@ from app.core.users.entities.user import UserRegistry
 
 
 from ..container import dependencies, get_current_user
+from ..etag import entity_etag, etag_matches, listing_etag, not_modified, parse_entity_etag
+from ..responses import json_response
+
+logger = logging.getLogger(__name__)
 
 user_repository = dependencies().user_repository
 
@@ -23,15 +43,25 @@ router = APIRouter(
 )
 news_article_repository = dependencies().news_article_repository
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
 
-@router.get("/user-interests")
+def _check_pagination(skip: int, cursor: str | None) -> None:
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="skip cannot be combined with cursor")
+
+
+@router.get("/user-interests", response_model=list[NewsArticle])
 async def get_news_by_user_interests(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor returned in the X-Next-Cursor header"),
     user: UserRegistry = Depends(get_current_user),
-) -> list[NewsArticle]:
+) -> Response:
     """Get news articles based on the user's interests."""
-    logging.info(user)
+    _check_pagination(skip, cursor)
 
     try:
         user_data = await user_service.get_user_by_id(
@@ -44,51 +74,194 @@ async def get_news_by_user_interests(
             raise HTTPException(status_code=404, detail="No interests found for the user.")
 
         # Obtener las noticias basadas en los intereses del usuario
-        news = await news_article_service.get_all_news_articles(
+        page = await news_article_service.get_news_articles_page(
             category=[interest for interest in user_interests],
             news_article_repository=news_article_repository,
             skip=skip,
             limit=limit,
+            cursor=cursor,
+        )
+        if page.next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        response.headers[TOTAL_COUNT_HEADER] = str(
+            await news_article_service.count_news_articles(
+                news_article_repository, category=user_interests
+            )
         )
 
-        return news
+        return json_response(page.items, list[NewsArticle], response)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/{id}")
-async def get_news_by_id(id: UUID) -> NewsArticle:
-    """Get news by id."""
+async def _ndjson_lines(articles: AsyncIterator[NewsArticle], batch_size: int) -> AsyncIterator[bytes]:
+    """Serialize articles as newline-delimited JSON, one chunk per batch."""
+    lines: list[bytes] = []
+    async for article in articles:
+        lines.append(article.model_dump_json().encode() + b"\n")
+        if len(lines) >= batch_size:
+            yield b"".join(lines)
+            lines.clear()
+    if lines:
+        yield b"".join(lines)
+
+
+@router.get("/facets")
+async def get_news_facets() -> list[NewsCategoryCount]:
+    """Get the number of news articles in every non-empty category, largest first."""
+    return await news_article_service.get_category_counts(news_article_repository)
+
+
+@router.get("/search")
+async def search_news(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=255, description="Words to search for in the title and content"),
+    category: NewsCategory | None = Query(None),
+    limit: int = Query(100, ge=1, le=100),
+    cursor: str | None = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+) -> list[NewsArticleSearchHit]:
+    """Search news articles by the words of their title and content.
+
+    Articles containing any of the words are returned, most relevant first,
+    with matches in the title weighing more than matches in the content.
+    """
+    try:
+        page = await news_article_service.search_news_articles(
+            news_article_repository, query=q, limit=limit, cursor=cursor, category=category
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_news(
+    category: NewsCategory | None = Query(None),
+    since: datetime | None = Query(None, description="Only export articles created at or after this time"),
+    batch_size: int = Query(
+        settings.news_export_batch_size, ge=1, le=10_000, description="Articles fetched per round trip"
+    ),
+) -> StreamingResponse:
+    """Export news articles, oldest first, as newline-delimited JSON.
+
+    Articles are streamed while the database cursor is iterated, so memory use
+    does not depend on how many articles are exported.
+    """
+    articles = news_article_service.export_news_articles(
+        news_article_repository, batch_size=batch_size, category=category, since=since
+    )
+    return StreamingResponse(
+        _ndjson_lines(articles, batch_size), media_type="application/x-ndjson"
+    )
+
+
+@router.post("/bulk")
+async def create_news_articles(
+    news_articles: list[CreateNewsArticleDto] = Body(..., min_length=1, max_length=MAX_BATCH_SIZE),
+) -> list[NewsArticleBulkCreateResult]:
+    """Create several news articles in a single write.
+
+    Returns one result per article, in request order, with either the created
+    article or the reason it was rejected.
+    """
+    return await news_article_service.create_news_articles(
+        news_article_repository=news_article_repository,
+        news_articles=news_articles,
+    )
+
+
+@router.post("/batch-get")
+async def get_news_by_ids(dto: BatchGetNewsArticlesDto) -> list[NewsArticle | None]:
+    """Get several news articles by ID, in request order, null for missing ones."""
+    return await news_article_service.get_news_articles_by_ids(
+        news_article_repository=news_article_repository, ids=dto.ids
+    )
+
+
+@router.delete("/bulk")
+async def delete_news_articles(dto: BulkDeleteNewsArticlesDto):
+    """Delete several news articles, either by ID or by category."""
+    deleted_count = await news_article_service.remove_news_articles(
+        news_article_repository=news_article_repository,
+        ids=dto.ids,
+        category=dto.category,
+    )
+    return {"message": "News articles removed successfully", "deleted_count": deleted_count}
+
+
+@router.get("/{id}", responses={304: {"description": "The article did not change"}})
+async def get_news_by_id(
+    id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None, description="ETag of the copy the client already has"),
+) -> NewsArticle:
+    """Get news by id.
+
+    The response carries an `ETag`. Send it back in `If-None-Match` to get an
+    empty 304 response while the article is unchanged.
+    """
     try:
         news = await news_article_service.get_news_article_by_id(
             id=id, news_article_repository=news_article_repository
         )
-        return news
     except NewsArticleNotFound:
         raise HTTPException(status_code=404, detail="News article not found")
 
-import logging
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
+    etag = entity_etag(news.id, news.version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)  # type: ignore[return-value]
+    response.headers["ETag"] = etag
+    return news
 
 
+def _parse_if_match(id: UUID, if_match: str | None) -> int | None:
+    """Return the article version required by an If-Match header, if any."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    try:
+        version = parse_entity_etag(id, if_match)
+    except ValueError:
+        raise HTTPException(
+            status_code=400, detail="If-Match must be an ETag or a version of the article"
+        )
+    if version is None:
+        raise HTTPException(status_code=412, detail="If-Match is the ETag of another article")
+    return version
 
 
 @router.patch("/{id}")
 async def update_news_article(
     id: UUID,
     news_article:UpdateNewsArticleDto,
+    response: Response,
+    if_match: str | None = Header(
+        None, description="Only update the article if it is still at this ETag or version"
+    ),
 ):
-    """Update an existing news article."""
-    logging.info(news_article.model_dump(exclude_unset=True))
+    """Update an existing news article.
+
+    Send the `ETag` returned by `GET /news/{id}`, or the article `version`, in
+    `If-Match` to only update it if nobody else has since; otherwise 412 is
+    returned. The response carries the `ETag` of the updated article.
+    """
+    expected_version = _parse_if_match(id, if_match)
+    logger.debug(
+        "Updating news article %s fields %s", id, news_article.model_fields_set
+    )
     try:    
 
         updated_article = await news_article_service.update_news_article(
-            id=id, news_article=UpdateNewsArticleDto(**news_article.model_dump()), news_article_repository=news_article_repository
+            id=id,
+            news_article=UpdateNewsArticleDto(**news_article.model_dump()),
+            news_article_repository=news_article_repository,
+            expected_version=expected_version,
         )
+        response.headers["ETag"] = entity_etag(updated_article.id, updated_article.version)
         return updated_article
+    except NewsArticleVersionConflict:
+        raise HTTPException(status_code=412, detail="News article was modified by someone else")
     except NewsArticleNotFound:
         raise HTTPException(status_code=404, detail="News article not found")
     except Exception as e:
@@ -110,17 +283,57 @@ async def delete_news_article(id: UUID):
 
 
 
-@router.get("/")
+@router.get(
+    "/",
+    response_model=list[NewsArticle],
+    responses={304: {"description": "The listing did not change"}},
+)
 async def get_news(
+    request: Request,
+    response: Response,
     category: NewsCategory | None = Query(None),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-) -> list[NewsArticle]:
-    """Get all news articles."""
-    news = await news_article_service.get_all_news_articles(
-        news_article_repository, skip=skip, limit=limit, category=category
+    cursor: str | None = Query(None, description="Cursor returned in the X-Next-Cursor header"),
+    exact_count: bool = Query(
+        False, description="Count every article for X-Total-Count instead of estimating the total"
+    ),
+    if_none_match: str | None = Header(None, description="ETag of the copy the client already has"),
+) -> Response:
+    """Get all news articles.
+
+    Pages can be requested either by `skip` offset or by the `cursor` returned
+    in the `X-Next-Cursor` header of the previous page, which keeps deep pages
+    as cheap as the first one.
+
+    The number of matching articles is returned in `X-Total-Count`. Without a
+    category it is estimated, unless `exact_count` is set.
+
+    The response carries an `ETag` that changes when an article of the page or
+    the total changes. Send it back in `If-None-Match` to get an empty 304
+    response while it is current.
+    """
+    _check_pagination(skip, cursor)
+    try:
+        page = await news_article_service.get_news_articles_page(
+            news_article_repository, skip=skip, limit=limit, cursor=cursor, category=category
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    total = await news_article_service.count_news_articles(
+        news_article_repository, category=category, exact=exact_count
     )
-    return news
+    etag = listing_etag(page.items, total, request.query_params.multi_items())
+    if etag_matches(if_none_match, etag):
+        # Saves serializing and sending the page
+        return not_modified(etag)
+
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    response.headers["ETag"] = etag
+    return json_response(page.items, list[NewsArticle], response)
 
 @router.post("/")
 async def create_news_article(
@@ -1,3 +1,4 @@
+import logging
 from typing import Annotated
 from uuid import UUID
 
@@ -5,13 +6,22 @@ from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 from pydantic import SecretStr
 
-from app.core.users.entities.user import UserRegistry, UserInterests
+from app.core.users.entities.user import (
+    ReplaceUserInterestsDto,
+    User,
+    UserInterests,
+    UserInterestsResponse,
+    UserRegistry,
+)
 from app.core.users.services.exceptions import UserNotFound
 
 from app.core.users.services import user_service
 
-from ..auth import Token, create_access_token, verify_password
+from ..auth import PasswordHasherBusy, Token, create_access_token, verify_password
 from ..container import dependencies, get_current_user
+from ..responses import json_response
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/users",
@@ -28,7 +38,7 @@ async def get_user_info(user: UserRegistry = Depends(get_current_user)):
         user_repository=user_repository,
         user=user,
     )
-    return user_data
+    return json_response(user_data, User)
 
 
 @router.post("/auth")
@@ -43,9 +53,27 @@ async def auth_user(form_data: Annotated[OAuth2PasswordRequestForm, Depends()]):
     except UserNotFound:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    if not verify_password(SecretStr(form_data.password), user.password):
+    try:
+        valid, new_hash = await verify_password(SecretStr(form_data.password), user.password)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many authentication requests, try again later",
+            headers={"Retry-After": "1"},
+        )
+
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    # The stored hash uses an outdated bcrypt cost, upgrade it transparently
+    if new_hash:
+        try:
+            await user_service.update_password(
+                user_repository=user_repository, userId=user.id, password=new_hash
+            )
+        except UserNotFound:
+            logger.warning("User %s vanished while its password was rehashed", user.id)
+
     return Token(
         access_token=create_access_token(user_registry=UserRegistry(id=user.id)),
         token_type="bearer",
@@ -64,7 +92,7 @@ async def delete_user(user_id: UUID):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
     
-@router.get("/{user_id}/interests")
+@router.get("/{user_id}/interests", response_model=UserInterestsResponse)
 async def get_user_interests(user_id: UUID):
     """Get the interests of a specific user."""
     try:
@@ -72,12 +100,30 @@ async def get_user_interests(user_id: UUID):
             user_repository=user_repository,
             userId=user_id,
         )
-        return {"message": "User interests retrieved successfully", "interests": user_interests}
+        return json_response(
+            UserInterestsResponse.model_construct(
+                message="User interests retrieved successfully", interests=user_interests
+            ),
+            UserInterestsResponse,
+        )
     except UserNotFound:
         raise HTTPException(status_code=404, detail="User not found")
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e)) 
     
+@router.put("/{user_id}/interests")
+async def replace_user_interests(user_id: UUID, dto: ReplaceUserInterestsDto):
+    """Replace all the interests of a user."""
+    try:
+        updated_user = await user_service.replace_interests(
+            user_repository=user_repository,
+            userID=user_id,
+            interests=dto.interests,
+        )
+        return {"message": "Interests replaced successfully", "user": updated_user}
+    except UserNotFound:
+        raise HTTPException(status_code=404, detail="User not found")
+
 @router.delete("/{user_id}/interests/{interest}")
 async def delete_user_interest(user_id: UUID, interest: UserInterests):
     """Delete a specific interest from a user."""
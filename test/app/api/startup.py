@@ -0,0 +1,42 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Durations of the startup phases of a worker, to track its cold start."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+    @property
+    def total(self) -> float:
+        """Time spent in every phase, in seconds."""
+        return sum(self.phases.values())
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Record the duration of a phase, in seconds."""
+        self.phases[phase] = seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def report(self) -> None:
+        """Log the duration of every phase."""
+        logger.info(
+            "Startup took %.1f ms (%s)",
+            self.total * 1000,
+            ", ".join(f"{phase}: {seconds * 1000:.1f} ms" for phase, seconds in self.phases.items()),
+        )
+
+
+startup_timer = StartupTimer()
@@ -1,9 +1,13 @@
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import Field, MongoDsn
+from pydantic import Field, MongoDsn, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 ALLOWED_ALGORITHMS = Literal["HS256",]
+LOG_LEVELS = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+READ_PREFERENCES = Literal[
+    "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+]
 
 
 class Settings(BaseSettings):
@@ -16,10 +20,87 @@ class Settings(BaseSettings):
     secret_key: str = Field(..., pattern=r"^[a-zA-Z0-9_]{32,}$")
     algorithm: ALLOWED_ALGORITHMS = Field(...)
     access_token_expire_minutes: int = Field(..., gt=0)
+    # Password hashing. Stored hashes with another cost are rehashed on login
+    bcrypt_rounds: int = Field(12, ge=4, le=31)
+    password_hash_max_concurrency: int = Field(4, gt=0)
+    password_hash_queue_timeout_seconds: float = Field(2.0, gt=0)
+    # Verified access tokens kept in memory until they expire
+    token_cache_max_size: int = Field(10_000, gt=0)
     # Database connection string
     database_local_url: MongoDsn = Field(...)
     database_name: str = Field(..., min_length=1)
     testing: bool = Field(False)
+    # Upsert the placeholder user and news articles at startup
+    seed_database: bool = Field(False)
+    # MongoDB client, each worker process has its own connection pool
+    mongo_max_pool_size: int = Field(100, ge=0)
+    # Connections allowed across every worker of `app.server`. When set, it
+    # overrides `mongo_max_pool_size` with this budget split between workers
+    mongo_connection_budget: int | None = Field(None, gt=0)
+    # Connections opened at startup and kept open while idle
+    mongo_min_pool_size: int = Field(0, ge=0)
+    mongo_max_idle_time_ms: int | None = Field(None, gt=0)
+    # Maximum wait for a free connection; unbounded when unset
+    mongo_wait_queue_timeout_ms: int | None = Field(None, gt=0)
+    mongo_server_selection_timeout_ms: int = Field(30_000, gt=0)
+    mongo_compressors: list[Literal["snappy", "zlib", "zstd"]] = Field(default_factory=list)
+    mongo_read_preference: READ_PREFERENCES = Field("primary")
+    # Acknowledgment required for writes; the server default when unset
+    mongo_write_concern: int | Literal["majority"] | None = Field(None)
+    # Commands at least this slow are logged and aggregated per query shape,
+    # see GET /admin/slow-queries
+    slow_query_threshold_ms: float = Field(100.0, ge=0)
+    slow_query_max_shapes: int = Field(1000, gt=0)
+    # Production server (`python -m app.server`)
+    server_host: str = Field("0.0.0.0")
+    server_port: int = Field(3001, gt=0, lt=65536)
+    # Worker processes; the number of CPUs when unset
+    server_workers: int | None = Field(None, gt=0)
+    server_backlog: int = Field(2048, gt=0)
+    server_keep_alive_seconds: int = Field(5, gt=0)
+    # Time given to in-flight requests to finish on shutdown
+    server_graceful_shutdown_seconds: int = Field(30, gt=0)
+    # Requests served at once by a worker before it answers 503
+    server_limit_concurrency: int | None = Field(None, gt=0)
+    server_forwarded_allow_ips: str = Field("127.0.0.1")
+    # In-process cache of single news articles
+    news_cache_enabled: bool = Field(True)
+    news_cache_max_size: int = Field(10_000, gt=0)
+    news_cache_ttl_seconds: float = Field(60.0, gt=0)
+    news_cache_negative_ttl_seconds: float = Field(5.0, ge=0)
+    # In-process cache of the article counts, cleared by every news write
+    news_counts_cache_enabled: bool = Field(True)
+    news_counts_cache_max_size: int = Field(256, gt=0)
+    news_counts_cache_ttl_seconds: float = Field(30.0, gt=0)
+    # Share one query between identical concurrent reads of articles and users
+    single_flight_enabled: bool = Field(True)
+    # Fetch the articles and users looked up by ID at the same time with one query
+    batch_loading_enabled: bool = Field(True)
+    batch_loading_max_size: int = Field(100, gt=0)
+    # Documents fetched per round trip by GET /news/export
+    news_export_batch_size: int = Field(1000, gt=0)
+    # Logging, written by a background thread
+    log_level: LOG_LEVELS = Field("INFO")
+    log_format: Literal["json", "text"] = Field("json")
+    # Levels of single loggers and their children, e.g. {"app.infraestructure.database": "DEBUG"}
+    log_levels: dict[str, LOG_LEVELS] = Field(default_factory=dict)
+    # Share of the records below WARNING kept per logger, e.g. {"uvicorn.access": 0.1}
+    log_sampling: dict[str, Annotated[float, Field(ge=0, le=1)]] = Field(default_factory=dict)
+    # Records waiting for the logging thread; further records are dropped
+    log_queue_size: int = Field(10_000, gt=0)
+    # Measure the event loop lag and log the stack of the code blocking it
+    loop_watchdog_enabled: bool = Field(False)
+    loop_watchdog_threshold_seconds: float = Field(0.1, gt=0)
+    loop_watchdog_interval_seconds: float = Field(0.05, gt=0)
+    # Secret of the X-Admin-Secret header of the admin endpoints, which are
+    # disabled when it is unset
+    admin_secret: SecretStr | None = Field(None, min_length=16)
+    # Profile the requests sending X-Profile with the admin secret
+    profiling_enabled: bool = Field(False)
+    profiling_top_entries: int = Field(30, gt=0)
+    # Profiles kept in memory for GET /admin/profiles/{id}
+    profiling_max_stored: int = Field(20, gt=0)
+    profiling_ttl_seconds: float = Field(3600.0, gt=0)
 
 
 settings = Settings()  # type: ignore[call-arg]
@@ -2,7 +2,10 @@ from datetime import datetime, timezone
 from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+# Maximum number of articles handled by a single batch operation
+MAX_BATCH_SIZE = 1000
 
 NewsCategory = Literal[
     "sports",
@@ -28,6 +31,45 @@ class NewsArticle(BaseModel):
     categories: List[NewsCategory] = Field(..., max_length=50)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = Field(0, description="Incremented on every update, send it as If-Match")
+
+
+class NewsArticleCursor(BaseModel):
+    """Position of an article in the `(created_at, id)` listing order."""
+
+    created_at: datetime
+    id: UUID
+
+
+class NewsArticlePage(BaseModel):
+    items: List[NewsArticle] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, if there is one"
+    )
+
+
+class NewsArticleSearchCursor(BaseModel):
+    """Position of a search hit in the `(score, id)` ranking order."""
+
+    score: float
+    id: UUID
+
+
+class NewsArticleSearchHit(BaseModel):
+    article: NewsArticle
+    score: float = Field(..., description="Relevance of the article to the search")
+
+
+class NewsArticleSearchPage(BaseModel):
+    items: List[NewsArticleSearchHit] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor for the next page, if there is one"
+    )
+
+
+class NewsCategoryCount(BaseModel):
+    category: NewsCategory
+    count: int = Field(..., description="Number of news articles in the category")
 
 
 class CreateNewsArticleDto(BaseModel):
@@ -40,3 +82,24 @@ class CreateNewsArticleDto(BaseModel):
 class UpdateNewsArticleDto(BaseModel):
     title: str = Field(..., max_length=255)
     content: str = Field(..., max_length=5000)
+
+
+class NewsArticleBulkCreateResult(BaseModel):
+    index: int = Field(..., description="Position of the article in the request")
+    article: Optional[NewsArticle] = Field(None, description="The created article")
+    error: Optional[str] = Field(None, description="Why the article was not created")
+
+
+class BatchGetNewsArticlesDto(BaseModel):
+    ids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BulkDeleteNewsArticlesDto(BaseModel):
+    ids: Optional[List[UUID]] = Field(None, min_length=1, max_length=MAX_BATCH_SIZE)
+    category: Optional[NewsCategory] = None
+
+    @model_validator(mode="after")
+    def check_one_selector(self) -> "BulkDeleteNewsArticlesDto":
+        if (self.ids is None) == (self.category is None):
+            raise ValueError("Exactly one of ids or category must be given")
+        return self
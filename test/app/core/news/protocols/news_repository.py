@@ -1,5 +1,6 @@
-from ..entities.news_article import CreateNewsArticleDto, NewsArticle, NewsCategory, UpdateNewsArticleDto
-from typing import List, Optional, Protocol
+from ..entities.news_article import CreateNewsArticleDto, NewsArticle, NewsArticleBulkCreateResult, NewsArticleCursor, NewsArticleSearchCursor, NewsArticleSearchHit, NewsCategory, NewsCategoryCount, UpdateNewsArticleDto
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Protocol
 
 from uuid import UUID
 
@@ -18,6 +19,22 @@ class NewsArticleRepository(Protocol):
         """
         ...
 
+    async def create_many(
+        self, dtos: List[CreateNewsArticleDto]
+    ) -> List[NewsArticleBulkCreateResult]:
+        """Create news articles in a single write.
+
+        Articles that cannot be created are reported in their result and do not
+        prevent the others from being created.
+
+        Args:
+            dtos (List[CreateNewsArticleDto]): The articles to create.
+
+        Returns:
+            List[NewsArticleBulkCreateResult]: One result per article, in input order.
+        """
+        ...
+
     async def fetch_by_id(self, id: UUID) -> Optional[NewsArticle]:
         """Fetch a news article by ID from the database.
 
@@ -26,33 +43,139 @@ class NewsArticleRepository(Protocol):
         """
         ...
 
+    async def fetch_many_by_ids(self, ids: List[UUID]) -> List[Optional[NewsArticle]]:
+        """Fetch news articles by ID in a single query.
+
+        Args:
+            ids (List[UUID]): The IDs of the news articles to retrieve.
+
+        Returns:
+            List[Optional[NewsArticle]]: The articles in the order of `ids`, None for missing ones.
+        """
+        ...
+
     async def fetch_all_by_category(
         self, category: str | List[str] | None, limit: int, skip: int
     ) -> List[NewsArticle]:
         """Fetch news articles by category from the database.
 
+        Articles are returned newest first, ordered by `(created_at, id)`.
+
         Args:
             category (NewsCategory): The category of the news article to retrieve.
             limit (int): The maximum number of news articles to retrieve.
             skip (int): The number of news articles to skip.
         """
         ...
+
+    async def fetch_page_by_category(
+        self,
+        category: str | List[str] | None,
+        limit: int,
+        after: Optional[NewsArticleCursor],
+    ) -> List[NewsArticle]:
+        """Fetch the news articles that follow a position in the listing order.
+
+        Uses the same ordering as `fetch_all_by_category`, but seeks directly
+        to `after` instead of skipping over the previous articles.
+
+        Args:
+            category (NewsCategory): The category of the news article to retrieve.
+            limit (int): The maximum number of news articles to retrieve.
+            after (NewsArticleCursor): The position of the last article already seen.
+        """
+        ...
+
+    async def search(
+        self,
+        query: str,
+        category: str | List[str] | None,
+        limit: int,
+        after: Optional[NewsArticleSearchCursor],
+    ) -> List[NewsArticleSearchHit]:
+        """Search news articles by the words of their title and content.
+
+        Articles containing any word of the query match, and are returned by
+        decreasing relevance, ordered by `(score, id)`.
+
+        Args:
+            query (str): The words to search for.
+            category (NewsCategory): The category of the news articles to retrieve.
+            limit (int): The maximum number of news articles to retrieve.
+            after (Optional[NewsArticleSearchCursor]): The position of the last hit already seen.
+        """
+        ...
+
+    async def count_by_category(self, category: str | List[str] | None) -> int:
+        """Count the news articles in a category, exactly.
+
+        Args:
+            category (NewsCategory): The category or categories to count, None for every article.
+        """
+        ...
+
+    async def estimated_count(self) -> int:
+        """Estimate the total number of news articles from the collection metadata."""
+        ...
+
+    async def count_per_category(self) -> List[NewsCategoryCount]:
+        """Count the news articles of every category in a single query.
+
+        Returns:
+            List[NewsCategoryCount]: The non-empty categories, largest first.
+        """
+        ...
+
+    def iter_by_category(
+        self,
+        category: str | List[str] | None,
+        since: Optional[datetime],
+        batch_size: int,
+    ) -> AsyncIterator[NewsArticle]:
+        """Iterate over news articles, oldest first, without loading them all in memory.
+
+        Args:
+            category (NewsCategory): The category of the news articles to retrieve.
+            since (Optional[datetime]): Only include articles created at or after this time.
+            batch_size (int): The number of news articles fetched per round trip.
+        """
+        ...
+
     async def update(
-        self, id: UUID, dto: UpdateNewsArticleDto
+        self, id: UUID, dto: UpdateNewsArticleDto, expected_version: Optional[int] = None
     ) -> Optional[NewsArticle]:
-        """Update an existing news article in the database.
+        """Atomically update an existing news article in the database and bump its version.
 
         Args:
             id (UUID): The ID of the news article to update.
             dto (UpdateNewsArticleDto): The data transfer object containing updated news article details.
+            expected_version (Optional[int]): Only update the article if it is at this version.
+
+        Returns:
+            Optional[NewsArticle]: The updated article, or None if no article with
+                this ID (and version, if given) exists.
         """
         ...
     async def remove(
         self, id: UUID,
     ) -> Optional[NewsArticle]:
-        """Remove an existing news article in the database.
+        """Atomically remove an existing news article in the database.
 
         Args:
             id (UUID): The ID of the news article to update.
         """
-        ...
\ No newline at end of file
+        ...
+
+    async def remove_many(
+        self, ids: Optional[List[UUID]] = None, category: Optional[str] = None
+    ) -> int:
+        """Remove news articles by ID or by category in a single write.
+
+        Args:
+            ids (Optional[List[UUID]]): The IDs of the news articles to remove.
+            category (Optional[str]): Remove every news article in this category.
+
+        Returns:
+            int: The number of removed news articles.
+        """
+        ...
@@ -0,0 +1,69 @@
+import base64
+import binascii
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from ..entities.news_article import (
+    NewsArticle,
+    NewsArticleCursor,
+    NewsArticleSearchCursor,
+    NewsArticleSearchHit,
+)
+from .exceptions import InvalidCursor
+
+C = TypeVar("C", bound=BaseModel)
+
+
+def _encode(position: BaseModel) -> str:
+    return base64.urlsafe_b64encode(position.model_dump_json().encode()).decode()
+
+
+def _decode(cursor: str, position_type: type[C]) -> C:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode())
+        return position_type.model_validate_json(raw)
+    except (binascii.Error, ValueError, ValidationError):
+        raise InvalidCursor(cursor)
+
+
+def encode_cursor(article: NewsArticle) -> str:
+    """Encode the position of an article as an opaque cursor.
+
+    Args:
+        article (NewsArticle): The last article of the current page.
+
+    Returns:
+        str: URL-safe cursor pointing right after the article.
+    """
+    return _encode(NewsArticleCursor(created_at=article.created_at, id=article.id))
+
+
+def decode_cursor(cursor: str) -> NewsArticleCursor:
+    """Decode an opaque cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor received from the client.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    return _decode(cursor, NewsArticleCursor)
+
+
+def encode_search_cursor(hit: NewsArticleSearchHit) -> str:
+    """Encode the position of a search hit as an opaque cursor.
+
+    Args:
+        hit (NewsArticleSearchHit): The last hit of the current page.
+    """
+    return _encode(NewsArticleSearchCursor(score=hit.score, id=hit.article.id))
+
+
+def decode_search_cursor(cursor: str) -> NewsArticleSearchCursor:
+    """Decode an opaque cursor produced by `encode_search_cursor`.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    return _decode(cursor, NewsArticleSearchCursor)
@@ -7,3 +7,22 @@ class NewsArticleNotFound(Exception):
     def __init__(self, article_id: UUID | None):
         self.article_id = article_id
         super().__init__(f"News article with ID {article_id} not found.")
+
+
+class InvalidCursor(Exception):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str):
+        self.cursor = cursor
+        super().__init__(f"Invalid pagination cursor '{cursor}'.")
+
+
+class NewsArticleVersionConflict(Exception):
+    """Exception raised when a news article is not at the expected version."""
+
+    def __init__(self, article_id: UUID, expected_version: int):
+        self.article_id = article_id
+        self.expected_version = expected_version
+        super().__init__(
+            f"News article with ID {article_id} is not at version {expected_version}."
+        )
@@ -1,10 +1,12 @@
-from typing import List
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
 
-from ..entities.news_article import CreateNewsArticleDto, NewsArticle, NewsCategory, UpdateNewsArticleDto
+from ..entities.news_article import CreateNewsArticleDto, NewsArticle, NewsArticleBulkCreateResult, NewsArticlePage, NewsArticleSearchPage, NewsCategory, NewsCategoryCount, UpdateNewsArticleDto
 from ..protocols.news_repository import NewsArticleRepository
-from .exceptions import NewsArticleNotFound
+from .cursor import decode_cursor, decode_search_cursor, encode_cursor, encode_search_cursor
+from .exceptions import NewsArticleNotFound, NewsArticleVersionConflict
 
 
 async def get_news_article_by_id(
@@ -29,16 +31,121 @@ async def get_all_news_articles(
         category=category, limit=limit, skip=skip
     )
 
+
+async def get_news_articles_page(
+    news_article_repository: NewsArticleRepository,
+    limit: int = 100,
+    skip: int = 0,
+    cursor: Optional[str] = None,
+    category: str | List[str] | None = None,
+) -> NewsArticlePage:
+    """Fetch a page of news articles, newest first.
+
+    With a `cursor` the page starts right after the position it encodes, so its
+    cost does not depend on how deep the page is. Without one the legacy
+    `skip` offset is used. Both modes share the same ordering, so the returned
+    `next_cursor` can be used to continue from either of them.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    # Fetch one extra article to know whether there is a next page
+    if cursor:
+        articles = await news_article_repository.fetch_page_by_category(
+            category=category, limit=limit + 1, after=decode_cursor(cursor)
+        )
+    else:
+        articles = await news_article_repository.fetch_all_by_category(
+            category=category, limit=limit + 1, skip=skip
+        )
+
+    if len(articles) <= limit:
+        return NewsArticlePage(items=articles)
+
+    articles = articles[:limit]
+    return NewsArticlePage(items=articles, next_cursor=encode_cursor(articles[-1]))
+
+
+async def count_news_articles(
+    news_article_repository: NewsArticleRepository,
+    category: str | List[str] | None = None,
+    exact: bool = False,
+) -> int:
+    """Count news articles, in a category or overall.
+
+    Unless `exact` is set, the overall total is estimated from the collection
+    metadata instead of counting the articles.
+    """
+    if category is None and not exact:
+        return await news_article_repository.estimated_count()
+    return await news_article_repository.count_by_category(category=category)
+
+
+async def get_category_counts(
+    news_article_repository: NewsArticleRepository,
+) -> List[NewsCategoryCount]:
+    """Count the news articles of every non-empty category, largest first."""
+    return await news_article_repository.count_per_category()
+
+
+async def search_news_articles(
+    news_article_repository: NewsArticleRepository,
+    query: str,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    category: str | List[str] | None = None,
+) -> NewsArticleSearchPage:
+    """Search news articles by title and content, most relevant first.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    # Fetch one extra hit to know whether there is a next page
+    hits = await news_article_repository.search(
+        query=query,
+        category=category,
+        limit=limit + 1,
+        after=decode_search_cursor(cursor) if cursor else None,
+    )
+
+    if len(hits) <= limit:
+        return NewsArticleSearchPage(items=hits)
+
+    hits = hits[:limit]
+    return NewsArticleSearchPage(items=hits, next_cursor=encode_search_cursor(hits[-1]))
+
+def export_news_articles(
+    news_article_repository: NewsArticleRepository,
+    batch_size: int,
+    category: str | List[str] | None = None,
+    since: Optional[datetime] = None,
+) -> AsyncIterator[NewsArticle]:
+    """Stream news articles, oldest first, without loading them all in memory."""
+    return news_article_repository.iter_by_category(
+        category=category, since=since, batch_size=batch_size
+    )
+
 async def update_news_article(
     news_article_repository: NewsArticleRepository,
     id:UUID ,
-    news_article: UpdateNewsArticleDto
+    news_article: UpdateNewsArticleDto,
+    expected_version: Optional[int] = None,
 ) -> NewsArticle:
+   """Update a news article, optionally only if it is at `expected_version`.
+
+   Raises:
+       NewsArticleNotFound: If the news article does not exist.
+       NewsArticleVersionConflict: If `expected_version` is given and the news
+           article is missing or at another version. The two cases are not told
+           apart, to keep the update to a single round trip.
+   """
 
    news_article_updated= await news_article_repository.update(
-        dto=news_article,id=id
+        dto=news_article,id=id, expected_version=expected_version
     )
    if not news_article_updated:
+        if expected_version is not None:
+            raise NewsArticleVersionConflict(article_id=id, expected_version=expected_version)
         raise NewsArticleNotFound(article_id=id)
    return news_article_updated
 
@@ -61,4 +168,33 @@ async def create_news_article(
     """Create a new news article."""
    
     created_article = await news_article_repository.create(dto=news_article)
-    return created_article
\ No newline at end of file
+    return created_article
+
+
+async def create_news_articles(
+    news_article_repository: NewsArticleRepository,
+    news_articles: List[CreateNewsArticleDto],
+) -> List[NewsArticleBulkCreateResult]:
+    """Create several news articles at once, reporting the outcome of each."""
+    return await news_article_repository.create_many(dtos=news_articles)
+
+
+async def get_news_articles_by_ids(
+    news_article_repository: NewsArticleRepository,
+    ids: List[UUID],
+) -> List[Optional[NewsArticle]]:
+    """Fetch several news articles by ID, in the requested order, None for missing ones."""
+    return await news_article_repository.fetch_many_by_ids(ids=ids)
+
+
+async def remove_news_articles(
+    news_article_repository: NewsArticleRepository,
+    ids: Optional[List[UUID]] = None,
+    category: Optional[NewsCategory] = None,
+) -> int:
+    """Remove several news articles by ID or by category.
+
+    Returns:
+        int: The number of removed news articles.
+    """
+    return await news_article_repository.remove_many(ids=ids, category=category)
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Literal, get_args
 from uuid import UUID
 
 from pydantic import BaseModel, Field, SecretStr, model_validator
@@ -23,6 +23,24 @@ class User(BaseModel):
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+class UserInterestsUpdate(BaseModel):
+    """Outcome of adding or removing a single interest."""
+
+    user: User = Field(..., description="The user after the update")
+    modified: bool = Field(..., description="Whether the update changed the interests")
+
+
+class UserInterestsResponse(BaseModel):
+    """Interests of a user, as returned by the API."""
+
+    message: str
+    interests: list[UserInterests]
+
+
+class ReplaceUserInterestsDto(BaseModel):
+    interests: list[UserInterests] = Field(..., max_length=len(get_args(UserInterests)))
+
+
 class CreateUserDto(BaseModel):
     name: str = Field(..., max_length=255)
     email: EmailStr = Field(..., max_length=255)
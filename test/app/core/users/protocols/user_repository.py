@@ -1,8 +1,10 @@
 from typing import List, Protocol, Optional
 from uuid import UUID
 
+from pydantic import SecretStr
 
-from ..entities.user import User, CreateUserDto, UserInterests
+
+from ..entities.user import User, CreateUserDto, UserInterests, UserInterestsUpdate
 
 
 class UserRepository(Protocol):
@@ -24,6 +26,17 @@ class UserRepository(Protocol):
             id (UUID): The ID of the user to retrieve.
         """
         ...
+
+    async def fetch_many_by_ids(self, ids: List[UUID]) -> List[Optional[User]]:
+        """Fetch users by ID in a single query.
+
+        Args:
+            ids (List[UUID]): The IDs of the users to retrieve.
+
+        Returns:
+            List[Optional[User]]: The users in the order of `ids`, None for missing ones.
+        """
+        ...
     
     async def fetch_by_username(self, username: str) -> Optional[User]:
         """Fetch an active user by username from the database.
@@ -33,6 +46,18 @@ class UserRepository(Protocol):
         """
         ...
 
+    async def update_password(self, id: UUID, password: SecretStr) -> bool:
+        """Replace the stored password hash of a user.
+
+        Args:
+            id (UUID): The ID of the user to update.
+            password (SecretStr): The new password hash.
+
+        Returns:
+            bool: Whether the user exists.
+        """
+        ...
+
     async def remove(self, id: UUID) -> User:
         """Make the user inactive in the database.
 
@@ -45,9 +70,43 @@ class UserRepository(Protocol):
     
         ...
 
-    async def remove_user_interest(self, user_id: UUID, interest: UserInterests) -> Optional[User]:
+    async def remove_user_interest(
+        self, user_id: UUID, interest: UserInterests
+    ) -> Optional[UserInterestsUpdate]:
+        """Atomically remove an interest from a user.
 
+        Args:
+            user_id (UUID): The ID of the user to update.
+            interest (UserInterests): The interest to remove.
+
+        Returns:
+            Optional[UserInterestsUpdate]: The updated user and whether the interest
+                was present, or None if the user does not exist.
+        """
+        ...
+
+    async def add_user_interest(
+        self, user_id: UUID, interest: UserInterests
+    ) -> Optional[UserInterestsUpdate]:
+        """Atomically add an interest to a user.
+
+        Args:
+            user_id (UUID): The ID of the user to update.
+            interest (UserInterests): The interest to add.
+
+        Returns:
+            Optional[UserInterestsUpdate]: The updated user and whether the interest
+                was missing, or None if the user does not exist.
+        """
         ...
 
-    async def add_user_interest(self, user_id: UUID, interest: UserInterests) -> Optional[User]:
+    async def replace_user_interests(
+        self, user_id: UUID, interests: List[UserInterests]
+    ) -> Optional[User]:
+        """Replace all the interests of a user in a single write.
+
+        Args:
+            user_id (UUID): The ID of the user to update.
+            interests (List[UserInterests]): The new interests, without duplicates.
+        """
         ...
\ No newline at end of file
@@ -1,10 +1,15 @@
+import logging
 from typing import List, Optional
 from uuid import UUID
 
+from pydantic import SecretStr
+
 from ..entities.user import CreateUserDto, User, UserInterests, UserRegistry
 from ..protocols.user_repository import UserRepository
 from .exceptions import UserAlreadyExists, UserInterestAlreadyExists, UserInterestNotFound, UserNotFound
 
+logger = logging.getLogger(__name__)
+
 
 async def create_user(
     user_repository: UserRepository,
@@ -55,6 +60,25 @@ async def get_user_by_username(
     return fetched_user
 
 
+async def update_password(
+    user_repository: UserRepository,
+    userId: UUID,
+    password: SecretStr,
+) -> None:
+    """Replace the stored password hash of a user.
+
+    Args:
+        user_repository (UserRepository): The user repository instance.
+        userId (UUID): The ID of the user to update.
+        password (SecretStr): The new password hash.
+
+    Raises:
+        UserNotFound: If the user with the given ID does not exist.
+    """
+    if not await user_repository.update_password(userId, password):
+        raise UserNotFound(userId)
+
+
 async def get_user_by_id(
     user_repository: UserRepository,
     user: UserRegistry,
@@ -94,27 +118,16 @@ async def add_interest(
     Returns:
         User: The updated user after adding the interest.
     """
-    user = await user_repository.fetch_by_id(userID)
-    if not user:
+    result = await user_repository.add_user_interest(userID, interest)
+    if not result:
         raise UserNotFound(userID)
 
-    if interest in user.interests:
+    if not result.modified:
         raise UserInterestAlreadyExists(interest)
 
-    updated_user = await user_repository.add_user_interest(userID, interest)
+    logger.info("Interest %s added to user %s", interest, userID)
 
-    logging.info(f"Interest '{interest}' added to user with ID {userID}")
-
-    return updated_user
-
-
-import logging
-
-# Configuración básica del logging
-logging.basicConfig(
-    level=logging.INFO,  # Nivel de logging
-    format="%(asctime)s - %(levelname)s - %(message)s",  # Formato del mensaje
-)
+    return result.user
 
 
 async def remove_interest(
@@ -136,16 +149,42 @@ async def remove_interest(
     Returns:
         User: The updated user after removing the interest.
     """
-    user = await user_repository.fetch_by_id(userID)
-    if not user:
+    result = await user_repository.remove_user_interest(userID, interest)
+    if not result:
         raise UserNotFound(userID)
 
-    if interest not in user.interests:
+    if not result.modified:
         raise UserInterestNotFound(interest)
 
-    updated_user = await user_repository.remove_user_interest(userID, interest)
+    logger.info("Interest %s removed from user %s", interest, userID)
+
+    return result.user
+
+
+async def replace_interests(
+    user_repository: UserRepository,
+    userID: UUID,
+    interests: List[UserInterests],
+) -> User:
+    """Replace all the interests of a user.
+
+    Args:
+        user_repository (UserRepository): The user repository instance.
+        userID (UUID): The ID of the user whose interests will be replaced.
+        interests (List[UserInterests]): The new interests. Duplicates are dropped.
+
+    Raises:
+        UserNotFound: If the user with the given ID does not exist.
+
+    Returns:
+        User: The updated user.
+    """
+    updated_user = await user_repository.replace_user_interests(
+        userID, list(dict.fromkeys(interests))
+    )
+    if not updated_user:
+        raise UserNotFound(userID)
 
- 
     return updated_user
 
 async def get_user_interests(
@@ -0,0 +1,22 @@
+from .ttl_cache import MISSING, CacheStats, TTLCache
+
+_caches: dict[str, TTLCache] = {}
+
+
+def register_cache(name: str, cache: TTLCache) -> TTLCache:
+    """Register a cache so its counters are reported for monitoring.
+
+    Args:
+        name (str): The name the cache is reported under.
+        cache (TTLCache): The cache to register.
+    """
+    _caches[name] = cache
+    return cache
+
+
+def get_cache_stats() -> dict[str, CacheStats]:
+    """Return a snapshot of the counters of every registered cache."""
+    return {name: cache.stats for name, cache in _caches.items()}
+
+
+__all__ = ["MISSING", "CacheStats", "TTLCache", "get_cache_stats", "register_cache"]
@@ -0,0 +1,108 @@
+from typing import Any, List, Optional
+from uuid import UUID
+
+from app.core.news.entities.news_article import (
+    CreateNewsArticleDto,
+    NewsArticle,
+    UpdateNewsArticleDto,
+)
+from app.core.news.protocols.news_repository import NewsArticleRepository
+
+from .ttl_cache import MISSING, TTLCache
+
+
+class CachedNewsArticleRepository:
+    """Read-through cache of single articles in front of a news article repository.
+
+    `fetch_by_id` results are cached, including misses for a shorter time so
+    repeated lookups of missing ids do not reach the database. Writes going
+    through this repository invalidate the affected entries, including the
+    reads of these entries in flight, which are then not cached. Other methods
+    are delegated to the wrapped repository unchanged.
+
+    The cache is per process: writes made by other workers become visible once
+    the cached entries expire.
+    """
+
+    def __init__(
+        self,
+        repository: NewsArticleRepository,
+        cache: TTLCache[UUID, Optional[NewsArticle]],
+        negative_ttl: float,
+    ):
+        """
+        Args:
+            repository (NewsArticleRepository): The repository to wrap.
+            cache (TTLCache): The cache holding the articles by ID.
+            negative_ttl (float): Time to live of a cached miss, in seconds.
+        """
+        self._repository = repository
+        self._cache = cache
+        self._negative_ttl = negative_ttl
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    async def create(self, dto: CreateNewsArticleDto) -> NewsArticle:
+        news_article = await self._repository.create(dto)
+        self._cache.set(news_article.id, news_article)
+        return news_article
+
+    async def fetch_by_id(self, id: UUID) -> Optional[NewsArticle]:
+        cached = self._cache.get(id)
+        if cached is not MISSING:
+            return cached
+
+        epoch = self._cache.epoch()
+        news_article = await self._repository.fetch_by_id(id)
+        if news_article is None:
+            self._cache.set(id, None, ttl=self._negative_ttl, epoch=epoch)
+        else:
+            self._cache.set(id, news_article, epoch=epoch)
+        return news_article
+
+    async def fetch_many_by_ids(self, ids: List[UUID]) -> List[Optional[NewsArticle]]:
+        cached = {id: self._cache.get(id) for id in dict.fromkeys(ids)}
+        missing = [id for id, article in cached.items() if article is MISSING]
+        if missing:
+            epoch = self._cache.epoch()
+            for id, news_article in zip(
+                missing, await self._repository.fetch_many_by_ids(ids=missing)
+            ):
+                if news_article is None:
+                    self._cache.set(id, None, ttl=self._negative_ttl, epoch=epoch)
+                else:
+                    self._cache.set(id, news_article, epoch=epoch)
+                cached[id] = news_article
+        return [cached[id] for id in ids]
+
+    async def update(
+        self, id: UUID, dto: UpdateNewsArticleDto, expected_version: Optional[int] = None
+    ) -> Optional[NewsArticle]:
+        # Invalidate once the write is done: a read that started earlier may
+        # have returned the previous version, and is then not cached either
+        try:
+            return await self._repository.update(
+                id=id, dto=dto, expected_version=expected_version
+            )
+        finally:
+            self._cache.invalidate(id)
+
+    async def remove(self, id: UUID) -> Optional[NewsArticle]:
+        try:
+            return await self._repository.remove(id=id)
+        finally:
+            self._cache.invalidate(id)
+
+    async def remove_many(
+        self, ids: Optional[List[UUID]] = None, category: Optional[str] = None
+    ) -> int:
+        try:
+            return await self._repository.remove_many(ids=ids, category=category)
+        finally:
+            if ids is not None:
+                for id in ids:
+                    self._cache.invalidate(id)
+            else:
+                # The removed ids are unknown
+                self._cache.clear()
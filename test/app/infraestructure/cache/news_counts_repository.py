@@ -0,0 +1,104 @@
+from typing import Any, Hashable, List, Optional
+from uuid import UUID
+
+from app.core.news.entities.news_article import (
+    CreateNewsArticleDto,
+    NewsArticle,
+    NewsArticleBulkCreateResult,
+    NewsCategoryCount,
+    UpdateNewsArticleDto,
+)
+from app.core.news.protocols.news_repository import NewsArticleRepository
+
+from .ttl_cache import MISSING, TTLCache
+
+
+class CachedNewsArticleCountsRepository:
+    """Cache of the article counts in front of a news article repository.
+
+    `count_by_category`, `estimated_count` and `count_per_category` results are
+    cached, and every write going through this repository clears them, since
+    any write may change any count. Counts being computed meanwhile are not
+    cached. Other methods are delegated to the wrapped repository unchanged.
+
+    The cache is per process: writes made by other workers become visible once
+    the cached counts expire.
+    """
+
+    def __init__(self, repository: NewsArticleRepository, cache: TTLCache[Hashable, Any]):
+        """
+        Args:
+            repository (NewsArticleRepository): The repository to wrap.
+            cache (TTLCache): The cache holding the counts.
+        """
+        self._repository = repository
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    async def count_by_category(self, category: str | List[str] | None) -> int:
+        key = ("count", tuple(sorted(category)) if isinstance(category, list) else category)
+        count = self._cache.get(key)
+        if count is MISSING:
+            epoch = self._cache.epoch()
+            count = await self._repository.count_by_category(category=category)
+            self._cache.set(key, count, epoch=epoch)
+        return count
+
+    async def estimated_count(self) -> int:
+        count = self._cache.get("estimated_count")
+        if count is MISSING:
+            epoch = self._cache.epoch()
+            count = await self._repository.estimated_count()
+            self._cache.set("estimated_count", count, epoch=epoch)
+        return count
+
+    async def count_per_category(self) -> List[NewsCategoryCount]:
+        counts = self._cache.get("count_per_category")
+        if counts is MISSING:
+            epoch = self._cache.epoch()
+            counts = await self._repository.count_per_category()
+            self._cache.set("count_per_category", counts, epoch=epoch)
+        return counts
+
+    # Counts are cleared once the write is done, which also keeps the counts
+    # computed meanwhile, possibly before the write, out of the cache
+
+    async def create(self, dto: CreateNewsArticleDto) -> NewsArticle:
+        try:
+            return await self._repository.create(dto)
+        finally:
+            self._cache.clear()
+
+    async def create_many(
+        self, dtos: List[CreateNewsArticleDto]
+    ) -> List[NewsArticleBulkCreateResult]:
+        try:
+            return await self._repository.create_many(dtos)
+        finally:
+            self._cache.clear()
+
+    async def update(
+        self, id: UUID, dto: UpdateNewsArticleDto, expected_version: Optional[int] = None
+    ) -> Optional[NewsArticle]:
+        try:
+            return await self._repository.update(
+                id=id, dto=dto, expected_version=expected_version
+            )
+        finally:
+            self._cache.clear()
+
+    async def remove(self, id: UUID) -> Optional[NewsArticle]:
+        try:
+            return await self._repository.remove(id=id)
+        finally:
+            self._cache.clear()
+
+    async def remove_many(
+        self, ids: Optional[List[UUID]] = None, category: Optional[str] = None
+    ) -> int:
+        try:
+            return await self._repository.remove_many(ids=ids, category=category)
+        finally:
+            self._cache.clear()
@@ -0,0 +1,145 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+"""Returned by `TTLCache.get` when there is no live entry for a key."""
+
+
+@dataclass
+class CacheStats:
+    """Counters of a cache, for monitoring."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+    max_size: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process cache with per-entry expiration and LRU eviction.
+
+    A value read from the source while a write invalidates its key must not
+    be stored afterwards. Readers take an `epoch()` before reading and pass
+    it to `set`, which skips the value if the key was invalidated or the
+    cache cleared since. The invalidations of at most `max_size` keys are
+    remembered; reads older than a forgotten one are skipped too.
+
+    Meant to be used from a single event loop, so it does no locking.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_size (int): Maximum number of entries before the least recently used is evicted.
+            ttl (float): Default time to live of an entry, in seconds.
+            clock (Callable[[], float]): Source of the current time, in seconds.
+        """
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._stats = CacheStats(max_size=max_size)
+        # Epoch of the last invalidation of each key, oldest first
+        self._invalidated: OrderedDict[K, int] = OrderedDict()
+        self._epoch = 0
+        # Values read before this epoch are never stored
+        self._oldest_epoch = 0
+
+    def get(self, key: K) -> V | _Missing:
+        """Return the live value stored for `key`, or `MISSING`."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return MISSING
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self._stats.expirations += 1
+            self._stats.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return value
+
+    def epoch(self) -> int:
+        """Current invalidation epoch, to take before reading a value to `set`."""
+        return self._epoch
+
+    def set(
+        self, key: K, value: V, ttl: Optional[float] = None, epoch: Optional[int] = None
+    ) -> None:
+        """Store `value` for `key`, evicting the least recently used entry if full.
+
+        Args:
+            key (K): The key of the entry.
+            value (V): The value to store.
+            ttl (Optional[float]): Time to live of this entry, defaults to the cache TTL.
+            epoch (Optional[int]): The `epoch()` taken before reading `value`. The
+                value is not stored if `key` was invalidated since.
+        """
+        if epoch is not None and (
+            epoch < self._oldest_epoch or self._invalidated.get(key, -1) >= epoch
+        ):
+            return
+
+        expires_at = self._clock() + (self._ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """Drop the entry stored for `key`, if any, and the values being read for it."""
+        if self._entries.pop(key, None) is not None:
+            self._stats.invalidations += 1
+
+        self._invalidated[key] = self._epoch
+        self._invalidated.move_to_end(key)
+        self._epoch += 1
+        if len(self._invalidated) > self._max_size:
+            _, forgotten = self._invalidated.popitem(last=False)
+            self._oldest_epoch = forgotten + 1
+
+    def clear(self) -> None:
+        """Drop every entry, and the values being read."""
+        self._stats.invalidations += len(self._entries)
+        self._entries.clear()
+        self._invalidated.clear()
+        self._epoch += 1
+        self._oldest_epoch = self._epoch
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters."""
+        return CacheStats(**{**vars(self._stats), "size": len(self._entries)})
@@ -0,0 +1,53 @@
+from .batch_loader import BatchLoader, BatchLoaderStats
+from .batch_repository import BatchLoadingRepository
+from .repository import SingleFlightRepository
+from .single_flight import SingleFlight, SingleFlightStats
+
+_flights: dict[str, SingleFlight] = {}
+_loaders: dict[str, BatchLoader] = {}
+
+
+def register_single_flights(flights: dict[str, SingleFlight]) -> None:
+    """Register single-flight groups so their counters are reported for monitoring.
+
+    Args:
+        flights (dict[str, SingleFlight]): The groups, by the name they are reported under.
+    """
+    _flights.update(flights)
+
+
+def get_single_flight_stats() -> dict[str, SingleFlightStats]:
+    """Return a snapshot of the counters of every registered single-flight group."""
+    return {
+        name: SingleFlightStats(calls=flight.stats.calls, shared=flight.stats.shared)
+        for name, flight in _flights.items()
+    }
+
+
+def register_batch_loader(name: str, loader: BatchLoader) -> None:
+    """Register a batch loader so its counters are reported for monitoring.
+
+    Args:
+        name (str): The name the loader is reported under.
+        loader (BatchLoader): The loader to register.
+    """
+    _loaders[name] = loader
+
+
+def get_batch_loader_stats() -> dict[str, BatchLoaderStats]:
+    """Return a snapshot of the counters of every registered batch loader."""
+    return {name: BatchLoaderStats(**vars(loader.stats)) for name, loader in _loaders.items()}
+
+
+__all__ = [
+    "BatchLoader",
+    "BatchLoaderStats",
+    "BatchLoadingRepository",
+    "SingleFlight",
+    "SingleFlightRepository",
+    "SingleFlightStats",
+    "get_batch_loader_stats",
+    "get_single_flight_stats",
+    "register_batch_loader",
+    "register_single_flights",
+]
@@ -0,0 +1,117 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generic, Hashable, List, Sequence, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class BatchLoaderStats:
+    """Counters of a batch loader, for monitoring."""
+
+    # Keys requested by callers
+    loads: int = 0
+    # Calls of the batch function, each one query
+    batches: int = 0
+    # Distinct keys passed to the batch function
+    keys: int = 0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.keys / self.batches if self.batches else 0.0
+
+
+class BatchLoader(Generic[K, V]):
+    """Loads the keys requested in the same event loop iteration together.
+
+    Keys passed to `load` are collected until the callbacks ready in the
+    event loop have run, then loaded by a single call of `load_many`, which
+    returns the values in the order of the keys it is given. Each caller gets
+    the value of its own key, or the exception of its batch. A key requested
+    several times is loaded once. A cancelled caller only stops waiting, the
+    batch is still loaded for the others.
+
+    Batches are collected per event loop, and hold at most `max_batch_size`
+    keys: a batch reaching it is loaded right away.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[List[K]], Awaitable[Sequence[V]]],
+        max_batch_size: int = 100,
+    ):
+        """
+        Args:
+            load_many (Callable[[List[K]], Awaitable[Sequence[V]]]): Loads the
+                values of distinct keys, in their order.
+            max_batch_size (int): Maximum number of distinct keys loaded at once.
+        """
+        self._load_many = load_many
+        self._max_batch_size = max_batch_size
+        self._pending: dict[asyncio.AbstractEventLoop, dict[K, list[asyncio.Future[V]]]] = {}
+        # Batches being loaded, referenced until they are done
+        self._loading: set[asyncio.Task[None]] = set()
+        self.stats = BatchLoaderStats()
+
+    async def load(self, key: K) -> V:
+        """Load the value of `key` with the other keys requested meanwhile.
+
+        Args:
+            key (K): The key to load.
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = {}
+            loop.call_soon(self._dispatch, loop)
+
+        future: asyncio.Future[V] = loop.create_future()
+        batch.setdefault(key, []).append(future)
+        self.stats.loads += 1
+        if len(batch) >= self._max_batch_size:
+            self._dispatch(loop)
+        return await future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        # The batch may have been loaded already for reaching the maximum size
+        batch = self._pending.pop(loop, None)
+        if not batch:
+            return
+        task = loop.create_task(self._load(batch))
+        self._loading.add(task)
+        task.add_done_callback(self._loading.discard)
+
+    async def _load(self, batch: dict[K, list[asyncio.Future[V]]]) -> None:
+        keys = list(batch)
+        self.stats.batches += 1
+        self.stats.keys += len(keys)
+        try:
+            values = await self._load_many(keys)
+            if len(values) != len(keys):
+                raise ValueError(f"Loaded {len(values)} values for {len(keys)} keys")
+        except asyncio.CancelledError:
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as error:
+            for futures in batch.values():
+                self._resolve(futures, error=error)
+            return
+
+        for key, value in zip(keys, values):
+            self._resolve(batch[key], value=value)
+
+    @staticmethod
+    def _resolve(
+        futures: list[asyncio.Future[V]], value: Any = None, error: Exception | None = None
+    ) -> None:
+        for future in futures:
+            # Futures of cancelled callers are done already
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(value)
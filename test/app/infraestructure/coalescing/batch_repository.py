@@ -0,0 +1,35 @@
+from typing import Any, Optional
+from uuid import UUID
+
+from .batch_loader import BatchLoader
+
+
+class BatchLoadingRepository:
+    """Batches the concurrent single-ID fetches of a repository.
+
+    `fetch_by_id` calls issued in the same event loop iteration are loaded by
+    a single call of the wrapped repository's `fetch_many_by_ids`, see
+    `BatchLoader`, so requests looking up different users or articles at the
+    same time share one `$in` query. Other methods are delegated to the
+    wrapped repository unchanged.
+
+    Works for any repository with both methods, such as the news article and
+    user repositories.
+    """
+
+    def __init__(self, repository: Any, max_batch_size: int):
+        """
+        Args:
+            repository (Any): The repository to wrap.
+            max_batch_size (int): Maximum number of IDs fetched by one query.
+        """
+        self._repository = repository
+        self.loader: BatchLoader[UUID, Any] = BatchLoader(
+            lambda ids: repository.fetch_many_by_ids(ids=ids), max_batch_size
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    async def fetch_by_id(self, id: UUID) -> Optional[Any]:
+        return await self.loader.load(id)
@@ -0,0 +1,87 @@
+import inspect
+from typing import Any, Awaitable, Callable, Hashable, Iterable, Optional
+
+from pydantic import BaseModel
+
+from .single_flight import SingleFlight
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable equivalent of an argument, e.g. a tuple for a list."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, BaseModel):
+        return (type(value), _freeze(value.model_dump()))
+    return value
+
+
+def _call_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Optional[Hashable]:
+    key = (_freeze(args), _freeze(kwargs))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class SingleFlightRepository:
+    """Coalesces identical concurrent reads of a repository.
+
+    Concurrent calls of one of the `reads` methods with the same arguments
+    share a single call of the wrapped repository, see `SingleFlight`, so a
+    burst of requests for the same article or user costs one query. Callers
+    sharing a call get the same result object and must not modify it. Calls
+    with arguments that cannot be hashed are not coalesced.
+
+    Every other coroutine method is a write: once it is done, calls already
+    in flight are not shared with new callers anymore, so a read starting
+    after a write sees it. Writes made by other workers are not tracked.
+    """
+
+    def __init__(self, repository: Any, name: str, reads: Iterable[str]):
+        """
+        Args:
+            repository (Any): The repository to wrap.
+            name (str): The name the calls are reported under, as `<name>.<method>`.
+            reads (Iterable[str]): The coroutine methods to coalesce.
+        """
+        self._repository = repository
+        self.flights: dict[str, SingleFlight] = {}
+        for method in reads:
+            function = getattr(repository, method)
+            if not inspect.iscoroutinefunction(function):
+                raise TypeError(f"{name}.{method} is not a coroutine function")
+            self.flights[f"{name}.{method}"] = flight = SingleFlight()
+            setattr(self, method, self._coalesced(function, flight))
+
+    @staticmethod
+    def _coalesced(
+        function: Callable[..., Awaitable[Any]], flight: SingleFlight
+    ) -> Callable[..., Awaitable[Any]]:
+        async def coalesced(*args: Any, **kwargs: Any) -> Any:
+            key = _call_key(args, kwargs)
+            if key is None:
+                return await function(*args, **kwargs)
+            return await flight.do(key, lambda: function(*args, **kwargs))
+
+        return coalesced
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        async def write(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await attribute(*args, **kwargs)
+            finally:
+                for flight in self.flights.values():
+                    flight.forget()
+
+        # Looked up once, later accesses find the instance attribute
+        setattr(self, name, write)
+        return write
@@ -0,0 +1,82 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Call(Generic[T]):
+    task: asyncio.Task[T]
+    waiters: int = 0
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters of a single-flight group, for monitoring."""
+
+    # Calls that ran the underlying function
+    calls: int = 0
+    # Calls served by another call already in flight
+    shared: int = 0
+
+    @property
+    def shared_ratio(self) -> float:
+        total = self.calls + self.shared
+        return self.shared / total if total else 0.0
+
+
+@dataclass
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key.
+
+    The first caller of a key starts the call in its own task. Callers
+    arriving before it finishes wait for that task and all get its result or
+    its exception. A cancelled caller stops waiting without affecting the
+    others; the task is only cancelled once no caller waits for it.
+
+    Meant to be used from a single event loop, so it does no locking.
+    """
+
+    stats: SingleFlightStats = field(default_factory=SingleFlightStats)
+    _calls: dict[Hashable, _Call] = field(default_factory=dict)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn`, or wait for the call already in flight for `key`.
+
+        Args:
+            key (Hashable): Identifies the calls that can share a result.
+            fn (Callable[[], Awaitable[T]]): Starts the call.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = _Call(asyncio.ensure_future(fn()))
+            call.task.add_done_callback(lambda task: self._finished(key, call))
+            self.stats.calls += 1
+        else:
+            self.stats.shared += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # Every caller was cancelled: nobody needs the result anymore
+                self._forget(key, call)
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _Call) -> None:
+        # A newer call may be in flight for the key already
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def _finished(self, key: Hashable, call: _Call) -> None:
+        self._forget(key, call)
+        if not call.task.cancelled():
+            # Retrieved, so a failure no caller waited for is not reported
+            call.task.exception()
+
+    def forget(self) -> None:
+        """Make the next callers start new calls instead of joining the ones in flight."""
+        self._calls.clear()
@@ -0,0 +1,101 @@
+"""Conversion from stored documents to core entities.
+
+Documents are validated by the Beanie models when they are written, so the
+raw dicts read back from MongoDB are trusted and turned into entities with
+`model_construct`, skipping both the Beanie parse and a second validation
+of the entity.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Mapping
+from uuid import UUID
+
+from bson import Binary
+from pydantic import SecretStr
+
+from app.core.news.entities.news_article import NewsArticle
+from app.core.users.entities.user import User
+
+from .models.news import NewsArticle as NewsArticleModel
+from .models.users import User as UserModel
+
+# Projections limited to the fields of the core entities
+NEWS_ARTICLE_PROJECTION = {
+    field: True for field in NewsArticle.model_fields if field != "id"
+}
+USER_PROJECTION = {field: True for field in User.model_fields if field != "id"}
+
+
+def as_uuid(value: UUID | Binary) -> UUID:
+    """Return a stored `_id` as an UUID, whatever the client's UUID representation."""
+    if isinstance(value, Binary):
+        return value.as_uuid()
+    return value
+
+
+def as_stored_datetime(value: datetime) -> datetime:
+    """Return a datetime as MongoDB gives it back: naive UTC, truncated to milliseconds.
+
+    Entities built from a document just written then serialize, and hash into
+    ETags, the same as when they are read back.
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
+
+
+def to_bson_uuid(value: UUID) -> Binary:
+    """Encode an UUID the way Beanie stores it, for queries issued on the raw collection."""
+    return Binary.from_uuid(value)
+
+
+def news_article_from_document(document: Mapping[str, Any]) -> NewsArticle:
+    """Build a news article entity from a raw `news_articles` document."""
+    return NewsArticle.model_construct(
+        id=as_uuid(document["_id"]),
+        title=document["title"],
+        content=document["content"],
+        categories=document["categories"],
+        created_at=document["created_at"],
+        updated_at=document["updated_at"],
+        version=document.get("version", 0),
+    )
+
+
+def news_article_from_model(news_article: NewsArticleModel) -> NewsArticle:
+    """Build a news article entity from an already validated Beanie document."""
+    return NewsArticle.model_construct(
+        id=news_article.id,
+        title=news_article.title,
+        content=news_article.content,
+        categories=news_article.categories,
+        created_at=as_stored_datetime(news_article.created_at),
+        updated_at=as_stored_datetime(news_article.updated_at),
+        version=news_article.version,
+    )
+
+
+def user_from_document(document: Mapping[str, Any]) -> User:
+    """Build a user entity from a raw `users` document."""
+    return User.model_construct(
+        id=as_uuid(document["_id"]),
+        username=document["username"],
+        password=SecretStr(document["password"]),
+        email=document["email"],
+        interests=document["interests"],
+        created_at=document["created_at"],
+        updated_at=document["updated_at"],
+    )
+
+
+def user_from_model(user: UserModel) -> User:
+    """Build a user entity from an already validated Beanie document."""
+    return User.model_construct(
+        id=user.id,
+        username=user.username,
+        password=user.password,
+        email=user.email,
+        interests=user.interests,
+        created_at=as_stored_datetime(user.created_at),
+        updated_at=as_stored_datetime(user.updated_at),
+    )
@@ -4,11 +4,19 @@ from beanie import Document
 
 
 from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
 
 from datetime import datetime, timezone
 
 from app.core.news.entities.news_article import NewsCategory
 
+# Relative weight of each field in the text score of a search
+TEXT_INDEX_WEIGHTS = {"title": 10, "content": 2}
+# Language of the text index. "none" disables stemming and stop words, so
+# searches match whole words exactly as they are tokenized.
+TEXT_INDEX_LANGUAGE = "none"
+
+
 class NewsArticle(Document):
     id: UUID= Field(default_factory=uuid4)
     title: str = Field(..., max_length=255)
@@ -17,6 +25,27 @@ class NewsArticle(Document):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     is_active: bool = Field(default=True)
+    # Incremented on every update, for optimistic concurrency control
+    version: int = Field(default=0)
 
     class Settings:
         name = "news_articles"
+        indexes = [
+            # Listing order of the unfiltered news pages
+            IndexModel(
+                [("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="created_at_id",
+            ),
+            # Multikey index serving the category filters in listing order
+            IndexModel(
+                [("categories", ASCENDING), ("created_at", DESCENDING), ("_id", DESCENDING)],
+                name="categories_created_at_id",
+            ),
+            # Full-text search over the title and the content
+            IndexModel(
+                [(field, TEXT) for field in TEXT_INDEX_WEIGHTS],
+                weights=TEXT_INDEX_WEIGHTS,
+                default_language=TEXT_INDEX_LANGUAGE,
+                name="title_content_text",
+            ),
+        ]
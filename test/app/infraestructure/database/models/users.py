@@ -1,16 +1,16 @@
 from datetime import datetime, timezone
-from typing import Annotated
 from uuid import UUID, uuid4
 
-from beanie import Document, Indexed
+from beanie import Document
 from pydantic import Field, SecretStr
+from pymongo import ASCENDING, IndexModel
 
 from app.core.users.entities.user import UserInterests
 
 
 class User(Document):
     id: UUID = Field(default_factory=uuid4)
-    username: Annotated[str, Indexed(unique=True)] = Field(..., max_length=255)
+    username: str = Field(..., max_length=255)
     email: str = Field(..., max_length=255)
     password: SecretStr
     interests: list[UserInterests] = Field(default_factory=list)
@@ -20,3 +20,11 @@ class User(Document):
 
     class Settings:
         name = "users"
+        indexes = [
+            # Named as Beanie named it when it was declared with `Indexed`
+            IndexModel([("username", ASCENDING)], unique=True, name="username_1"),
+            IndexModel(
+                [("username", ASCENDING), ("is_active", ASCENDING)],
+                name="username_is_active",
+            ),
+        ]
@@ -1,30 +1,120 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
 from beanie import init_beanie as __init_beanie
 from mongomock_motor import AsyncMongoMockClient
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from app.config import settings
 
+from ..monitoring import command_metrics
 from .models import __beanie_models__
+from .pool_metrics import pool_metrics
+from .query_shapes import report_index_coverage
+from .slow_queries import slow_queries
+
+# Imported for their query shape registrations
+from .repositories import news_articles_repository, user_repository  # noqa: F401
+
+logger = logging.getLogger(__name__)
 
 type AsyncMongoClient = AsyncMongoMockClient | AsyncIOMotorClient
 
 
+def client_options() -> dict[str, Any]:
+    """Options of the MongoDB client, from the settings.
+
+    Returns:
+        dict[str, Any]: Keyword arguments for `AsyncIOMotorClient`.
+    """
+    options: dict[str, Any] = {
+        "maxPoolSize": settings.mongo_max_pool_size,
+        "minPoolSize": settings.mongo_min_pool_size,
+        "serverSelectionTimeoutMS": settings.mongo_server_selection_timeout_ms,
+        "readPreference": settings.mongo_read_preference,
+        "event_listeners": [pool_metrics, command_metrics, slow_queries],
+    }
+    if settings.mongo_max_idle_time_ms is not None:
+        options["maxIdleTimeMS"] = settings.mongo_max_idle_time_ms
+    if settings.mongo_wait_queue_timeout_ms is not None:
+        options["waitQueueTimeoutMS"] = settings.mongo_wait_queue_timeout_ms
+    if settings.mongo_compressors:
+        options["compressors"] = settings.mongo_compressors
+    if settings.mongo_write_concern is not None:
+        options["w"] = settings.mongo_write_concern
+    return options
+
+
 def init_db_dev_connection() -> AsyncMongoClient:
     if settings.testing:
         return init_test_connection()
 
     return AsyncIOMotorClient(
         str(settings.database_local_url),
+        **client_options(),
     )
 
 
 async def init_beanie(
     database_client: AsyncMongoClient,
+    indexes: bool = True,
 ) -> None:
-    """Initialize beanie with the database client and the models"""
+    """Initialize beanie with the database client and the models.
+
+    Args:
+        database_client (AsyncMongoClient): The database client.
+        indexes (bool): Also create the indexes, see `create_indexes`. When
+            False, `create_indexes` must be awaited before serving queries.
+    """
 
     await __init_beanie(
-        database_client[settings.database_name], document_models=__beanie_models__  # type: ignore
+        database_client[settings.database_name],  # type: ignore
+        document_models=__beanie_models__,
+        skip_indexes=True,
+    )
+    if indexes:
+        await create_indexes(database_client)
+
+
+async def create_indexes(database_client: AsyncMongoClient) -> None:
+    """Create the indexes declared by the models.
+
+    Models declare their indexes as `IndexModel`s in `Settings.indexes`, not
+    with `Indexed` fields, since Beanie is initialized with `skip_indexes`.
+    Existing indexes with the same definition are left as they are.
+
+    Once they exist, every query shape registered by the repositories is
+    checked against them and uncovered shapes are logged.
+    """
+    database = database_client[settings.database_name]
+    for model in __beanie_models__:
+        indexes = getattr(model.Settings, "indexes", [])
+        if indexes:
+            await database[model.get_settings().name].create_indexes(indexes)
+    await report_index_coverage(__beanie_models__)
+
+
+async def warm_up(database_client: AsyncMongoClient, connections: int) -> None:
+    """Open connections to the database before the first requests.
+
+    Concurrent pings make the client select a server and check out
+    `connections` connections at once, so the pool holds that many
+    established connections afterwards.
+
+    Args:
+        database_client (AsyncMongoClient): The client to warm up.
+        connections (int): The number of connections to open, at least one.
+    """
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(database_client.admin.command("ping") for _ in range(max(1, connections)))
+    )
+    logger.info(
+        "Database client warmed up with %d connections in %.1f ms",
+        max(1, connections),
+        (time.perf_counter() - start) * 1000,
     )
 
 
@@ -0,0 +1,118 @@
+import bisect
+import threading
+from dataclasses import dataclass, field
+
+from pymongo import monitoring
+
+# Upper bounds of the checkout wait histogram buckets, in seconds
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of the connection pool counters, summed over every server."""
+
+    connections_open: int = 0
+    connections_in_use: int = 0
+    connections_created: int = 0
+    connections_closed: int = 0
+    checkouts: int = 0
+    checkout_failures: int = 0
+    checkout_wait_seconds_total: float = 0.0
+    checkout_wait_seconds_max: float = 0.0
+    # Cumulative count of checkouts per upper bound of CHECKOUT_WAIT_BUCKETS,
+    # the last entry counting every checkout
+    checkout_wait_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(CHECKOUT_WAIT_BUCKETS) + 1)
+    )
+
+    @property
+    def checkout_wait_seconds_mean(self) -> float:
+        attempts = self.checkouts + self.checkout_failures
+        return self.checkout_wait_seconds_total / attempts if attempts else 0.0
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Records how long operations wait to check a connection out of the pool.
+
+    A wait that grows under load means the pool is too small for the
+    concurrency of the worker, a pool that never has connections in use is
+    larger than needed. Events are published from the driver threads, so the
+    counters are guarded by a lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats = PoolStats()
+
+    @property
+    def stats(self) -> PoolStats:
+        """A snapshot of the counters."""
+        with self._lock:
+            return PoolStats(
+                **{
+                    **self._stats.__dict__,
+                    "checkout_wait_buckets": list(self._stats.checkout_wait_buckets),
+                }
+            )
+
+    def _record_wait(self, duration: float) -> None:
+        self._stats.checkout_wait_seconds_total += duration
+        self._stats.checkout_wait_seconds_max = max(
+            self._stats.checkout_wait_seconds_max, duration
+        )
+        bucket = bisect.bisect_left(CHECKOUT_WAIT_BUCKETS, duration)
+        for index in range(bucket, len(self._stats.checkout_wait_buckets)):
+            self._stats.checkout_wait_buckets[index] += 1
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            self._stats.checkouts += 1
+            self._stats.connections_in_use += 1
+            self._record_wait(event.duration or 0.0)
+
+    def connection_check_out_failed(
+        self, event: monitoring.ConnectionCheckOutFailedEvent
+    ) -> None:
+        with self._lock:
+            self._stats.checkout_failures += 1
+            self._record_wait(event.duration or 0.0)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._stats.connections_in_use -= 1
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._stats.connections_created += 1
+            self._stats.connections_open += 1
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._stats.connections_closed += 1
+            self._stats.connections_open -= 1
+
+    # Lifecycle events carrying no counter
+
+    def connection_check_out_started(
+        self, event: monitoring.ConnectionCheckOutStartedEvent
+    ) -> None:
+        pass
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        pass
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        pass
+
+
+pool_metrics = PoolMetricsListener()
@@ -0,0 +1,230 @@
+import functools
+import inspect
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Optional, Sequence, TypeVar
+
+from beanie import Document
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+# Key standing for a text index, whatever the fields it covers
+TEXT_INDEX_KEY = "$text"
+
+# Repository function running the current MongoDB commands. Motor runs the
+# driver in threads with a copy of the caller context, so command listeners
+# can read it to attribute commands
+query_source: ContextVar[Optional[str]] = ContextVar("query_source", default=None)
+
+
+@dataclass(frozen=True)
+class QueryShape:
+    """Shape of a query issued by a repository function.
+
+    Only field names are recorded, values are irrelevant to index selection.
+    `filter` holds the fields the query filters on and `sort` the fields it
+    sorts on (range conditions used for keyset pagination belong in `sort`).
+    A `$text` query filters on `TEXT_INDEX_KEY`.
+    """
+
+    model: type[Document]
+    source: str
+    filter: tuple[str, ...] = ()
+    sort: tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        return (
+            f"{self.source}: filter={list(self.filter)} sort={list(self.sort)}"
+        )
+
+
+_query_shapes: list[QueryShape] = []
+
+
+def _attributed(fn: F, source: str) -> F:
+    """Wrap a repository function so that its commands are attributed to `source`."""
+    if inspect.isasyncgenfunction(fn):
+
+        @functools.wraps(fn)
+        async def generator_wrapper(*args, **kwargs):
+            iterator = fn(*args, **kwargs)
+            try:
+                while True:
+                    # Only set while the generator runs, not while its consumer does
+                    token = query_source.set(source)
+                    try:
+                        item = await anext(iterator)
+                    except StopAsyncIteration:
+                        return
+                    finally:
+                        query_source.reset(token)
+                    yield item
+            finally:
+                await iterator.aclose()
+
+        wrapper: Any = generator_wrapper
+    else:
+
+        @functools.wraps(fn)
+        async def coroutine_wrapper(*args, **kwargs):
+            token = query_source.set(source)
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                query_source.reset(token)
+
+        wrapper = coroutine_wrapper
+
+    wrapper.__query_source__ = source
+    return wrapper
+
+
+def query_shape(
+    model: type[Document],
+    filter: Sequence[str] = (),
+    sort: Sequence[str] = (),
+) -> Callable[[F], F]:
+    """Record a query shape issued by the decorated repository function.
+
+    A function issuing several shapes can be decorated once per shape. The
+    function is wrapped to set `query_source` to its name while it runs.
+
+    Args:
+        model (type[Document]): The Beanie model the query runs against.
+        filter (Sequence[str]): Fields the query filters on.
+        sort (Sequence[str]): Fields the query sorts on.
+    """
+
+    def decorator(fn: F) -> F:
+        source = f"{fn.__module__}.{fn.__name__}"
+        _query_shapes.append(
+            QueryShape(
+                model=model,
+                source=source,
+                filter=tuple(filter),
+                sort=tuple(sort),
+            )
+        )
+        if getattr(fn, "__query_source__", None) == source:
+            return fn
+        return _attributed(fn, source)
+
+    return decorator
+
+
+def no_query_shape(reason: str) -> Callable[[F], F]:
+    """Exempt the decorated repository function from declaring query shapes.
+
+    For functions issuing no query an index could serve, such as inserts.
+    The function is wrapped to set `query_source` to its name while it runs.
+
+    Args:
+        reason (str): Why the function needs no index, for reviewers.
+    """
+
+    def decorator(fn: F) -> F:
+        wrapper = _attributed(fn, f"{fn.__module__}.{fn.__name__}")
+        wrapper.__no_query_shape__ = reason  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def find_undeclared_queries(modules: Sequence[ModuleType]) -> list[str]:
+    """Find the repository functions declaring neither query shapes nor an exemption.
+
+    Every public coroutine or async generator function defined in `modules`
+    must be decorated with `query_shape` or `no_query_shape`, so that a new
+    query cannot skip the index coverage check.
+
+    Args:
+        modules (Sequence[ModuleType]): The repository modules.
+
+    Returns:
+        list[str]: The qualified names of the undeclared functions.
+    """
+    return [
+        f"{module.__name__}.{name}"
+        for module in modules
+        for name, fn in vars(module).items()
+        if not name.startswith("_")
+        and (inspect.iscoroutinefunction(fn) or inspect.isasyncgenfunction(fn))
+        and fn.__module__ == module.__name__
+        and not hasattr(fn, "__query_source__")
+    ]
+
+
+def get_query_shapes() -> list[QueryShape]:
+    """Return every query shape recorded so far."""
+    return list(_query_shapes)
+
+
+def is_covered(shape: QueryShape, index_keys: Sequence[str]) -> bool:
+    """Check whether an index can serve a query shape without a collection scan.
+
+    The filter fields must be the leading keys of the index, in any order, and
+    the sort fields must follow them in order.
+
+    Args:
+        shape (QueryShape): The query shape to check.
+        index_keys (Sequence[str]): The keys of the index, in order.
+    """
+    filter_len = len(shape.filter)
+    if set(index_keys[:filter_len]) != set(shape.filter):
+        return False
+
+    sort_keys = index_keys[filter_len : filter_len + len(shape.sort)]
+    return tuple(sort_keys) == shape.sort
+
+
+def _index_keys(key: Sequence[tuple[str, Any]]) -> list[str]:
+    # MongoDB reports the fields of a text index as `_fts` and `_ftsx`,
+    # mongomock as the indexed fields with a "text" direction
+    keys: list[str] = []
+    for field, direction in key:
+        if direction == "text" or field in ("_fts", "_ftsx"):
+            field = TEXT_INDEX_KEY
+            if field in keys:
+                continue
+        keys.append(field)
+    return keys
+
+
+async def report_index_coverage(models: Sequence[type[Document]]) -> list[QueryShape]:
+    """Log every recorded query shape that no index of its collection covers.
+
+    Indexes are read back from the database once they are created, so indexes
+    created by hand are taken into account too.
+
+    Args:
+        models (Sequence[type[Document]]): The initialized Beanie models.
+
+    Returns:
+        list[QueryShape]: The uncovered query shapes.
+    """
+    uncovered: list[QueryShape] = []
+    for model in models:
+        index_information = await model.get_motor_collection().index_information()
+        indexes = [_index_keys(index["key"]) for index in index_information.values()]
+
+        for shape in _query_shapes:
+            if shape.model is not model:
+                continue
+            if not any(is_covered(shape, keys) for keys in indexes):
+                uncovered.append(shape)
+                logger.warning(
+                    "Query shape not covered by any index of '%s': %s",
+                    model.get_settings().name,
+                    shape,
+                )
+
+    logger.info(
+        "Index coverage: %d query shapes checked, %d uncovered",
+        len(_query_shapes),
+        len(uncovered),
+    )
+    return uncovered
@@ -1,23 +1,35 @@
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
-import logging
 
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s", 
-)
+from pydantic import ValidationError
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from pymongo.errors import BulkWriteError
 
 from app.core.news.entities.news_article import (
     CreateNewsArticleDto,
     NewsArticle,
+    NewsArticleBulkCreateResult,
+    NewsArticleCursor,
+    NewsArticleSearchCursor,
+    NewsArticleSearchHit,
     NewsCategory,
+    NewsCategoryCount,
     UpdateNewsArticleDto
 )
 
+from ..converters import (
+    NEWS_ARTICLE_PROJECTION,
+    news_article_from_document,
+    news_article_from_model,
+    to_bson_uuid,
+)
 from ..models.news import NewsArticle as NewsArticleModel
+from ..query_shapes import TEXT_INDEX_KEY, no_query_shape, query_shape
+from ...search import tokenize
 
 
+@no_query_shape("inserts only")
 async def create(dto: CreateNewsArticleDto) -> NewsArticle:
     """Create a new news article in the database.
 
@@ -25,67 +37,341 @@ async def create(dto: CreateNewsArticleDto) -> NewsArticle:
         dto (CreateNewsArticleDto): The data transfer object containing news article details.
     """
     news_article = await NewsArticleModel(**dto.model_dump()).insert()
-    return NewsArticle(**news_article.model_dump())
+    return news_article_from_model(news_article)
+
+
+@no_query_shape("inserts only")
+async def create_many(dtos: List[CreateNewsArticleDto]) -> List[NewsArticleBulkCreateResult]:
+    """Create news articles with a single unordered `insert_many`.
+
+    Invalid articles and articles rejected by the database are reported in
+    their result and do not prevent the others from being created.
+
+    Args:
+        dtos (List[CreateNewsArticleDto]): The articles to create.
+
+    Returns:
+        List[NewsArticleBulkCreateResult]: One result per article, in input order.
+    """
+    results = [NewsArticleBulkCreateResult(index=index) for index in range(len(dtos))]
+    to_insert: list[tuple[int, NewsArticleModel]] = []
+    for index, dto in enumerate(dtos):
+        try:
+            to_insert.append((index, NewsArticleModel(**dto.model_dump())))
+        except ValidationError as e:
+            results[index].error = str(e)
 
+    if not to_insert:
+        return results
 
+    failed: dict[int, str] = {}
+    try:
+        await NewsArticleModel.insert_many([model for _, model in to_insert], ordered=False)
+    except BulkWriteError as e:
+        failed = {error["index"]: error["errmsg"] for error in e.details["writeErrors"]}
+
+    for position, (index, model) in enumerate(to_insert):
+        if position in failed:
+            results[index].error = failed[position]
+        else:
+            results[index].article = news_article_from_model(model)
+    return results
+
+
+@query_shape(NewsArticleModel, filter=["_id"])
 async def fetch_by_id(id: UUID) -> Optional[NewsArticle]:
     """Fetch a news article by ID from the database.
 
     Args:
         id (UUID): The ID of the news article to retrieve.
     """
-    news_article = await NewsArticleModel.get(id)
+    news_article = await NewsArticleModel.get_motor_collection().find_one(
+        {"_id": to_bson_uuid(id)}, NEWS_ARTICLE_PROJECTION
+    )
     if not news_article:
         return None
 
-    return NewsArticle(**news_article.model_dump())
+    return news_article_from_document(news_article)
+
+
+# Export order, oldest first so an interrupted sync can resume with `since`
+_EXPORT_SORT = [("created_at", ASCENDING), ("_id", ASCENDING)]
+
+# Listing order shared by every paginated query. `_id` breaks ties between
+# articles created in the same millisecond so the order is total.
+_LISTING_SORT = [("created_at", DESCENDING), ("_id", DESCENDING)]
+
+
+def _category_query(category: Optional[str | List[str]]) -> dict:
+    if not category:
+        return {}
+
+    if isinstance(category, str):
+        return {"categories": category}
 
+    elif isinstance(category, list):
+        return {"categories": {"$in": category}}
 
+    raise ValueError("Invalid type for category. Must be str or List[str].")
+
+
+@query_shape(NewsArticleModel, filter=["_id"])
+async def fetch_many_by_ids(ids: List[UUID]) -> List[Optional[NewsArticle]]:
+    """Fetch news articles by ID with a single `$in` query.
+
+    Args:
+        ids (List[UUID]): The IDs of the news articles to retrieve.
+
+    Returns:
+        List[Optional[NewsArticle]]: The articles in the order of `ids`, None for missing ones.
+    """
+    cursor = NewsArticleModel.get_motor_collection().find(
+        {"_id": {"$in": [to_bson_uuid(id) for id in set(ids)]}}, NEWS_ARTICLE_PROJECTION
+    )
+    found = {}
+    async for document in cursor:
+        article = news_article_from_document(document)
+        found[article.id] = article
+    return [found.get(id) for id in ids]
+
+
+@query_shape(NewsArticleModel, sort=["created_at", "_id"])
+@query_shape(NewsArticleModel, filter=["categories"], sort=["created_at", "_id"])
 async def fetch_all_by_category(
     category: Optional[str|List[str]], limit: int, skip: int
 ) -> List[NewsArticle]:
-    if category:
-        if isinstance(category, str):
-            query = {"categories": category}
+    cursor = (
+        NewsArticleModel.get_motor_collection()
+        .find(_category_query(category), NEWS_ARTICLE_PROJECTION)
+        .sort(_LISTING_SORT)
+        .skip(skip)
+        .limit(limit)
+    )
+    return [news_article_from_document(article) async for article in cursor]
 
-        elif isinstance(category, list):
-            query = {"categories": {"$in": category}}
-            
-        else:
-            raise ValueError("Invalid type for category. Must be str or List[str].")
 
-        articles = (
-            await NewsArticleModel.find(query)
-            .skip(skip)
-            .limit(limit)
-            .to_list()
-        )
-    else:
-        articles = await NewsArticleModel.find().skip(skip).limit(limit).to_list()
- 
-    if not articles:
+@query_shape(NewsArticleModel, sort=["created_at", "_id"])
+@query_shape(NewsArticleModel, filter=["categories"], sort=["created_at", "_id"])
+async def fetch_page_by_category(
+    category: Optional[str | List[str]],
+    limit: int,
+    after: Optional[NewsArticleCursor],
+) -> List[NewsArticle]:
+    """Fetch the news articles that follow `after` in the listing order.
+
+    Args:
+        category (Optional[str | List[str]]): The category or categories to filter by.
+        limit (int): The maximum number of news articles to retrieve.
+        after (Optional[NewsArticleCursor]): The position of the last article already seen.
+    """
+    query = _category_query(category)
+    if after:
+        query = {
+            **query,
+            "$or": [
+                {"created_at": {"$lt": after.created_at}},
+                {"created_at": after.created_at, "_id": {"$lt": to_bson_uuid(after.id)}},
+            ],
+        }
+
+    cursor = (
+        NewsArticleModel.get_motor_collection()
+        .find(query, NEWS_ARTICLE_PROJECTION)
+        .sort(_LISTING_SORT)
+        .limit(limit)
+    )
+    return [news_article_from_document(article) async for article in cursor]
+
+
+@query_shape(NewsArticleModel, filter=["categories"])
+async def count_by_category(category: Optional[str | List[str]]) -> int:
+    """Count the news articles in a category with `count_documents`.
+
+    Args:
+        category (Optional[str | List[str]]): The category or categories to count, None for every article.
+    """
+    return await NewsArticleModel.get_motor_collection().count_documents(
+        _category_query(category)
+    )
+
+
+@no_query_shape("reads the collection metadata")
+async def estimated_count() -> int:
+    """Estimate the total number of news articles from the collection metadata."""
+    return await NewsArticleModel.get_motor_collection().estimated_document_count()
+
+
+@no_query_shape("reads every document, callers are expected to cache the result")
+async def count_per_category() -> List[NewsCategoryCount]:
+    """Count the news articles of every category with a single `$unwind`/`$group`.
+
+    Returns:
+        List[NewsCategoryCount]: The non-empty categories, largest first.
+    """
+    cursor = NewsArticleModel.get_motor_collection().aggregate(
+        [
+            {"$project": {"_id": False, "categories": True}},
+            {"$unwind": "$categories"},
+            {"$group": {"_id": "$categories", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+        ]
+    )
+    return [
+        NewsCategoryCount.model_construct(category=document["_id"], count=document["count"])
+        async for document in cursor
+    ]
+
+
+# The category filter of a search is applied to the documents matched by the
+# text index, which cannot be combined with the categories multikey index
+@query_shape(NewsArticleModel, filter=[TEXT_INDEX_KEY])
+async def search(
+    query: str,
+    category: Optional[str | List[str]],
+    limit: int,
+    after: Optional[NewsArticleSearchCursor],
+) -> List[NewsArticleSearchHit]:
+    """Search news articles with the text index, most relevant first.
+
+    The query is reduced to its words, so every backend matches the same
+    articles: quotes and leading hyphens do not build phrase nor negation
+    searches.
+
+    Args:
+        query (str): The words to search for.
+        category (Optional[str | List[str]]): The category or categories to filter by.
+        limit (int): The maximum number of news articles to retrieve.
+        after (Optional[NewsArticleSearchCursor]): The position of the last hit already seen.
+    """
+    terms = tokenize(query)
+    if not terms:
         return []
-    return [NewsArticle(**article.model_dump()) for article in articles]
 
+    pipeline: list[dict] = [
+        {"$match": {"$text": {"$search": " ".join(terms)}, **_category_query(category)}},
+        {"$addFields": {"score": {"$meta": "textScore"}}},
+    ]
+    if after:
+        pipeline.append(
+            {
+                "$match": {
+                    "$or": [
+                        {"score": {"$lt": after.score}},
+                        {"score": after.score, "_id": {"$lt": to_bson_uuid(after.id)}},
+                    ]
+                }
+            }
+        )
+    pipeline += [
+        {"$sort": {"score": -1, "_id": -1}},
+        {"$limit": limit},
+        {"$project": {**NEWS_ARTICLE_PROJECTION, "score": True}},
+    ]
+
+    cursor = NewsArticleModel.get_motor_collection().aggregate(pipeline)
+    return [
+        NewsArticleSearchHit.model_construct(
+            article=news_article_from_document(document), score=document["score"]
+        )
+        async for document in cursor
+    ]
 
-async def update(id: UUID, dto: UpdateNewsArticleDto) -> Optional[NewsArticle]:
-    news_article = await NewsArticleModel.get(id)
-    if not news_article:
-        return None
-    logging.info(dto.model_dump(exclude_unset=True))
 
-    await news_article.set(dto.model_dump(exclude_unset=True)) 
+@query_shape(NewsArticleModel, sort=["created_at", "_id"])
+@query_shape(NewsArticleModel, filter=["categories"], sort=["created_at", "_id"])
+async def iter_by_category(
+    category: Optional[str | List[str]],
+    since: Optional[datetime],
+    batch_size: int,
+) -> AsyncIterator[NewsArticle]:
+    """Iterate over news articles, oldest first, without loading them all in memory.
 
-    logging.info(news_article)
+    Args:
+        category (Optional[str | List[str]]): The category or categories to filter by.
+        since (Optional[datetime]): Only include articles created at or after this time.
+        batch_size (int): The number of documents fetched per round trip.
+    """
+    query = _category_query(category)
+    if since:
+        query["created_at"] = {"$gte": since}
 
-    return NewsArticle(**news_article.model_dump())
+    cursor = (
+        NewsArticleModel.get_motor_collection()
+        .find(query, NEWS_ARTICLE_PROJECTION, batch_size=batch_size)
+        .sort(_EXPORT_SORT)
+    )
+    async for document in cursor:
+        yield news_article_from_document(document)
 
 
+@query_shape(NewsArticleModel, filter=["_id"])
+async def update(
+    id: UUID, dto: UpdateNewsArticleDto, expected_version: Optional[int] = None
+) -> Optional[NewsArticle]:
+    """Atomically update a news article and bump its version.
+
+    Args:
+        id (UUID): The ID of the news article to update.
+        dto (UpdateNewsArticleDto): The data transfer object containing updated news article details.
+        expected_version (Optional[int]): Only update the article if it is at this version.
+
+    Returns:
+        Optional[NewsArticle]: The updated article, or None if no article with
+            this ID (and version, if given) exists.
+    """
+    query: dict = {"_id": to_bson_uuid(id)}
+    if expected_version is not None:
+        # Articles written before versioning have no version field
+        query["version"] = {"$in": [0, None]} if expected_version == 0 else expected_version
+
+    changes = dto.model_dump(exclude_unset=True)
+
+    news_article = await NewsArticleModel.get_motor_collection().find_one_and_update(
+        query,
+        {
+            "$set": {**changes, "updated_at": datetime.now(timezone.utc)},
+            "$inc": {"version": 1},
+        },
+        projection=NEWS_ARTICLE_PROJECTION,
+        return_document=ReturnDocument.AFTER,
+    )
+    if not news_article:
+        return None
+
+    return news_article_from_document(news_article)
+
+
+@query_shape(NewsArticleModel, filter=["_id"])
 async def remove(id: UUID) -> Optional[NewsArticle]:
-    news_article = await NewsArticleModel.get(id)
+    news_article = await NewsArticleModel.get_motor_collection().find_one_and_delete(
+        {"_id": to_bson_uuid(id)}, projection=NEWS_ARTICLE_PROJECTION
+    )
     if not news_article:
-        return None 
+        return None
+
+    return news_article_from_document(news_article)
+
+
+@query_shape(NewsArticleModel, filter=["_id"])
+@query_shape(NewsArticleModel, filter=["categories"])
+async def remove_many(
+    ids: Optional[List[UUID]] = None, category: Optional[str] = None
+) -> int:
+    """Remove news articles by ID or by category with a single `delete_many`.
 
-    await news_article.delete()
+    Args:
+        ids (Optional[List[UUID]]): The IDs of the news articles to remove.
+        category (Optional[str]): Remove every news article in this category.
+
+    Returns:
+        int: The number of removed news articles.
+    """
+    if ids is not None:
+        query: dict = {"_id": {"$in": [to_bson_uuid(id) for id in ids]}}
+    elif category is not None:
+        query = {"categories": category}
+    else:
+        raise ValueError("Either ids or category must be given.")
 
-    return NewsArticle(**news_article.model_dump())
+    result = await NewsArticleModel.get_motor_collection().delete_many(query)
+    return result.deleted_count
@@ -1,10 +1,23 @@
-from app.core.users.entities.user import CreateUserDto, User, UserInterests
+from app.core.users.entities.user import CreateUserDto, User, UserInterests, UserInterestsUpdate
+from ..converters import (
+    USER_PROJECTION,
+    as_stored_datetime,
+    to_bson_uuid,
+    user_from_document,
+    user_from_model,
+)
 from ..models.users import User as UserModel
+from ..query_shapes import no_query_shape, query_shape
+from datetime import datetime, timezone
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
+
+from pydantic import SecretStr
+from pymongo import ReturnDocument
 
 
 
+@no_query_shape("inserts only")
 async def create(dto: CreateUserDto) -> User:
     """Create a new user in the database.
 
@@ -12,33 +25,79 @@ async def create(dto: CreateUserDto) -> User:
         dto (CreateUserDto): The data transfer object containing user details.
     """
     user = await UserModel(**dto.model_dump()).insert()
-    return User(**user.model_dump())
+    return user_from_model(user)
 
+@query_shape(UserModel, filter=["_id"])
 async def fetch_by_id(id: UUID) -> Optional[User]:
     """Fetch an active user by ID from the database.
 
     Args:
         id (UUID): The ID of the user to retrieve.
     """
-    user = await UserModel.get(id)
+    user = await UserModel.get_motor_collection().find_one(
+        {"_id": to_bson_uuid(id)}, USER_PROJECTION
+    )
     if not user:
         return None
 
-    return User(**user.model_dump())
+    return user_from_document(user)
+
+
+@query_shape(UserModel, filter=["_id"])
+async def fetch_many_by_ids(ids: List[UUID]) -> List[Optional[User]]:
+    """Fetch users by ID with a single `$in` query.
+
+    Args:
+        ids (List[UUID]): The IDs of the users to retrieve.
+
+    Returns:
+        List[Optional[User]]: The users in the order of `ids`, None for missing ones.
+    """
+    cursor = UserModel.get_motor_collection().find(
+        {"_id": {"$in": [to_bson_uuid(id) for id in set(ids)]}}, USER_PROJECTION
+    )
+    found = {}
+    async for document in cursor:
+        user = user_from_document(document)
+        found[user.id] = user
+    return [found.get(id) for id in ids]
 
 
+@query_shape(UserModel, filter=["username", "is_active"])
 async def fetch_by_username(username: str) -> Optional[User]:
     """Fetch an active user by username from the database.
 
     Args:
         username (str): The username of the user to retrieve.
     """
-    user = await UserModel.find_one(UserModel.username == username, UserModel.is_active == True)
+    user = await UserModel.get_motor_collection().find_one(
+        {"username": username, "is_active": True}, USER_PROJECTION
+    )
     if not user:
         return None
 
-    return User(**user.model_dump())
+    return user_from_document(user)
 
+@query_shape(UserModel, filter=["_id"])
+async def update_password(id: UUID, password: SecretStr) -> bool:
+    """Replace the stored password hash of a user.
+
+    Args:
+        id (UUID): The ID of the user to update.
+        password (SecretStr): The new password hash.
+    """
+    result = await UserModel.get_motor_collection().update_one(
+        {"_id": to_bson_uuid(id)},
+        {
+            "$set": {
+                "password": password.get_secret_value(),
+                "updated_at": datetime.now(timezone.utc),
+            }
+        },
+    )
+    return result.matched_count > 0
+
+@query_shape(UserModel, filter=["_id"])
 async def remove(id: UUID) -> Optional[User]:
     user = await UserModel.get(id)
     if not user:
@@ -46,79 +105,97 @@ async def remove(id: UUID) -> Optional[User]:
 
     await user.delete()
 
-    return User(**user.model_dump())
-
-import logging
-
-# Configuración básica del logging
-logging.basicConfig(
-    level=logging.INFO,  # Nivel de logging
-    format="%(asctime)s - %(levelname)s - %(message)s",  # Formato del mensaje
-)
+    return user_from_model(user)
 
+@query_shape(UserModel, filter=["_id"])
 async def fetch_user_interests(user_id: UUID) -> Optional[list[UserInterests]]:
-    logging.info(f"Fetching interests for user with ID: {user_id}")
-
-    user = await UserModel.get(user_id)
+    user = await UserModel.get_motor_collection().find_one(
+        {"_id": to_bson_uuid(user_id)}, {"interests": True}
+    )
     if not user:
         return None
-    
-    logging.info(f"Interests for user {user_id}: {user.interests}")
 
-    return user.interests
+    return user["interests"]
 
-async def remove_user_interest(user_id: UUID, interest: str) -> Optional[User]:
+@query_shape(UserModel, filter=["_id"])
+async def remove_user_interest(user_id: UUID, interest: UserInterests) -> Optional[UserInterestsUpdate]:
     """Remove a specific interest from a user in the database.
 
+    Runs a single atomic `$pull` and works out the outcome from the document
+    as it was before the update.
+
     Args:
         user_id (UUID): The ID of the user whose interest will be removed.
-        interest (str): The interest to remove.
+        interest (UserInterests): The interest to remove.
 
     Returns:
-        Optional[User]: The updated user if the operation is successful, or None if the user does not exist.
+        Optional[UserInterestsUpdate]: The updated user and whether the interest was
+            present, or None if the user does not exist.
     """
-    logging.info(f"Removing interest '{interest}' for user with ID: {user_id}")
-
-    user = await UserModel.get(user_id)
+    updated_at = datetime.now(timezone.utc)
+    user = await UserModel.get_motor_collection().find_one_and_update(
+        {"_id": to_bson_uuid(user_id)},
+        {"$pull": {"interests": interest}, "$set": {"updated_at": updated_at}},
+        projection=USER_PROJECTION,
+        return_document=ReturnDocument.BEFORE,
+    )
     if not user:
-        logging.warning(f"User with ID {user_id} not found.")
-        return None
-
-    if interest not in user.interests:
-        logging.warning(f"Interest '{interest}' not found for user with ID {user_id}.")
         return None
 
-    user.interests.remove(interest)
-
-    await user.save()
+    modified = interest in user["interests"]
+    user["interests"] = [i for i in user["interests"] if i != interest]
+    user["updated_at"] = as_stored_datetime(updated_at)
+    return UserInterestsUpdate.model_construct(user=user_from_document(user), modified=modified)
 
-    logging.info(f"Interest '{interest}' removed for user with ID {user_id}.")
-    return User(**user.model_dump())
-
-async def add_user_interest(user_id: UUID, interest: UserInterests) -> Optional[User]:
+@query_shape(UserModel, filter=["_id"])
+async def add_user_interest(user_id: UUID, interest: UserInterests) -> Optional[UserInterestsUpdate]:
     """Add a specific interest to a user in the database.
 
+    Runs a single atomic `$addToSet` and works out the outcome from the
+    document as it was before the update.
+
     Args:
         user_id (UUID): The ID of the user to whom the interest will be added.
-        interest (str): The interest to add.
+        interest (UserInterests): The interest to add.
 
     Returns:
-        Optional[User]: The updated user if the operation is successful, or None if the user does not exist.
+        Optional[UserInterestsUpdate]: The updated user and whether the interest was
+            missing, or None if the user does not exist.
     """
-    logging.info(f"Adding interest '{interest}' for user with ID: {user_id}")
-
-    user = await UserModel.get(user_id)
+    updated_at = datetime.now(timezone.utc)
+    user = await UserModel.get_motor_collection().find_one_and_update(
+        {"_id": to_bson_uuid(user_id)},
+        {"$addToSet": {"interests": interest}, "$set": {"updated_at": updated_at}},
+        projection=USER_PROJECTION,
+        return_document=ReturnDocument.BEFORE,
+    )
     if not user:
-        logging.warning(f"User with ID {user_id} not found.")
         return None
 
-    if interest in user.interests:
-        logging.warning(f"Interest '{interest}' already exists for user with ID {user_id}.")
-        return None
+    modified = interest not in user["interests"]
+    if modified:
+        user["interests"] = [*user["interests"], interest]
+    user["updated_at"] = as_stored_datetime(updated_at)
+    return UserInterestsUpdate.model_construct(user=user_from_document(user), modified=modified)
 
-    user.interests.append(interest)
+@query_shape(UserModel, filter=["_id"])
+async def replace_user_interests(user_id: UUID, interests: list[UserInterests]) -> Optional[User]:
+    """Replace all the interests of a user in a single write.
+
+    Args:
+        user_id (UUID): The ID of the user whose interests will be replaced.
+        interests (list[UserInterests]): The new interests, without duplicates.
 
-    await user.save()
+    Returns:
+        Optional[User]: The updated user, or None if the user does not exist.
+    """
+    user = await UserModel.get_motor_collection().find_one_and_update(
+        {"_id": to_bson_uuid(user_id)},
+        {"$set": {"interests": interests, "updated_at": datetime.now(timezone.utc)}},
+        projection=USER_PROJECTION,
+        return_document=ReturnDocument.AFTER,
+    )
+    if not user:
+        return None
 
-    logging.info(f"Interest '{interest}' added for user with ID {user_id}.")
-    return User(**user.model_dump())
\ No newline at end of file
+    return user_from_document(user)
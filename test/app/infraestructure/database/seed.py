@@ -1,72 +1,146 @@
+"""Placeholder user and news articles for development and tests.
+
+Seeding is opt-in (`settings.seed_database`, or running this module) and
+idempotent: documents are inserted in bulk unless a document with the same
+natural key, the username of users and the title of news articles, is
+already stored. Existing documents are left untouched. Usernames are unique,
+but titles are not, so seed from a single process rather than from every
+worker at startup.
+
+Usage:
+    uv run python -m app.infraestructure.database.seed
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from beanie import Document
+from beanie.odm.utils.dump import get_dict
 from pydantic import SecretStr
+from pymongo.errors import BulkWriteError
 
-from app.api.auth import pwd_context
+from app.api.auth import password_hasher
+
+from ..monitoring import configure_logging
 
 from .models.news import NewsArticle as NewsArticleModel
 from .models.users import User as UserModel
 
+logger = logging.getLogger(__name__)
+
+# Raised when a concurrent seed inserted the same unique key first
+DUPLICATE_KEY_ERROR = 11000
+
 TEST_USERNAME = "lexy"
 TEST_EMAIL = "user@test.com"
 TEST_PASSWORD = "password"
 TEST_INTERESTS = ["technology", "business"]
 
+# News articles upserted by title
+PLACEHOLDER_NEWS_ARTICLES: list[dict[str, Any]] = [
+    dict(
+        title="The new PS6 is out",
+        content="The new PS6 is out now :)",
+        categories=["business", "technology"],
+    ),
+    dict(
+        title="NASA announces new Moon mission",
+        content="NASA has revealed plans for a new lunar mission set to launch in 2025, aiming to establish a sustainable human presence on the Moon.",
+        categories=["science"],
+    ),
+    dict(
+        title="Global markets rally after positive economic data",
+        content="Stock markets worldwide saw significant gains today following the release of better-than-expected economic growth figures.",
+        categories=["business"],
+    ),
+    dict(
+        title="Breakthrough in cancer research offers new hope",
+        content="Scientists have developed a promising new treatment that could significantly improve survival rates for certain types of cancer.",
+        categories=["health", "science"],
+    ),
+    dict(
+        title="Major update released for popular messaging app",
+        content="The latest update introduces end-to-end encryption and several new features to enhance user privacy and experience.",
+        categories=["technology"],
+    ),
+    dict(
+        title="Local community garden project flourishes",
+        content="Residents celebrate the success of a community garden initiative that has brought fresh produce and a sense of unity to the neighborhood.",
+        categories=["lifestyle"],
+    ),
+]
+
 
-async def create_db_placeholders() -> None:
-    """Create placeholder users in the database."""
-    await drop_placeholders()
-
-    # Create a list of placeholder users
-    test_user = await UserModel(
-        username=TEST_USERNAME,
-        email=TEST_EMAIL,
-        interests=TEST_INTERESTS,  # type: ignore[assignment]
-        password=SecretStr(pwd_context.hash(TEST_PASSWORD)),
-        is_active=True,
-    ).create()
-
-    assert test_user is not None, "Failed to create test user"
-
-    news_articles = [
-        NewsArticleModel(
-            title="The new PS6 is out",
-            content="The new PS6 is out now :)",
-            categories=["business", "technology"],
-        ),
-        NewsArticleModel(
-            title="NASA announces new Moon mission",
-            content="NASA has revealed plans for a new lunar mission set to launch in 2025, aiming to establish a sustainable human presence on the Moon.",
-            categories=["science"],
-        ),
-        NewsArticleModel(
-            title="Global markets rally after positive economic data",
-            content="Stock markets worldwide saw significant gains today following the release of better-than-expected economic growth figures.",
-            categories=["business"],
-        ),
-        NewsArticleModel(
-            title="Breakthrough in cancer research offers new hope",
-            content="Scientists have developed a promising new treatment that could significantly improve survival rates for certain types of cancer.",
-            categories=["health", "science"],
-        ),
-        NewsArticleModel(
-            title="Major update released for popular messaging app",
-            content="The latest update introduces end-to-end encryption and several new features to enhance user privacy and experience.",
-            categories=["technology"],
-        ),
-        NewsArticleModel(
-            title="Local community garden project flourishes",
-            content="Residents celebrate the success of a community garden initiative that has brought fresh produce and a sense of unity to the neighborhood.",
-            categories=["lifestyle"],
-        ),
+async def _insert_missing(documents: list[Document], natural_key: str) -> int:
+    """Insert the documents whose natural key is not stored yet, in one bulk write.
+
+    Returns:
+        int: The number of inserted documents.
+    """
+    if not documents:
+        return 0
+
+    collection = type(documents[0]).get_motor_collection()
+    keys = [getattr(document, natural_key) for document in documents]
+    existing = {
+        stored[natural_key]
+        async for stored in collection.find({natural_key: {"$in": keys}}, {natural_key: True})
+    }
+    missing = [
+        get_dict(document, to_db=True)
+        for document in documents
+        if getattr(document, natural_key) not in existing
     ]
+    if not missing:
+        return 0
+
+    try:
+        result = await collection.insert_many(missing, ordered=False)
+    except BulkWriteError as e:
+        # Another process inserted some of them in the meantime
+        if any(error["code"] != DUPLICATE_KEY_ERROR for error in e.details["writeErrors"]):
+            raise
+        return e.details["nInserted"]
+    return len(result.inserted_ids)
+
+
+async def seed_database() -> None:
+    """Insert the placeholder user and news articles that do not exist yet."""
+    users = []
+    if not await UserModel.find_one(UserModel.username == TEST_USERNAME):
+        # Only hashed when the user is missing, bcrypt is slow on purpose
+        users.append(
+            UserModel(
+                username=TEST_USERNAME,
+                email=TEST_EMAIL,
+                interests=TEST_INTERESTS,  # type: ignore[arg-type]
+                password=SecretStr(await password_hasher.hash(TEST_PASSWORD)),
+                is_active=True,
+            )
+        )
+    inserted_users = await _insert_missing(users, natural_key="username")
+
+    inserted_articles = await _insert_missing(
+        [NewsArticleModel(**article) for article in PLACEHOLDER_NEWS_ARTICLES],
+        natural_key="title",
+    )
+    logger.info(
+        "Seeded %d users and %d news articles", inserted_users, inserted_articles
+    )
+
+
+async def main() -> None:
+    from .mongodb import init_beanie, init_db_dev_connection
 
-    for article in news_articles:
-        assert await article.create(), "Failed to create news article"
-    print("Placeholder users and news articles created successfully.")
+    configure_logging()
+    database_client = init_db_dev_connection()
+    try:
+        await init_beanie(database_client)
+        await seed_database()
+    finally:
+        database_client.close()
 
 
-async def drop_placeholders() -> None:
-    """Drop placeholder users in the database."""
-    # Drop all users and news articles
-    await UserModel.delete_all()
-    await NewsArticleModel.delete_all()
-    print("Placeholder users and news articles dropped successfully.")
+if __name__ == "__main__":
+    asyncio.run(main())
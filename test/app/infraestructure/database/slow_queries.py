@@ -0,0 +1,191 @@
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from pymongo import monitoring
+
+from app.config import settings
+
+from ..monitoring import command_collection
+from .query_shapes import query_source
+
+logger = logging.getLogger(__name__)
+
+# Parts of a command that make up its shape
+_SHAPE_FIELDS = ("filter", "query", "sort", "pipeline", "update", "updates", "deletes", "key")
+# Parts kept as they are: sort directions and the field of a distinct
+_KEPT_FIELDS = ("sort", "key")
+# Batched writes, whose shape is the shape of their first statement
+_STATEMENT_LISTS = ("updates", "deletes")
+
+
+def _strip(value: Any) -> Any:
+    # Keys, i.e. operators and field names, are kept. Every scalar is
+    # replaced, even strings looking like field paths, which may be user input
+    if isinstance(value, dict):
+        return {
+            key: item if key == "$sort" else _strip(item) for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        # Pipelines and $and/$or clauses have a shape, value lists do not
+        if value and all(isinstance(item, dict) for item in value):
+            return [_strip(item) for item in value]
+        return "?"
+    return "?"
+
+
+def normalize_command(command: dict[str, Any]) -> dict[str, Any]:
+    """Shape of a command: its filters, sorts and pipelines with values stripped.
+
+    Args:
+        command (dict[str, Any]): The command document sent to the server.
+    """
+    shape: dict[str, Any] = {}
+    for field in _SHAPE_FIELDS:
+        if field not in command:
+            continue
+        value = command[field]
+        if field in _STATEMENT_LISTS and value:
+            value = value[0]
+        shape[field] = value if field in _KEPT_FIELDS else _strip(value)
+    return shape
+
+
+def _documents(command_name: str, reply: dict[str, Any]) -> int:
+    """Documents returned, or written, by a command according to its reply."""
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch", cursor.get("nextBatch", ())))
+    if command_name == "findAndModify":
+        return 1 if reply.get("value") else 0
+    return int(reply.get("n", 0))
+
+
+@dataclass
+class SlowQueryStats:
+    """Slow executions of one query shape, issued by one repository function."""
+
+    collection: str
+    command: str
+    source: Optional[str]
+    shape: dict[str, Any]
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    documents: int = 0
+    last_seen: Optional[datetime] = None
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+@dataclass
+class _Started:
+    collection: str
+    command: dict[str, Any]
+    source: Optional[str]
+
+
+class SlowQueryListener(monitoring.CommandListener):
+    """Records the MongoDB commands slower than a threshold, per query shape.
+
+    Commands are attributed to the repository function that ran them through
+    `query_source`. Slow commands are logged and aggregated in memory per
+    collection, command, shape and function; fast commands only cost keeping
+    their document until they finish. At most `max_shapes` shapes are kept,
+    further shapes are counted in `dropped`.
+    """
+
+    def __init__(self, threshold: Callable[[], float], max_shapes: int = 1000):
+        """
+        Args:
+            threshold (Callable[[], float]): Returns the duration above which a
+                command is slow, in seconds.
+            max_shapes (int): Maximum number of shapes aggregated.
+        """
+        self._threshold = threshold
+        self._max_shapes = max_shapes
+        self._started: dict[int, _Started] = {}
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str, str, Optional[str]], SlowQueryStats] = {}
+        self.dropped = 0
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self._started[event.request_id] = _Started(
+            collection=command_collection(event),
+            command=event.command,
+            source=query_source.get(),
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        started = self._started.pop(event.request_id, None)
+        if started is not None and event.duration_micros / 1e6 >= self._threshold():
+            self._record(started, event, _documents(event.command_name, event.reply))
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        started = self._started.pop(event.request_id, None)
+        if started is not None and event.duration_micros / 1e6 >= self._threshold():
+            self._record(started, event, 0)
+
+    def _record(
+        self,
+        started: _Started,
+        event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent,
+        documents: int,
+    ) -> None:
+        duration_ms = event.duration_micros / 1000
+        shape = normalize_command(started.command)
+        key = (
+            started.collection,
+            event.command_name,
+            json.dumps(shape, sort_keys=True, default=str),
+            started.source,
+        )
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= self._max_shapes:
+                    self.dropped += 1
+                    return
+                stats = self._stats[key] = SlowQueryStats(
+                    collection=started.collection,
+                    command=event.command_name,
+                    source=started.source,
+                    shape=shape,
+                )
+            stats.count += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.documents += documents
+            stats.last_seen = datetime.now(timezone.utc)
+
+        logger.warning(
+            "Slow %s on '%s' from %s: %.1f ms, %d documents",
+            event.command_name,
+            started.collection,
+            started.source,
+            duration_ms,
+            documents,
+            extra={"shape": shape},
+        )
+
+    def top(self, limit: int) -> list[SlowQueryStats]:
+        """The shapes with the most total time spent in slow executions."""
+        with self._lock:
+            stats = [SlowQueryStats(**vars(entry)) for entry in self._stats.values()]
+        return sorted(stats, key=lambda entry: entry.total_ms, reverse=True)[:limit]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.dropped = 0
+
+
+slow_queries = SlowQueryListener(
+    threshold=lambda: settings.slow_query_threshold_ms / 1000,
+    max_shapes=settings.slow_query_max_shapes,
+)
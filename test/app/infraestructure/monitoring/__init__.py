@@ -0,0 +1,28 @@
+from .metrics import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    metrics_registry,
+    render_family,
+)
+from .logs import configure_logging, stop_logging
+from .loop_watchdog import LoopWatchdog
+from .mongo_commands import CommandMetricsListener, command_collection, command_metrics
+
+__all__ = [
+    "CONTENT_TYPE",
+    "CommandMetricsListener",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "LoopWatchdog",
+    "MetricsRegistry",
+    "command_collection",
+    "command_metrics",
+    "configure_logging",
+    "metrics_registry",
+    "render_family",
+    "stop_logging",
+]
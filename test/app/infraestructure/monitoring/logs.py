@@ -0,0 +1,155 @@
+"""Logging of the process, written to stderr by a background thread.
+
+The root logger only has a `QueueHandler`: logging from a request costs a
+level check and, for enabled records, putting the record on a bounded queue.
+Messages are formatted by the listener thread, so callers must log with
+`%`-style arguments rather than pre-formatted strings. When the queue is
+full, records are dropped and counted instead of blocking the caller.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+
+from app.config import settings
+
+# Attributes of every LogRecord, the others were passed in `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, `extra` fields included."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps a share of the records below WARNING of some loggers.
+
+    The rate of a logger is the one configured for it or its closest
+    configured parent. Records at WARNING or above are always kept.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        super().__init__()
+        self._rates = rates
+        # Rate of every logger name seen, resolved once
+        self._resolved: dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            rate, parent = 1.0, name
+            while parent:
+                if parent in self._rates:
+                    rate = self._rates[parent]
+                    break
+                parent = parent.rpartition(".")[0]
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class StderrHandler(logging.StreamHandler):
+    """Writes to the current `sys.stderr`, even after it was replaced."""
+
+    def __init__(self) -> None:
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):  # type: ignore[override]
+        return sys.stderr
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records when the queue is full.
+
+    Records are put on the queue as they are: formatting is left to the
+    listener thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging() -> None:
+    """Route every log record through a queue to a background writer thread.
+
+    Levels, per-logger levels, sampling, output format and queue size come
+    from the settings. Calling it again replaces the previous configuration.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    stream_handler = StderrHandler()
+    stream_handler.setFormatter(
+        JsonFormatter() if settings.log_format == "json" else logging.Formatter(TEXT_FORMAT)
+    )
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    if settings.log_sampling:
+        queue_handler.addFilter(SamplingFilter(settings.log_sampling))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(settings.log_level)
+    for name, level in settings.log_levels.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """Write the records still queued and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Optional
+
+from .metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# Route label of the blocks that happened outside of a known request
+UNKNOWN_ROUTE = "<unknown>"
+
+loop_lag = metrics_registry.histogram(
+    "event_loop_lag_seconds",
+    "Delay of the event loop in running a callback that was due.",
+)
+loop_blocks = metrics_registry.counter(
+    "event_loop_blocks_total",
+    "Times the event loop was blocked longer than the watchdog threshold.",
+    ("route",),
+)
+
+
+class LoopWatchdog:
+    """Measures the scheduling lag of the event loop and reports what blocks it.
+
+    A heartbeat task sleeps for `interval` seconds in a loop and records how
+    late it wakes up. A sidecar thread checks on the heartbeat; once it is
+    late by more than `threshold` seconds, the loop thread is stuck in
+    synchronous code, and the thread logs that code's stack with the route
+    of the request being served. Each block is reported once.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        interval: float,
+        describe_task: Callable[[asyncio.Task], Optional[str]] = lambda task: None,
+    ):
+        """
+        Args:
+            threshold (float): Lag after which the loop is reported as blocked, in seconds.
+            interval (float): Time between two heartbeats, in seconds.
+            describe_task (Callable[[asyncio.Task], Optional[str]]): Returns the
+                route served by a task, if any. Called from the sidecar thread.
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self._describe_task = describe_task
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = 0.0
+        self._heartbeat: Optional[asyncio.Task] = None
+        self._sidecar: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start watching the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat = self._loop.create_task(self._beat())
+        self._sidecar = threading.Thread(
+            target=self._watch, name="loop-watchdog", daemon=True
+        )
+        self._sidecar.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and the sidecar thread."""
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+        if self._sidecar is not None:
+            self._sidecar.join()
+
+    async def _beat(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._last_beat = time.monotonic()
+            loop_lag.observe(max(0.0, self._last_beat - start - self.interval))
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stopped.wait(min(self.interval, self.threshold / 2)):
+            last_beat = self._last_beat
+            blocked = time.monotonic() - last_beat - self.interval
+            if blocked >= self.threshold and last_beat != reported_beat:
+                reported_beat = last_beat
+                self._report(blocked)
+
+    def _report(self, blocked: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)  # type: ignore[arg-type]
+        stack = "".join(traceback.format_stack(frame)) if frame else ""
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        route = (self._describe_task(task) if task else None) or UNKNOWN_ROUTE
+
+        loop_blocks.inc(route)
+        logger.warning(
+            "Event loop blocked for over %.0f ms serving %s, at:\n%s",
+            blocked * 1000,
+            route,
+            stack,
+            extra={"route": route, "blocked_ms": round(blocked * 1000)},
+        )
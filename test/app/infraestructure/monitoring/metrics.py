@@ -0,0 +1,227 @@
+"""Metrics exported in the Prometheus text exposition format.
+
+Recording takes no lock: every thread updates its own shard of a metric, and
+the shards are only summed when the metrics are scraped. A scrape may miss
+an update in progress, but no update is ever lost.
+"""
+
+import abc
+import bisect
+import math
+import threading
+from typing import Callable, Iterable, TypeVar
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+type Labels = tuple[str, ...]
+# A sample of a metric family: name suffix, labels and value
+type Sample = tuple[str, dict[str, str], float]
+
+
+M = TypeVar("M", bound="_Metric")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def render_family(
+    name: str, metric_type: str, documentation: str, samples: Iterable[Sample]
+) -> str:
+    """Render a metric family in the text exposition format.
+
+    Args:
+        name (str): The name of the family.
+        metric_type (str): The type of the family, e.g. `counter` or `histogram`.
+        documentation (str): The help text of the family.
+        samples (Iterable[Sample]): The samples of the family.
+    """
+    lines = [f"# HELP {name} {_escape(documentation)}", f"# TYPE {name} {metric_type}"]
+    for suffix, labels, value in samples:
+        label_set = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+        lines.append(
+            f"{name}{suffix}{{{label_set}}} {_format_value(value)}"
+            if label_set
+            else f"{name}{suffix} {_format_value(value)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class _Metric(abc.ABC):
+    """A metric family whose series are sharded per thread."""
+
+    metric_type: str
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._local = threading.local()
+        self._shards: list[dict] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            # Only taken the first time a thread records on this metric
+            with self._shards_lock:
+                self._shards.append(shard)
+            return shard
+
+    def _snapshots(self) -> list[dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        # Copying a dict is atomic under the GIL, iterating it is not
+        return [shard.copy() for shard in shards]
+
+    def _labels(self, values: Labels) -> dict[str, str]:
+        return dict(zip(self.label_names, values))
+
+    @abc.abstractmethod
+    def samples(self) -> Iterable[Sample]:
+        """The samples of every series, as rendered by `render_family`."""
+
+    def render(self) -> str:
+        return render_family(self.name, self.metric_type, self.documentation, self.samples())
+
+
+class Counter(_Metric):
+    """A monotonically increasing value per label set."""
+
+    metric_type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> dict[Labels, float]:
+        """The value of every series, summed over the threads."""
+        totals: dict[Labels, float] = {}
+        for shard in self._snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def samples(self) -> Iterable[Sample]:
+        for labels, value in sorted(self.values().items()):
+            yield "", self._labels(labels), value
+
+
+class Gauge(Counter):
+    """A value per label set that goes up and down."""
+
+    metric_type = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    """Counts of observations per bucket, with their sum, per label set."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        series = shard.get(labels)
+        if series is None:
+            # Count of each bucket, not cumulative, then +Inf, then the sum
+            series = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def values(self) -> dict[Labels, tuple[list[int], float]]:
+        """Cumulative bucket counts and sum of every series, summed over the threads."""
+        totals: dict[Labels, list] = {}
+        for shard in self._snapshots():
+            for labels, series in shard.items():
+                total = totals.setdefault(labels, [0] * len(series))
+                for index, value in enumerate(series):
+                    total[index] += value
+        cumulative = {}
+        for labels, total in totals.items():
+            counts, running = [], 0
+            for count in total[:-1]:
+                running += count
+                counts.append(running)
+            cumulative[labels] = (counts, total[-1])
+        return cumulative
+
+    def samples(self) -> Iterable[Sample]:
+        bounds = [*map(_format_value, self.buckets), "+Inf"]
+        for labels, (counts, total) in sorted(self.values().items()):
+            label_set = self._labels(labels)
+            for bound, count in zip(bounds, counts):
+                yield "_bucket", {**label_set, "le": bound}, count
+            yield "_sum", label_set, total
+            yield "_count", label_set, counts[-1]
+
+
+class MetricsRegistry:
+    """The metrics of the process, rendered together when scraped.
+
+    Values only known at scrape time, such as the counters of a cache, are
+    exported by collectors returning rendered families.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], Iterable[str]]] = []
+
+    def _register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Labels = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Labels = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Register a function returning families rendered with `render_family`."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Every metric of the process, in the text exposition format."""
+        families = [metric.render() for metric in self._metrics.values()]
+        for collector in self._collectors:
+            families.extend(collector())
+        return "".join(families)
+
+
+metrics_registry = MetricsRegistry()
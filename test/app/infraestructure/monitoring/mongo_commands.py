@@ -0,0 +1,78 @@
+from typing import Callable
+
+from pymongo import monitoring
+
+from .metrics import MetricsRegistry, metrics_registry
+
+# Receives the collection, command name, duration in seconds and success of a command
+type CommandObserver = Callable[[str, str, float, bool], None]
+
+
+def command_collection(event: monitoring.CommandStartedEvent) -> str:
+    """Collection a command runs against, empty for admin commands."""
+    # The command names its collection, e.g. {"find": "news_articles", ...},
+    # except getMore which names its cursor
+    if event.command_name == "getMore":
+        return str(event.command.get("collection", ""))
+    target = event.command.get(event.command_name)
+    return target if isinstance(target, str) else ""
+
+
+class CommandMetricsListener(monitoring.CommandListener):
+    """Records the latency of every MongoDB command, per collection and command.
+
+    The collection is only part of the started event, so it is kept by
+    request ID until the command finishes. Events are published from the
+    driver threads: the metrics are sharded per thread and single dict
+    operations are atomic, so no lock is taken.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        self._duration = registry.histogram(
+            "mongodb_command_duration_seconds",
+            "Latency of the MongoDB commands, failed ones included.",
+            ("collection", "command"),
+        )
+        self._failures = registry.counter(
+            "mongodb_command_failures_total",
+            "MongoDB commands that failed.",
+            ("collection", "command"),
+        )
+        self._collections: dict[int, str] = {}
+        self._observers: tuple[CommandObserver, ...] = ()
+
+    def add_observer(self, observer: CommandObserver) -> None:
+        """Also report every finished command to `observer`, from the driver threads.
+
+        Observers are kept in a tuple replaced on change, so publishing a
+        command iterates them without a lock.
+        """
+        self._observers = (*self._observers, observer)
+
+    def remove_observer(self, observer: CommandObserver) -> None:
+        self._observers = tuple(o for o in self._observers if o is not observer)
+
+    def _finished(
+        self,
+        event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent,
+        succeeded: bool,
+    ) -> None:
+        collection = self._collections.pop(event.request_id, "")
+        duration = event.duration_micros / 1e6
+        self._duration.observe(duration, collection, event.command_name)
+        if not succeeded:
+            self._failures.inc(collection, event.command_name)
+        for observer in self._observers:
+            observer(collection, event.command_name, duration, succeeded)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self._collections[event.request_id] = command_collection(event)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finished(event, succeeded=True)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._finished(event, succeeded=False)
+
+
+command_metrics = CommandMetricsListener(metrics_registry)
@@ -0,0 +1,3 @@
+from .inverted_index import InvertedIndex, tokenize
+
+__all__ = ["InvertedIndex", "tokenize"]
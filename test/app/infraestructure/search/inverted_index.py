@@ -0,0 +1,127 @@
+"""In-memory inverted index scoring documents like a MongoDB text index.
+
+Scores follow the algorithm of mongod's text index for a language without
+stemming nor stop words: for each field, every occurrence of a term adds
+`1 / 2^k` to its frequency (k being the number of previous occurrences in
+the field), the frequency is scaled by `0.5 * count / tokens + 0.5` and by
+the field weight, and boosted by 10% when the whole field is that term. The
+score of a document for a query is the sum of the scores of the distinct
+query terms it contains.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Generic, Hashable, Mapping, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def _normalize(text: str) -> str:
+    # Case and diacritic insensitive, like version 3 text indexes
+    decomposed = unicodedata.normalize("NFD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> list[str]:
+    """Split a text into normalized terms, on whitespace and punctuation.
+
+    Args:
+        text (str): The text to tokenize.
+
+    Returns:
+        list[str]: The terms, in order and with repetitions.
+    """
+    return _TOKEN.findall(_normalize(text))
+
+
+def _field_scores(text: str, weight: float) -> dict[str, float]:
+    tokens = tokenize(text)
+    if not tokens:
+        return {}
+
+    frequencies: dict[str, float] = defaultdict(float)
+    counts: dict[str, int] = defaultdict(int)
+    for token in tokens:
+        frequencies[token] += 1 / 2 ** counts[token]
+        counts[token] += 1
+
+    whole_field = _normalize(text)
+    scores = {}
+    for term, frequency in frequencies.items():
+        coefficient = 0.5 * counts[term] / len(tokens) + 0.5
+        score = weight * frequency * coefficient
+        if term == whole_field:
+            score *= 1.1
+        scores[term] = score
+    return scores
+
+
+class InvertedIndex(Generic[K]):
+    """Weighted full-text index of documents kept in memory.
+
+    Adding a document that is already indexed replaces it.
+    """
+
+    def __init__(self, weights: Mapping[str, float]):
+        """
+        Args:
+            weights (Mapping[str, float]): The indexed fields and their weight.
+        """
+        self._weights = dict(weights)
+        self._postings: dict[str, dict[K, float]] = defaultdict(dict)
+        self._terms: dict[K, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._terms
+
+    def add(self, key: K, fields: Mapping[str, str]) -> None:
+        """Index a document.
+
+        Args:
+            key (K): The key the document is returned under.
+            fields (Mapping[str, str]): The document fields; those without a weight are ignored.
+        """
+        self.remove(key)
+
+        scores: dict[str, float] = defaultdict(float)
+        for field, weight in self._weights.items():
+            for term, score in _field_scores(fields.get(field) or "", weight).items():
+                scores[term] += score
+
+        for term, score in scores.items():
+            self._postings[term][key] = score
+        self._terms[key] = list(scores)
+
+    def remove(self, key: K) -> None:
+        """Remove a document from the index, if it is indexed."""
+        for term in self._terms.pop(key, ()):
+            postings = self._postings[term]
+            del postings[key]
+            if not postings:
+                del self._postings[term]
+
+    def clear(self) -> None:
+        """Remove every document from the index."""
+        self._postings.clear()
+        self._terms.clear()
+
+    def search(self, query: str) -> dict[K, float]:
+        """Score the documents containing at least one term of a query.
+
+        Args:
+            query (str): The search terms.
+
+        Returns:
+            dict[K, float]: The text score of every matching document.
+        """
+        scores: dict[K, float] = defaultdict(float)
+        for term in dict.fromkeys(tokenize(query)):
+            for key, score in self._postings.get(term, {}).items():
+                scores[key] += score
+        return dict(scores)
@@ -0,0 +1,134 @@
+import asyncio
+from typing import Any, List, Optional
+from uuid import UUID
+
+from app.core.news.entities.news_article import (
+    CreateNewsArticleDto,
+    NewsArticle,
+    NewsArticleBulkCreateResult,
+    NewsArticleSearchCursor,
+    NewsArticleSearchHit,
+    UpdateNewsArticleDto,
+)
+from app.core.news.protocols.news_repository import NewsArticleRepository
+from app.infraestructure.database.models.news import TEXT_INDEX_WEIGHTS
+
+from .inverted_index import InvertedIndex
+
+
+class InMemorySearchNewsArticleRepository:
+    """Serves `search` from an in-memory inverted index, for the mongomock backend.
+
+    mongomock does not implement `$text` queries. This repository answers them
+    with an `InvertedIndex` weighted like the text index of the `news_articles`
+    collection, and ranks and pages the hits the same way as the MongoDB
+    implementation. Other methods are delegated to the wrapped repository.
+
+    The index is built from the wrapped repository on the first search and is
+    then kept in sync by the writes going through this repository, so it only
+    suits a single process owning the database, such as the test backend.
+    """
+
+    def __init__(self, repository: NewsArticleRepository, batch_size: int = 1000):
+        """
+        Args:
+            repository (NewsArticleRepository): The repository to wrap.
+            batch_size (int): The number of articles fetched per round trip while building the index.
+        """
+        self._repository = repository
+        self._batch_size = batch_size
+        self._index: InvertedIndex[UUID] = InvertedIndex(TEXT_INDEX_WEIGHTS)
+        self._articles: dict[UUID, NewsArticle] = {}
+        self._built = False
+        self._build_lock = asyncio.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._repository, name)
+
+    def _add(self, news_article: NewsArticle) -> None:
+        if self._built:
+            self._articles[news_article.id] = news_article
+            self._index.add(
+                news_article.id, news_article.model_dump(include=set(TEXT_INDEX_WEIGHTS))
+            )
+
+    def _remove(self, id: UUID) -> None:
+        self._articles.pop(id, None)
+        self._index.remove(id)
+
+    async def _ensure_built(self) -> None:
+        if self._built:
+            return
+        async with self._build_lock:
+            if self._built:
+                return
+            self._built = True
+            async for news_article in self._repository.iter_by_category(
+                category=None, since=None, batch_size=self._batch_size
+            ):
+                self._add(news_article)
+
+    async def create(self, dto: CreateNewsArticleDto) -> NewsArticle:
+        news_article = await self._repository.create(dto)
+        self._add(news_article)
+        return news_article
+
+    async def create_many(
+        self, dtos: List[CreateNewsArticleDto]
+    ) -> List[NewsArticleBulkCreateResult]:
+        results = await self._repository.create_many(dtos)
+        for result in results:
+            if result.article is not None:
+                self._add(result.article)
+        return results
+
+    async def update(
+        self, id: UUID, dto: UpdateNewsArticleDto, expected_version: Optional[int] = None
+    ) -> Optional[NewsArticle]:
+        news_article = await self._repository.update(
+            id=id, dto=dto, expected_version=expected_version
+        )
+        if news_article is not None:
+            self._add(news_article)
+        return news_article
+
+    async def remove(self, id: UUID) -> Optional[NewsArticle]:
+        news_article = await self._repository.remove(id=id)
+        self._remove(id)
+        return news_article
+
+    async def remove_many(
+        self, ids: Optional[List[UUID]] = None, category: Optional[str] = None
+    ) -> int:
+        deleted_count = await self._repository.remove_many(ids=ids, category=category)
+        if ids is None:
+            ids = [
+                id
+                for id, news_article in self._articles.items()
+                if category in news_article.categories
+            ]
+        for id in ids:
+            self._remove(id)
+        return deleted_count
+
+    async def search(
+        self,
+        query: str,
+        category: str | List[str] | None,
+        limit: int,
+        after: Optional[NewsArticleSearchCursor],
+    ) -> List[NewsArticleSearchHit]:
+        await self._ensure_built()
+
+        categories = {category} if isinstance(category, str) else set(category or ())
+        hits = []
+        for id, score in self._index.search(query).items():
+            news_article = self._articles[id]
+            if categories and categories.isdisjoint(news_article.categories):
+                continue
+            if after and (score, id) >= (after.score, after.id):
+                continue
+            hits.append(NewsArticleSearchHit(article=news_article, score=score))
+
+        hits.sort(key=lambda hit: (hit.score, hit.article.id), reverse=True)
+        return hits[:limit]
@@ -0,0 +1,85 @@
+"""Production entry point: serves the API from several uvicorn worker processes.
+
+Workers are spawned processes that import the application themselves, so
+every cache, thread pool and database connection pool is created inside the
+worker that uses it, never inherited from the parent. The parent only reads
+the settings. Settings values such as cache sizes and `mongo_max_pool_size`
+apply to each worker.
+
+Usage:
+    uv run python -m app.server
+"""
+
+import importlib.util
+import os
+from typing import Any
+
+import uvicorn
+
+from app.config import settings
+from app.infraestructure.monitoring import configure_logging
+
+APP = "app.api:app"
+
+
+def _available(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def worker_count() -> int:
+    """Number of worker processes to run, the number of CPUs by default."""
+    return settings.server_workers or os.cpu_count() or 1
+
+
+def worker_environment(workers: int) -> dict[str, str]:
+    """Settings overrides the workers inherit through their environment.
+
+    Args:
+        workers (int): The number of worker processes.
+    """
+    environment = {}
+    if settings.mongo_connection_budget is not None:
+        environment["MONGO_MAX_POOL_SIZE"] = str(
+            max(1, settings.mongo_connection_budget // workers)
+        )
+    return environment
+
+
+def uvicorn_options(workers: int) -> dict[str, Any]:
+    """Options of `uvicorn.run`, from the settings.
+
+    uvloop and httptools are used when they are installed.
+
+    Args:
+        workers (int): The number of worker processes.
+    """
+    return {
+        "host": settings.server_host,
+        "port": settings.server_port,
+        "workers": workers,
+        "loop": "uvloop" if _available("uvloop") else "asyncio",
+        "http": "httptools" if _available("httptools") else "h11",
+        "lifespan": "on",
+        # uvicorn's loggers propagate to the queue handler of the worker
+        "log_config": None,
+        "backlog": settings.server_backlog,
+        "timeout_keep_alive": settings.server_keep_alive_seconds,
+        "timeout_graceful_shutdown": settings.server_graceful_shutdown_seconds,
+        "limit_concurrency": settings.server_limit_concurrency,
+        "proxy_headers": True,
+        "forwarded_allow_ips": settings.server_forwarded_allow_ips,
+        "reload": False,
+    }
+
+
+def main() -> None:
+    configure_logging()
+    workers = worker_count()
+    # Inherited by the spawned workers, which read their settings on import
+    os.environ.update(worker_environment(workers))
+
+    uvicorn.run(APP, **uvicorn_options(workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+"""Benchmarks for the hot paths of the application.
+
+Every benchmark runs against the in-memory mongomock backend, so no database
+is needed. Run them from the project root, e.g.:
+
+    uv run python -m benchmarks.conversion
+"""
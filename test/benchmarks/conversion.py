@@ -0,0 +1,75 @@
+"""Per-document cost of turning a stored news article into a core entity.
+
+Compares the previous path (Beanie parse, `model_dump` and a second validation
+of the entity) with the trusted construction in `converters`.
+
+Usage:
+    uv run python -m benchmarks.conversion [--documents 100] [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import timeit
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from bson import Binary
+
+from app.config import settings
+
+settings.testing = True
+
+from app.core.news.entities.news_article import NewsArticle  # noqa: E402
+from app.infraestructure.database.converters import news_article_from_document  # noqa: E402
+from app.infraestructure.database.models import NewsArticleModel  # noqa: E402
+from app.infraestructure.database.mongodb import init_beanie, init_test_connection  # noqa: E402
+
+
+def build_documents(count: int) -> list[dict]:
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return [
+        {
+            "_id": Binary.from_uuid(uuid4()),
+            "title": f"Article {i}",
+            "content": "Lorem ipsum dolor sit amet. " * 8,
+            "categories": ["technology", "business"],
+            "created_at": now,
+            "updated_at": now,
+        }
+        for i in range(count)
+    ]
+
+
+def revalidating(documents: list[dict]) -> list[NewsArticle]:
+    return [
+        NewsArticle(**NewsArticleModel.model_validate(document).model_dump())
+        for document in documents
+    ]
+
+
+def trusted(documents: list[dict]) -> list[NewsArticle]:
+    return [news_article_from_document(document) for document in documents]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=100, help="documents per page")
+    parser.add_argument("--repeat", type=int, default=200, help="pages converted per run")
+    args = parser.parse_args()
+
+    asyncio.run(init_beanie(init_test_connection()))
+    documents = build_documents(args.documents)
+    assert revalidating(documents) == trusted(documents)
+
+    converted = args.documents * args.repeat
+    results = {}
+    for name, fn in (("revalidating", revalidating), ("trusted", trusted)):
+        seconds = min(timeit.repeat(lambda: fn(documents), number=args.repeat, repeat=5))
+        results[name] = seconds / converted * 1e6
+        print(f"{name:>13}: {results[name]:8.2f} us/document")
+
+    print(f"      speedup: {results['revalidating'] / results['trusted']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""Throughput and latency of every route under a realistic request mix.
+
+Drives the app in-process over httpx's ASGITransport with the mongomock
+backend, after seeding a synthetic data set. Each of `--concurrency` clients
+replays the route mix until `--requests` requests were sent in total, after
+`--warmup` requests that are not measured. Data and request sequence only
+depend on `--seed`, so runs with the same arguments are comparable across
+commits. The report is printed as JSON.
+
+mongomock runs every query on the event loop thread, holding the GIL, so
+work offloaded to threads such as password hashing in `/users/auth` waits
+much longer than against a real MongoDB server. Compare routes across
+commits, not against production latencies.
+
+Usage:
+    uv run python -m benchmarks.load_test [--articles 5000] [--users 100]
+        [--requests 5000] [--concurrency 16] [--mix news=30,auth=1] [--output report.json]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, get_args
+from uuid import UUID
+
+import httpx
+from pydantic import SecretStr
+
+from app.config import settings
+
+settings.testing = True
+settings.seed_database = True
+# Keep per-request logging out of the measurements
+settings.log_level = "WARNING"
+
+from app import app  # noqa: E402
+from app.api.auth import password_hasher  # noqa: E402
+from app.core.news.entities.news_article import NewsCategory  # noqa: E402
+from app.core.users.entities.user import UserInterests  # noqa: E402
+from app.infraestructure.database.models import NewsArticleModel, UserModel  # noqa: E402
+
+PASSWORD = "benchmark-password"
+CATEGORIES: tuple[str, ...] = get_args(NewsCategory)
+INTERESTS: tuple[str, ...] = get_args(UserInterests)
+
+# Relative weight of each route in the default request mix
+DEFAULT_MIX = {
+    "auth": 1,
+    "news": 25,
+    "news_by_category": 15,
+    "news_next_page": 10,
+    "news_user_interests": 20,
+    "news_by_id": 25,
+    "add_interest": 2,
+    "remove_interest": 2,
+}
+
+
+class Client:
+    """A simulated user, authenticated once and replaying the route mix."""
+
+    def __init__(self, http: httpx.AsyncClient, user_id: UUID, username: str, token: str):
+        self.http = http
+        self.user_id = user_id
+        self.username = username
+        self.headers = {"Authorization": f"Bearer {token}"}
+        self.cursor: str | None = None
+
+
+async def seed(articles: int, users: int, rng: random.Random) -> tuple[list[UUID], list[tuple[UUID, str]]]:
+    """Insert the synthetic news articles and users, in bulk."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    article_ids = []
+    batch = []
+    for index in range(articles):
+        created_at = start + timedelta(minutes=index)
+        article = NewsArticleModel(
+            id=UUID(int=rng.getrandbits(128), version=4),
+            title=f"Article {index} about {rng.choice(CATEGORIES)}",
+            content=" ".join(rng.choice(CATEGORIES) for _ in range(20)),
+            categories=rng.sample(CATEGORIES, k=rng.randint(1, 3)),  # type: ignore[arg-type]
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        article_ids.append(article.id)
+        batch.append(article)
+        if len(batch) == 1000:
+            await NewsArticleModel.insert_many(batch)
+            batch = []
+    if batch:
+        await NewsArticleModel.insert_many(batch)
+
+    # Every user shares the same password, so it is hashed once
+    password = SecretStr(await password_hasher.hash(PASSWORD))
+    accounts = [
+        UserModel(
+            id=UUID(int=rng.getrandbits(128), version=4),
+            username=f"user{index}",
+            email=f"user{index}@example.com",
+            password=password,
+            interests=rng.sample(INTERESTS, k=rng.randint(1, len(INTERESTS))),  # type: ignore[arg-type]
+        )
+        for index in range(users)
+    ]
+    if accounts:
+        await UserModel.insert_many(accounts)
+    return article_ids, [(account.id, account.username) for account in accounts]
+
+
+Operation = Callable[[Client, random.Random], Awaitable[httpx.Response]]
+
+
+def build_operations(article_ids: list[UUID]) -> dict[str, Operation]:
+    """The requests of the route mix, by route name.
+
+    Each request draws its parameters from its own random generator.
+    """
+
+    async def auth(client: Client, rng: random.Random) -> httpx.Response:
+        return await client.http.post(
+            "/users/auth", data={"username": client.username, "password": PASSWORD}
+        )
+
+    async def news(client: Client, rng: random.Random) -> httpx.Response:
+        response = await client.http.get("/news/", headers=client.headers, params={"limit": 20})
+        client.cursor = response.headers.get("X-Next-Cursor")
+        return response
+
+    async def news_by_category(client: Client, rng: random.Random) -> httpx.Response:
+        params = {"category": rng.choice(CATEGORIES), "limit": 20}
+        return await client.http.get("/news/", headers=client.headers, params=params)
+
+    async def news_next_page(client: Client, rng: random.Random) -> httpx.Response:
+        params: dict = {"limit": 20}
+        if client.cursor:
+            params["cursor"] = client.cursor
+        response = await client.http.get("/news/", headers=client.headers, params=params)
+        client.cursor = response.headers.get("X-Next-Cursor")
+        return response
+
+    async def news_user_interests(client: Client, rng: random.Random) -> httpx.Response:
+        return await client.http.get(
+            "/news/user-interests", headers=client.headers, params={"limit": 20}
+        )
+
+    async def news_by_id(client: Client, rng: random.Random) -> httpx.Response:
+        return await client.http.get(f"/news/{rng.choice(article_ids)}", headers=client.headers)
+
+    async def add_interest(client: Client, rng: random.Random) -> httpx.Response:
+        return await client.http.post(
+            f"/users/{client.user_id}/interests/{rng.choice(INTERESTS)}", headers=client.headers
+        )
+
+    async def remove_interest(client: Client, rng: random.Random) -> httpx.Response:
+        return await client.http.delete(
+            f"/users/{client.user_id}/interests/{rng.choice(INTERESTS)}", headers=client.headers
+        )
+
+    return {
+        "auth": auth,
+        "news": news,
+        "news_by_category": news_by_category,
+        "news_next_page": news_next_page,
+        "news_user_interests": news_user_interests,
+        "news_by_id": news_by_id,
+        "add_interest": add_interest,
+        "remove_interest": remove_interest,
+    }
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, value.split(",")):
+        route, _, weight = item.partition("=")
+        if route not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(
+                f"Unknown route {route!r}, expected one of {list(DEFAULT_MIX)}"
+            )
+        mix[route] = int(weight)
+    return mix
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    latencies = sorted(latencies)
+    if len(latencies) > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    async with app.router.lifespan_context(app):
+        article_ids, users = await seed(args.articles, args.users, rng)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            clients = []
+            for index in range(args.concurrency):
+                user_id, username = users[index % len(users)]
+                response = await http.post(
+                    "/users/auth", data={"username": username, "password": PASSWORD}
+                )
+                clients.append(Client(http, user_id, username, response.json()["access_token"]))
+
+            operations = build_operations(article_ids)
+            routes = [route for route, weight in args.mix.items() if weight > 0]
+            weights = [args.mix[route] for route in routes]
+            # Drawn upfront, so the requests do not depend on scheduling
+            plan = [
+                (route, rng.getrandbits(64))
+                for route in rng.choices(routes, weights=weights, k=args.warmup + args.requests)
+            ]
+
+            latencies: dict[str, list[float]] = defaultdict(list)
+            errors: dict[str, int] = defaultdict(int)
+            next_request = 0
+            measure_from = time.perf_counter()
+
+            async def replay(client: Client) -> None:
+                nonlocal next_request, measure_from
+                while next_request < len(plan):
+                    index = next_request
+                    next_request += 1
+                    if index == args.warmup:
+                        measure_from = time.perf_counter()
+
+                    route, request_seed = plan[index]
+                    start = time.perf_counter()
+                    response = await operations[route](client, random.Random(request_seed))
+                    if index < args.warmup:
+                        continue
+                    latencies[route].append(time.perf_counter() - start)
+                    if response.status_code >= 500:
+                        errors[route] += 1
+
+            await asyncio.gather(*(replay(client) for client in clients))
+            elapsed = time.perf_counter() - measure_from
+
+    return {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "config": {
+            "articles": args.articles,
+            "users": args.users,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "mix": args.mix,
+        },
+        "elapsed_seconds": round(elapsed, 3),
+        "total": summarize(
+            [latency for values in latencies.values() for latency in values],
+            sum(errors.values()),
+            elapsed,
+        ),
+        "routes": {
+            route: summarize(latencies[route], errors[route], elapsed) for route in sorted(latencies)
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=5000, help="synthetic news articles")
+    parser.add_argument("--users", type=int, default=100, help="synthetic users")
+    parser.add_argument("--requests", type=int, default=5000, help="measured requests")
+    parser.add_argument("--warmup", type=int, default=500, help="unmeasured requests sent first")
+    parser.add_argument("--concurrency", type=int, default=16, help="concurrent clients")
+    parser.add_argument("--seed", type=int, default=42, help="seed of the data and request mix")
+    parser.add_argument(
+        "--mix", type=parse_mix, default=dict(DEFAULT_MIX), help="route weights, e.g. news=30,auth=0"
+    )
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
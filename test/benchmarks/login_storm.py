@@ -0,0 +1,110 @@
+"""Latency of GET /news/ while a storm of logins hits /users/auth.
+
+Drives the app in-process over httpx's ASGITransport with the mongomock
+backend. `--blocking` verifies passwords inline on the event loop, as the
+app did before hashing moved to a dedicated executor, for comparison.
+
+Usage:
+    uv run python -m benchmarks.login_storm [--logins 8] [--readers 8] [--duration 5]
+        [--interval-ms 50] [--blocking]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from pydantic import SecretStr
+
+from app.config import settings
+
+settings.testing = True
+settings.seed_database = True
+
+from app import app  # noqa: E402
+from app.api.auth import pwd_context  # noqa: E402
+from app.api.routes import users as users_routes  # noqa: E402
+from app.infraestructure.database.seed import TEST_PASSWORD, TEST_USERNAME  # noqa: E402
+
+CREDENTIALS = {"username": TEST_USERNAME, "password": TEST_PASSWORD}
+
+
+async def blocking_verify_password(plain_password: SecretStr, hashed_password: SecretStr):
+    valid, new_hash = pwd_context.verify_and_update(
+        plain_password.get_secret_value(), hashed_password.get_secret_value()
+    )
+    return valid, SecretStr(new_hash) if new_hash else None
+
+
+async def login_loop(client: httpx.AsyncClient, deadline: float, statuses: list[int]) -> None:
+    while time.perf_counter() < deadline:
+        response = await client.post("/users/auth", data=CREDENTIALS)
+        statuses.append(response.status_code)
+
+
+async def read_loop(
+    client: httpx.AsyncClient,
+    token: str,
+    deadline: float,
+    interval: float,
+    latencies: list[float],
+) -> None:
+    headers = {"Authorization": f"Bearer {token}"}
+    # Requests are sent at a fixed rate and timed from when they were due, so
+    # time spent waiting on a blocked event loop counts as latency
+    due = time.perf_counter()
+    while due < deadline:
+        await asyncio.sleep(max(0.0, due - time.perf_counter()))
+        response = await client.get("/news/", headers=headers, params={"limit": 10})
+        latencies.append(time.perf_counter() - due)
+        assert response.status_code == 200
+        due += interval
+
+
+def percentile(values: list[float], q: float) -> float:
+    return statistics.quantiles(values, n=1000)[round(q * 10) - 1] * 1000
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.blocking:
+        users_routes.verify_password = blocking_verify_password  # type: ignore[assignment]
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            token = (await client.post("/users/auth", data=CREDENTIALS)).json()["access_token"]
+
+            latencies: list[float] = []
+            statuses: list[int] = []
+            deadline = time.perf_counter() + args.duration
+            await asyncio.gather(
+                *(login_loop(client, deadline, statuses) for _ in range(args.logins)),
+                *(
+                    read_loop(client, token, deadline, args.interval_ms / 1000, latencies)
+                    for _ in range(args.readers)
+                ),
+            )
+
+    mode = "blocking" if args.blocking else "executor"
+    print(f"mode: {mode}, bcrypt rounds: {settings.bcrypt_rounds}")
+    print(f"logins: {len(statuses)} ({statuses.count(503)} rejected with 503)")
+    print(
+        f"GET /news/: {len(latencies)} requests, "
+        f"p50 {percentile(latencies, 50):.1f} ms, p99 {percentile(latencies, 99):.1f} ms, "
+        f"p99.9 {percentile(latencies, 99.9):.1f} ms, max {max(latencies) * 1000:.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=8, help="concurrent login loops")
+    parser.add_argument("--readers", type=int, default=8, help="concurrent /news readers")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--interval-ms", type=float, default=50.0, help="time between reads")
+    parser.add_argument("--blocking", action="store_true", help="verify on the event loop")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Time spent serializing a page of news articles into a JSON response body.
+
+Compares FastAPI's default path (response model validation, `jsonable_encoder`
+and `json.dumps` in `JSONResponse`) with `json_response`, which dumps the
+entities to bytes with a cached `TypeAdapter`.
+
+Usage:
+    uv run python -m benchmarks.serialization [--articles 100] [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from bson import Binary
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.config import settings
+
+settings.testing = True
+
+from app.api.responses import json_response  # noqa: E402
+from app.core.news.entities.news_article import NewsArticle  # noqa: E402
+from app.infraestructure.database.converters import news_article_from_document  # noqa: E402
+
+
+def build_articles(count: int) -> list[NewsArticle]:
+    # Built the way the repositories return them
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return [
+        news_article_from_document(
+            {
+                "_id": Binary.from_uuid(uuid4()),
+                "title": f"Article {i}",
+                "content": "Lorem ipsum dolor sit amet. " * 8,
+                "categories": ["technology", "business"],
+                "created_at": now,
+                "updated_at": now,
+                "version": 0,
+            }
+        )
+        for i in range(count)
+    ]
+
+
+async def time_per_page(fn, articles: list[NewsArticle], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            await fn(articles)
+        best = min(best, time.perf_counter() - start)
+    return best / repeat * 1e6
+
+
+async def run(args: argparse.Namespace) -> None:
+    field = create_model_field("Response_get_news", list[NewsArticle], mode="serialization")
+
+    async def default(articles: list[NewsArticle]) -> bytes:
+        content = await serialize_response(field=field, response_content=articles)
+        return JSONResponse(content).body
+
+    async def fast_path(articles: list[NewsArticle]) -> bytes:
+        return json_response(articles, list[NewsArticle]).body
+
+    articles = build_articles(args.articles)
+    assert json.loads(await default(articles)) == json.loads(await fast_path(articles))
+
+    results = {}
+    for name, fn in (("default", default), ("fast path", fast_path)):
+        results[name] = await time_per_page(fn, articles, args.repeat)
+        print(f"{name:>10}: {results[name]:8.1f} us/page of {args.articles} articles")
+
+    print(f"   speedup: {results['default'] / results['fast path']:8.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100, help="articles per page")
+    parser.add_argument("--repeat", type=int, default=200, help="pages serialized per run")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,21 @@
 Pytest fixtures
 """
 
+import os
 from typing import Iterator
 
 import pytest
 from fastapi.testclient import TestClient
 
-from app.api import app
-from app.config import settings
-from app.infraestructure.database.seed import TEST_PASSWORD, TEST_USERNAME
+# Set before the app is imported, as its dependency container is built on import
+os.environ["TESTING"] = "true"
+os.environ["SEED_DATABASE"] = "true"
+# Records are written by a background thread, outside pytest's capture
+os.environ["LOG_LEVEL"] = "WARNING"
+
+from app.api import app  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.infraestructure.database.seed import TEST_PASSWORD, TEST_USERNAME  # noqa: E402
 
 settings.testing = True
 
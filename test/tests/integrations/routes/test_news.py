@@ -1,3 +1,4 @@
+import json
 import random
 from typing import get_args
 import pytest
@@ -103,4 +104,318 @@ def test_create_news_article(test_client: TestClient, bearer_token: str) -> None
     assert data["title"] == payload["title"]
     assert data["content"] == payload["content"]
     assert data["categories"] == payload["categories"]
-    assert "id" in data, "The response should contain an 'id' field"
\ No newline at end of file
+    assert "id" in data, "The response should contain an 'id' field"
+
+@pytest.mark.order(6)
+def test_get_news_with_cursor(test_client: TestClient, bearer_token: str) -> None:
+    """Test that paging with the X-Next-Cursor header walks the same order as skip/limit."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    response = test_client.get("/news/", headers=headers, params={"limit": 100})
+    assert response.status_code == 200
+    expected_ids = [article["id"] for article in response.json()]
+    assert "X-Next-Cursor" not in response.headers
+
+    seen_ids: list[str] = []
+    params: dict = {"limit": 2}
+    while True:
+        response = test_client.get("/news/", headers=headers, params=params)
+        assert response.status_code == 200
+        seen_ids.extend(article["id"] for article in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    assert seen_ids == expected_ids
+
+
+@pytest.mark.order(7)
+def test_get_news_with_invalid_cursor(test_client: TestClient, bearer_token: str) -> None:
+    """Test that a malformed cursor or a cursor combined with skip is rejected."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    response = test_client.get("/news/", headers=headers, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    response = test_client.get("/news/", headers=headers, params={"limit": 1})
+    next_cursor = response.headers["X-Next-Cursor"]
+    response = test_client.get(
+        "/news/", headers=headers, params={"skip": 1, "cursor": next_cursor}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.order(8)
+def test_get_news_by_id_is_cached(test_client: TestClient, news_id: str, bearer_token: str) -> None:
+    """Test that repeated and missing lookups are served from the article cache."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    missing_id = str(uuid4())
+    test_client.get(f"/news/{news_id}", headers=headers)
+    test_client.get(f"/news/{missing_id}", headers=headers)
+    before = test_client.get("/health/caches").json()["news_articles"]
+
+    assert test_client.get(f"/news/{news_id}", headers=headers).status_code == 200
+    assert test_client.get(f"/news/{missing_id}", headers=headers).status_code == 404
+
+    after = test_client.get("/health/caches").json()["news_articles"]
+    assert after["hits"] == before["hits"] + 2
+    assert after["misses"] == before["misses"]
+
+
+@pytest.mark.order(9)
+def test_update_news_article_invalidates_cache(
+    test_client: TestClient, news_id: str, bearer_token: str
+) -> None:
+    """Test that a cached article is refreshed after it is updated."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    test_client.get(f"/news/{news_id}", headers=headers)
+    response = test_client.patch(
+        f"/news/{news_id}",
+        headers=headers,
+        json={"title": "Cached Title", "content": "Cached Content"},
+    )
+    assert response.status_code == 200
+
+    response = test_client.get(f"/news/{news_id}", headers=headers)
+    assert response.json()["title"] == "Cached Title"
+
+
+@pytest.mark.order(10)
+def test_update_news_article_with_if_match(
+    test_client: TestClient, news_id: str, bearer_token: str
+) -> None:
+    """Test that a stale If-Match version is rejected with 412."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    version = test_client.get(f"/news/{news_id}", headers=headers).json()["version"]
+    update_data = {"title": "Versioned Title", "content": "Versioned Content"}
+
+    response = test_client.patch(
+        f"/news/{news_id}", headers={**headers, "If-Match": f'"{version}"'}, json=update_data
+    )
+    assert response.status_code == 200
+    assert response.json()["version"] == version + 1
+
+    response = test_client.patch(
+        f"/news/{news_id}", headers={**headers, "If-Match": f'"{version}"'}, json=update_data
+    )
+    assert response.status_code == 412
+
+    response = test_client.patch(
+        f"/news/{uuid4()}", headers={**headers, "If-Match": '"0"'}, json=update_data
+    )
+    assert response.status_code == 412
+
+
+@pytest.mark.order(10)
+def test_update_news_article_with_the_etag_as_if_match(
+    test_client: TestClient, news_id: str, bearer_token: str
+) -> None:
+    """Test that the ETag of GET is accepted as If-Match, and that PATCH returns the next one."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    etag = test_client.get(f"/news/{news_id}", headers=headers).headers["ETag"]
+    update_data = {"title": "ETag Title", "content": "ETag Content"}
+
+    response = test_client.patch(
+        f"/news/{news_id}", headers={**headers, "If-Match": etag}, json=update_data
+    )
+    assert response.status_code == 200
+    new_etag = response.headers["ETag"]
+    assert new_etag != etag
+    assert test_client.get(f"/news/{news_id}", headers=headers).headers["ETag"] == new_etag
+
+    response = test_client.patch(
+        f"/news/{news_id}", headers={**headers, "If-Match": etag}, json=update_data
+    )
+    assert response.status_code == 412
+    response = test_client.patch(
+        f"/news/{uuid4()}", headers={**headers, "If-Match": new_etag}, json=update_data
+    )
+    assert response.status_code == 412
+    response = test_client.patch(
+        f"/news/{news_id}", headers={**headers, "If-Match": '"latest"'}, json=update_data
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.order(11)
+def test_bulk_create_batch_get_and_bulk_delete(test_client: TestClient, bearer_token: str) -> None:
+    """Test creating, fetching and deleting news articles in batches."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    payload = [
+        {"title": "Bulk 1", "content": "Bulk content", "categories": ["travel"]},
+        {"title": "Bulk 2", "content": "x" * 300, "categories": ["travel"]},
+        {"title": "Bulk 3", "content": "Bulk content", "categories": ["travel", "food"]},
+    ]
+    response = test_client.post("/news/bulk", headers=headers, json=payload)
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert results[0]["article"]["title"] == "Bulk 1"
+    assert results[1]["article"] is None and results[1]["error"]
+    created_ids = [results[2]["article"]["id"], results[0]["article"]["id"]]
+
+    missing_id = str(uuid4())
+    response = test_client.post(
+        "/news/batch-get", headers=headers, json={"ids": [*created_ids, missing_id]}
+    )
+    assert response.status_code == 200
+    articles = response.json()
+    assert [article["id"] for article in articles[:2]] == created_ids
+    assert articles[2] is None
+
+    response = test_client.request(
+        "DELETE", "/news/bulk", headers=headers, json={"ids": created_ids[:1]}
+    )
+    assert response.json()["deleted_count"] == 1
+
+    response = test_client.request(
+        "DELETE", "/news/bulk", headers=headers, json={"category": "travel"}
+    )
+    assert response.json()["deleted_count"] == 1
+
+    response = test_client.post("/news/batch-get", headers=headers, json={"ids": created_ids})
+    assert response.json() == [None, None]
+
+    response = test_client.request(
+        "DELETE", "/news/bulk", headers=headers, json={"ids": created_ids, "category": "travel"}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.order(12)
+def test_export_news(test_client: TestClient, bearer_token: str) -> None:
+    """Test that GET /news/export streams every article as NDJSON, oldest first."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    response = test_client.get("/news/", headers=headers, params={"limit": 100})
+    newest_first = response.json()
+
+    response = test_client.get("/news/export", headers=headers, params={"batch_size": 2})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert [article["id"] for article in exported] == [
+        article["id"] for article in reversed(newest_first)
+    ]
+
+    since = exported[-1]["created_at"]
+    response = test_client.get(
+        "/news/export", headers=headers, params={"since": since, "category": "sports"}
+    )
+    for line in response.text.splitlines():
+        article = json.loads(line)
+        assert article["created_at"] >= since
+        assert "sports" in article["categories"]
+
+
+@pytest.mark.order(13)
+def test_search_news(test_client: TestClient, bearer_token: str) -> None:
+    """Test that GET /news/search ranks title matches first, filters and pages with a cursor."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    payload = [
+        {"title": "Volcano erupts", "content": "Lava reached the coast", "categories": ["science"]},
+        {"title": "Island travel", "content": "Hiking up a volcano", "categories": ["travel"]},
+        {"title": "Volcano tours", "content": "Volcano hikes at dawn", "categories": ["travel"]},
+    ]
+    response = test_client.post("/news/bulk", headers=headers, json=payload)
+    ids = [result["article"]["id"] for result in response.json()]
+
+    response = test_client.get("/news/search", headers=headers, params={"q": "VOLCANO"})
+    assert response.status_code == 200
+    hits = response.json()
+    assert [hit["article"]["id"] for hit in hits] == [ids[2], ids[0], ids[1]]
+    assert hits[0]["score"] > hits[1]["score"] > hits[2]["score"]
+
+    response = test_client.get(
+        "/news/search", headers=headers, params={"q": "volcano", "category": "travel", "limit": 1}
+    )
+    assert [hit["article"]["id"] for hit in response.json()] == [ids[2]]
+    response = test_client.get(
+        "/news/search",
+        headers=headers,
+        params={"q": "volcano", "category": "travel", "cursor": response.headers["X-Next-Cursor"]},
+    )
+    assert [hit["article"]["id"] for hit in response.json()] == [ids[1]]
+    assert "X-Next-Cursor" not in response.headers
+
+    test_client.delete(f"/news/{ids[2]}", headers=headers)
+    response = test_client.get("/news/search", headers=headers, params={"q": "tours"})
+    assert response.json() == []
+
+    response = test_client.get(
+        "/news/search", headers=headers, params={"q": "volcano", "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.order(14)
+def test_facets_and_total_count(test_client: TestClient, bearer_token: str) -> None:
+    """Test category counts and X-Total-Count, and that writes refresh them."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    response = test_client.get("/news/", headers=headers, params={"limit": 100, "exact_count": True})
+    total = int(response.headers["X-Total-Count"])
+    assert total == len(response.json())
+
+    response = test_client.get("/news/facets", headers=headers)
+    assert response.status_code == 200
+    facets = {facet["category"]: facet["count"] for facet in response.json()}
+    response = test_client.get("/news/", headers=headers, params={"category": "science"})
+    assert int(response.headers["X-Total-Count"]) == facets.get("science", 0)
+
+    payload = {"title": "Facet", "content": "Facet content", "categories": ["science", "food"]}
+    created = test_client.post("/news/", headers=headers, json=payload).json()
+
+    response = test_client.get("/news/facets", headers=headers)
+    new_facets = {facet["category"]: facet["count"] for facet in response.json()}
+    assert new_facets["science"] == facets.get("science", 0) + 1
+    assert new_facets["food"] == facets.get("food", 0) + 1
+    response = test_client.get("/news/", headers=headers, params={"limit": 1})
+    assert int(response.headers["X-Total-Count"]) == total + 1
+
+    test_client.delete(f"/news/{created['id']}", headers=headers)
+    response = test_client.get("/news/", headers=headers, params={"category": "science"})
+    assert int(response.headers["X-Total-Count"]) == facets.get("science", 0)
+
+
+@pytest.mark.order(15)
+def test_conditional_get(test_client: TestClient, bearer_token: str) -> None:
+    """Test ETags and If-None-Match on a single article and on listings."""
+    headers = {"Authorization": f"Bearer {bearer_token}"}
+    payload = {"title": "ETag", "content": "ETag content", "categories": ["world"]}
+    created = test_client.post("/news/", headers=headers, json=payload).json()
+
+    response = test_client.get(f"/news/{created['id']}", headers=headers)
+    etag = response.headers["ETag"]
+    # Cached on create, while the listing is read from the database
+    listed = test_client.get("/news/", headers=headers, params={"category": "world"}).json()
+    assert response.json() in listed
+    response = test_client.get(
+        f"/news/{created['id']}", headers={**headers, "If-None-Match": f'"other", {etag}'}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    response = test_client.get("/news/", headers=headers, params={"category": "world"})
+    list_etag = response.headers["ETag"]
+    response = test_client.get(
+        "/news/", headers={**headers, "If-None-Match": list_etag}, params={"category": "world"}
+    )
+    assert response.status_code == 304
+    response = test_client.get(
+        "/news/", headers={**headers, "If-None-Match": list_etag}, params={"category": "food"}
+    )
+    assert response.status_code == 200
+
+    response = test_client.patch(
+        f"/news/{created['id']}", headers=headers, json={**payload, "title": "ETag 2"}
+    )
+    assert response.json()["updated_at"] > created["updated_at"]
+
+    response = test_client.get(f"/news/{created['id']}", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    response = test_client.get(
+        "/news/", headers={**headers, "If-None-Match": list_etag}, params={"category": "world"}
+    )
+    assert response.status_code == 200
+    assert response.json()[0]["title"] == "ETag 2"
+
+    test_client.delete(f"/news/{created['id']}", headers=headers)
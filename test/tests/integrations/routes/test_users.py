@@ -1,8 +1,13 @@
 import random
 from typing import get_args
+from uuid import uuid4
 from fastapi.testclient import TestClient
+from passlib.context import CryptContext
 import pytest
 
+from app.api.auth import password_hasher
+from app.infraestructure.database.repositories import user_repository
+
 from app.infraestructure.database.seed import (
     TEST_EMAIL,
     TEST_INTERESTS,
@@ -108,7 +113,58 @@ def test_add_and_delete_user_interest(test_client: TestClient, user_id: str) ->
         assert response.json()["message"] == "Interest removed successfully"
         assert new_interest not in response.json()["user"]["interests"]
 
+
+@pytest.mark.order(7)
+def test_add_existing_and_remove_missing_interest(test_client: TestClient, user_id: str) -> None:
+    """Test that adding a present interest or removing a missing one is rejected."""
+    response = test_client.post(f"/users/{user_id}/interests/{TEST_INTERESTS[0]}")
+    assert response.status_code == 400
+
+    response = test_client.delete(f"/users/{user_id}/interests/sports")
+    assert response.status_code == 400
+
+
+@pytest.mark.order(7)
+def test_replace_user_interests(test_client: TestClient, user_id: str) -> None:
+    """Test that PUT /users/{user_id}/interests replaces the whole set of interests."""
+    response = test_client.put(
+        f"/users/{user_id}/interests",
+        json={"interests": ["science", "sports", "science"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["message"] == "Interests replaced successfully"
+    assert response.json()["user"]["interests"] == ["science", "sports"]
+
+    response = test_client.put(
+        f"/users/{user_id}/interests", json={"interests": TEST_INTERESTS}
+    )
+    assert response.json()["user"]["interests"] == TEST_INTERESTS
+
+    response = test_client.put(f"/users/{uuid4()}/interests", json={"interests": []})
+    assert response.status_code == 404
+
+
 @pytest.mark.order(7)
+def test_auth_user_rehashes_outdated_password(
+    test_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that logging in with a hash of another bcrypt cost stores an upgraded hash."""
+    monkeypatch.setattr(
+        password_hasher,
+        "crypt_context",
+        CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4),
+    )
+    response = test_client.post(
+        "/users/auth", data={"username": TEST_USERNAME, "password": TEST_PASSWORD}
+    )
+    assert response.status_code == 200
+
+    user = test_client.portal.call(user_repository.fetch_by_username, TEST_USERNAME)
+    assert user is not None
+    assert user.password.get_secret_value().startswith("$2b$04$")
+
+
+@pytest.mark.order(8)
 def test_delete_user(test_client: TestClient, user_id: str) -> None:
     """Test that the /users/{user_id} endpoint deletes a user."""
     response = test_client.delete(f"/users/{user_id}")
@@ -117,4 +173,3 @@ def test_delete_user(test_client: TestClient, user_id: str) -> None:
     else:
         assert response.status_code == 200
         assert response.json()["message"] == "User deleted successfully"
-
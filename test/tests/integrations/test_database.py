@@ -0,0 +1,106 @@
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from app.api.profiling import profiles
+from app.config import settings
+
+from app.infraestructure.database.models import NewsArticleModel, UserModel, __beanie_models__
+from app.infraestructure.database.query_shapes import (
+    find_undeclared_queries,
+    get_query_shapes,
+    report_index_coverage,
+)
+from app.infraestructure.database.repositories import (
+    news_articles_repository,
+    user_repository,
+)
+from app.infraestructure.database.seed import seed_database
+
+
+async def test_every_query_shape_is_covered_by_an_index(test_client: TestClient) -> None:
+    """Test that no repository query shape falls back to a collection scan."""
+    assert get_query_shapes(), "No query shapes were registered"
+    uncovered = await report_index_coverage(__beanie_models__)
+    assert uncovered == [], f"Uncovered query shapes: {[str(s) for s in uncovered]}"
+
+
+def test_every_repository_query_declares_its_shapes() -> None:
+    """Test that no repository function escapes the index coverage check."""
+    assert find_undeclared_queries([news_articles_repository, user_repository]) == []
+
+
+async def test_seed_database_is_idempotent(test_client: TestClient) -> None:
+    """Test that seeding again inserts nothing and keeps the existing documents."""
+    await seed_database()
+    users = await UserModel.find_all().to_list()
+    news_articles = await NewsArticleModel.find_all().to_list()
+
+    await seed_database()
+
+    assert await UserModel.find_all().to_list() == users
+    assert await NewsArticleModel.find_all().to_list() == news_articles
+
+
+def test_startup_timings(test_client: TestClient) -> None:
+    """Test that every startup phase is timed."""
+    response = test_client.get("/health/startup")
+    assert response.status_code == 200
+    phases = response.json()["phases_ms"]
+    assert {"import", "beanie_init", "index_creation", "warm_up", "seed"} <= set(phases)
+
+
+def test_metrics(test_client: TestClient) -> None:
+    """Test that requests are exported per route template, with the caches, coalescing and the pool."""
+    response = test_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/news/{id}",' in response.text
+    assert 'cache_hit_ratio{cache="news_articles"}' in response.text
+    assert 'single_flight_shared_total{method="users.fetch_by_id"}' in response.text
+    assert "mongodb_pool_checkout_wait_seconds_count" in response.text
+
+
+def test_single_flight_stats(test_client: TestClient) -> None:
+    """Test that the coalesced reads are counted per repository method."""
+    response = test_client.get("/health/coalescing")
+    assert response.status_code == 200
+    stats = response.json()
+    assert {"news_articles.fetch_by_id", "users.fetch_by_username"} <= set(stats)
+    assert stats["news_articles.fetch_by_id"]["calls"] > 0
+
+
+def test_batch_loader_stats(test_client: TestClient) -> None:
+    """Test that the batched lookups by ID are counted per repository method."""
+    response = test_client.get("/health/batching")
+    assert response.status_code == 200
+    stats = response.json()
+    assert {"news_articles.fetch_by_id", "users.fetch_by_id"} <= set(stats)
+    assert stats["users.fetch_by_id"]["batches"] > 0
+
+
+def test_admin_profiles(test_client: TestClient, monkeypatch) -> None:
+    """Test that stored profiles are only served with the admin secret."""
+    assert test_client.get("/admin/profiles/unknown").status_code == 404
+
+    monkeypatch.setattr(settings, "admin_secret", SecretStr("profiling-test-secret"))
+    profiles.set("stored", {"id": "stored"})
+    headers = {"X-Admin-Secret": "profiling-test-secret"}
+
+    wrong_secret = {"X-Admin-Secret": "wrong"}
+    assert test_client.get("/admin/profiles/stored", headers=wrong_secret).status_code == 403
+    assert test_client.get("/admin/profiles/unknown", headers=headers).status_code == 404
+    response = test_client.get("/admin/profiles/stored", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == {"id": "stored"}
+
+
+def test_admin_slow_queries(test_client: TestClient, monkeypatch) -> None:
+    """Test that the slow query table is served and reset with the admin secret."""
+    monkeypatch.setattr(settings, "admin_secret", SecretStr("slow-queries-test-secret"))
+    headers = {"X-Admin-Secret": "slow-queries-test-secret"}
+
+    response = test_client.get("/admin/slow-queries", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["threshold_ms"] == settings.slow_query_threshold_ms
+    assert isinstance(response.json()["shapes"], list)
+    assert test_client.delete("/admin/slow-queries", headers=headers).status_code == 204
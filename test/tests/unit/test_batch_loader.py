@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from app.infraestructure.coalescing import BatchLoader, BatchLoadingRepository
+
+
+class _Repository:
+    def __init__(self) -> None:
+        self.queries: list[list[int]] = []
+        self.users = {1: "alice", 2: "bob"}
+
+    async def fetch_many_by_ids(self, ids: list[int]) -> list[str | None]:
+        self.queries.append(ids)
+        await asyncio.sleep(0)
+        if -1 in ids:
+            raise ValueError(ids)
+        return [self.users.get(id) for id in ids]
+
+    async def fetch_by_username(self, username: str) -> str:
+        return username
+
+
+async def test_lookups_of_the_same_iteration_share_one_query() -> None:
+    repository = _Repository()
+    batched = BatchLoadingRepository(repository, max_batch_size=100)
+
+    users = await asyncio.gather(*(batched.fetch_by_id(id) for id in [1, 2, 1, 3]))
+
+    assert users == ["alice", "bob", "alice", None]
+    assert repository.queries == [[1, 2, 3]]
+    stats = batched.loader.stats
+    assert (stats.loads, stats.batches, stats.keys) == (4, 1, 3)
+
+    # Lookups issued later are loaded by a new query
+    assert await batched.fetch_by_id(2) == "bob"
+    assert repository.queries == [[1, 2, 3], [2]]
+    assert await batched.fetch_by_username("carol") == "carol"
+
+
+async def test_batches_are_loaded_at_most_max_batch_size_keys_at_once() -> None:
+    repository = _Repository()
+    batched = BatchLoadingRepository(repository, max_batch_size=2)
+
+    await asyncio.gather(*(batched.fetch_by_id(id) for id in [1, 2, 3]))
+
+    assert repository.queries == [[1, 2], [3]]
+
+
+async def test_errors_reach_every_caller_of_the_batch() -> None:
+    repository = _Repository()
+    batched = BatchLoadingRepository(repository, max_batch_size=100)
+
+    results = await asyncio.gather(
+        batched.fetch_by_id(1), batched.fetch_by_id(-1), return_exceptions=True
+    )
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+
+async def test_cancelled_callers_do_not_cancel_the_batch() -> None:
+    loaded = asyncio.Event()
+
+    async def load_many(keys: list[int]) -> list[int]:
+        await loaded.wait()
+        return [key * 10 for key in keys]
+
+    loader: BatchLoader[int, int] = BatchLoader(load_many)
+    first = asyncio.create_task(loader.load(1))
+    second = asyncio.create_task(loader.load(1))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    loaded.set()
+    assert await second == 10
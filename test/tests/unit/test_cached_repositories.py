@@ -0,0 +1,69 @@
+import asyncio
+from uuid import uuid4
+
+from app.core.news.entities.news_article import NewsArticle, UpdateNewsArticleDto
+from app.infraestructure.cache import TTLCache
+from app.infraestructure.cache.news_articles_repository import CachedNewsArticleRepository
+from app.infraestructure.cache.news_counts_repository import CachedNewsArticleCountsRepository
+
+
+class _SlowRepository:
+    """Serves reads made before a write once the write is done."""
+
+    def __init__(self, article: NewsArticle) -> None:
+        self.article = article
+        self.read_done = asyncio.Event()
+
+    async def fetch_by_id(self, id):
+        article = self.article
+        await self.read_done.wait()
+        return article
+
+    async def estimated_count(self) -> int:
+        count = 1 if self.article else 0
+        await self.read_done.wait()
+        return count
+
+    async def update(self, id, dto, expected_version=None):
+        self.article = self.article.model_copy(update={**dto.model_dump(), "version": 1})
+        return self.article
+
+    async def remove(self, id):
+        article, self.article = self.article, None
+        return article
+
+
+def _article() -> NewsArticle:
+    return NewsArticle(id=uuid4(), title="Before", content="Content", categories=["world"])
+
+
+async def test_a_read_racing_with_an_update_is_not_cached() -> None:
+    article = _article()
+    source = _SlowRepository(article)
+    repository = CachedNewsArticleRepository(
+        source, cache=TTLCache(max_size=10, ttl=60), negative_ttl=5  # type: ignore[arg-type]
+    )
+
+    read = asyncio.create_task(repository.fetch_by_id(article.id))
+    await asyncio.sleep(0)
+    dto = UpdateNewsArticleDto(title="After", content="Content")
+    await repository.update(article.id, dto)
+    source.read_done.set()
+
+    assert (await read).title == "Before"
+    assert (await repository.fetch_by_id(article.id)).title == "After"  # type: ignore[union-attr]
+
+
+async def test_a_count_racing_with_a_write_is_not_cached() -> None:
+    source = _SlowRepository(_article())
+    repository = CachedNewsArticleCountsRepository(
+        source, cache=TTLCache(max_size=10, ttl=60)  # type: ignore[arg-type]
+    )
+
+    count = asyncio.create_task(repository.estimated_count())
+    await asyncio.sleep(0)
+    await repository.remove(uuid4())
+    source.read_done.set()
+
+    assert await count == 1
+    assert await repository.estimated_count() == 0
@@ -0,0 +1,24 @@
+from uuid import uuid4
+
+from app.api.etag import entity_etag, listing_etag, parse_entity_etag
+from app.core.news.entities.news_article import NewsArticle
+
+
+def test_entity_etag_is_accepted_back_as_a_version() -> None:
+    id = uuid4()
+    etag = entity_etag(id, 3)
+
+    assert parse_entity_etag(id, etag) == 3
+    assert parse_entity_etag(id, '"3"') == 3
+    assert parse_entity_etag(uuid4(), etag) is None
+
+
+def test_listing_etag_changes_with_the_articles_and_the_total() -> None:
+    article = NewsArticle(id=uuid4(), title="Title", content="Content", categories=["world"])
+    params = [("category", "world")]
+    etag = listing_etag([article], 1, params)
+
+    assert listing_etag([article], 1, params) == etag
+    assert listing_etag([article], 2, params) != etag
+    assert listing_etag([article.model_copy(update={"version": 1})], 1, params) != etag
+    assert listing_etag([], 1, params) != etag
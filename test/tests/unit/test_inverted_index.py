@@ -0,0 +1,30 @@
+import pytest
+
+from app.infraestructure.search import InvertedIndex, tokenize
+
+
+def test_tokenize_is_case_and_diacritic_insensitive() -> None:
+    assert tokenize("Café, CAFE-crème!") == ["cafe", "cafe", "creme"]
+
+
+def test_scores_follow_mongodb_text_scoring() -> None:
+    index: InvertedIndex[int] = InvertedIndex({"title": 10, "content": 2})
+    index.add(1, {"title": "coffee", "content": "coffee shop coffee"})
+    index.add(2, {"title": "tea shop", "content": ""})
+
+    scores = index.search("coffee shop")
+    # Whole-field match in the title, repeated term in the content
+    assert scores[1] == pytest.approx(10 * 1.1 + 2 * 1.5 * (0.5 * 2 / 3 + 0.5) + 2 * (0.5 / 3 + 0.5))
+    assert scores[2] == pytest.approx(10 * (0.5 / 2 + 0.5))
+
+
+def test_add_replaces_and_remove_forgets() -> None:
+    index: InvertedIndex[int] = InvertedIndex({"title": 1})
+    index.add(1, {"title": "old"})
+    index.add(1, {"title": "new"})
+    assert index.search("old") == {}
+    assert set(index.search("new")) == {1}
+
+    index.remove(1)
+    assert len(index) == 0
+    assert index.search("new") == {}
@@ -0,0 +1,69 @@
+import io
+import json
+import logging
+import queue
+import sys
+
+from app.config import settings
+from app.infraestructure.monitoring import configure_logging, stop_logging
+from app.infraestructure.monitoring.logs import (
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+)
+
+
+def _record(name: str, level: int, msg: str, *args, **extra) -> logging.LogRecord:
+    return logging.makeLogRecord(
+        {
+            "name": name,
+            "levelno": level,
+            "levelname": logging.getLevelName(level),
+            "msg": msg,
+            "args": args,
+            **extra,
+        }
+    )
+
+
+def test_json_formatter_formats_lazily_with_extra_fields() -> None:
+    entry = json.loads(
+        JsonFormatter().format(_record("app.news", logging.INFO, "Article %s", 7, route="/news/"))
+    )
+    assert entry["message"] == "Article 7"
+    assert (entry["level"], entry["logger"], entry["route"]) == ("INFO", "app.news", "/news/")
+
+
+def test_sampling_filter_uses_the_closest_configured_logger() -> None:
+    sampling = SamplingFilter({"app": 1.0, "app.api": 0.0})
+    assert sampling.filter(_record("app.infraestructure", logging.INFO, "kept"))
+    assert not sampling.filter(_record("app.api.routes.news", logging.INFO, "dropped"))
+    assert sampling.filter(_record("app.api.routes.news", logging.WARNING, "always kept"))
+
+
+def test_queue_handler_drops_records_when_full() -> None:
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(_record("app", logging.INFO, "first"))
+    handler.handle(_record("app", logging.INFO, "second"))
+    assert (handler.queue.qsize(), handler.dropped) == (1, 1)
+
+
+def test_configure_logging_writes_json_from_a_thread(monkeypatch) -> None:
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", stream)
+    monkeypatch.setattr(settings, "log_level", "INFO")
+    monkeypatch.setattr(settings, "log_format", "json")
+    monkeypatch.setattr(settings, "log_levels", {"tests.quiet": "ERROR"})
+    try:
+        configure_logging()
+        logging.getLogger("tests.loud").info("User %s logged in", "alice")
+        logging.getLogger("tests.quiet").warning("Not written")
+        stop_logging()
+    finally:
+        monkeypatch.undo()
+        configure_logging()
+
+    entries = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(entry["logger"], entry["message"]) for entry in entries] == [
+        ("tests.loud", "User alice logged in")
+    ]
@@ -0,0 +1,35 @@
+import asyncio
+import logging
+import time
+
+from app.infraestructure.monitoring import LoopWatchdog
+from app.infraestructure.monitoring.loop_watchdog import loop_blocks, loop_lag
+
+
+def _blocking_handler() -> None:
+    time.sleep(0.3)
+
+
+async def test_watchdog_reports_the_blocking_stack_and_route(caplog) -> None:
+    current = asyncio.current_task()
+    watchdog = LoopWatchdog(
+        threshold=0.1,
+        interval=0.02,
+        describe_task=lambda task: "GET /slow" if task is current else None,
+    )
+    blocks_before = loop_blocks.values().get(("GET /slow",), 0)
+    lags_before = sum(counts[-1] for counts, _ in loop_lag.values().values())
+
+    with caplog.at_level(logging.WARNING, logger="app.infraestructure.monitoring"):
+        watchdog.start()
+        await asyncio.sleep(0.05)
+        _blocking_handler()
+        await asyncio.sleep(0.05)
+        await watchdog.stop()
+
+    reports = [r for r in caplog.records if r.name.endswith("loop_watchdog")]
+    assert len(reports) == 1
+    assert reports[0].route == "GET /slow"
+    assert "_blocking_handler" in reports[0].getMessage()
+    assert loop_blocks.values()[("GET /slow",)] == blocks_before + 1
+    assert sum(counts[-1] for counts, _ in loop_lag.values().values()) > lags_before
@@ -0,0 +1,79 @@
+import threading
+from datetime import timedelta
+
+from pymongo import monitoring
+
+from app.infraestructure.monitoring import CommandMetricsListener, MetricsRegistry
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_histogram_sums_the_shards_of_every_thread() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    histogram.observe(0.05, "/a")
+    thread = threading.Thread(target=lambda: histogram.observe(0.5, "/a"))
+    thread.start()
+    thread.join()
+    histogram.observe(2.0, "/a")
+
+    counts, total = histogram.values()[("/a",)]
+    # Cumulative: <=0.1, <=1.0, +Inf
+    assert counts == [1, 2, 3]
+    assert total == 2.55
+
+
+def test_registry_renders_the_text_format() -> None:
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests.", ("path",)).inc('/say "hi"')
+    gauge = registry.gauge("in_flight", "In flight.")
+    gauge.inc()
+    gauge.inc()
+    gauge.dec()
+    registry.histogram("wait_seconds", "Wait.", buckets=(0.5,)).observe(0.25)
+
+    assert registry.render() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{path="/say \\"hi\\""} 1\n'
+        "# HELP in_flight In flight.\n"
+        "# TYPE in_flight gauge\n"
+        "in_flight 1\n"
+        "# HELP wait_seconds Wait.\n"
+        "# TYPE wait_seconds histogram\n"
+        'wait_seconds_bucket{le="0.5"} 1\n'
+        'wait_seconds_bucket{le="+Inf"} 1\n'
+        "wait_seconds_sum 0.25\n"
+        "wait_seconds_count 1\n"
+    )
+
+
+def test_command_listener_records_latency_per_collection() -> None:
+    registry = MetricsRegistry()
+    listener = CommandMetricsListener(registry)
+
+    listener.started(
+        monitoring.CommandStartedEvent({"find": "news_articles"}, "db", 1, ADDRESS, 1)
+    )
+    listener.started(
+        monitoring.CommandStartedEvent(
+            {"getMore": 7, "collection": "news_articles"}, "db", 2, ADDRESS, 1
+        )
+    )
+    listener.succeeded(
+        monitoring.CommandSucceededEvent(timedelta(milliseconds=3), {}, "find", 1, ADDRESS, 1)
+    )
+    listener.failed(
+        monitoring.CommandFailedEvent(timedelta(milliseconds=8), {}, "getMore", 2, ADDRESS, 1)
+    )
+
+    rendered = registry.render()
+    assert (
+        'mongodb_command_duration_seconds_count{collection="news_articles",command="find"} 1'
+        in rendered
+    )
+    assert (
+        'mongodb_command_failures_total{collection="news_articles",command="getMore"} 1'
+        in rendered
+    )
@@ -0,0 +1,38 @@
+import asyncio
+
+from passlib.context import CryptContext
+
+from app.api.auth.password_hasher import PasswordHasher, PasswordHasherBusy
+
+
+async def test_hashing_fails_fast_when_the_queue_is_saturated() -> None:
+    """Test that callers waiting longer than the queue timeout get PasswordHasherBusy."""
+    hasher = PasswordHasher(
+        CryptContext(schemes=["bcrypt"], bcrypt__rounds=12),
+        max_concurrency=1,
+        queue_timeout=0.01,
+    )
+    results = await asyncio.gather(
+        hasher.hash("password"), hasher.hash("password"), return_exceptions=True
+    )
+    hasher.shutdown()
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], PasswordHasherBusy)
+
+
+async def test_verify_and_update_rehashes_outdated_hashes() -> None:
+    """Test that a hash with another bcrypt cost is upgraded on verification."""
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("password")
+    hasher = PasswordHasher(
+        CryptContext(schemes=["bcrypt"], bcrypt__rounds=5),
+        max_concurrency=1,
+        queue_timeout=1,
+    )
+
+    valid, new_hash = await hasher.verify_and_update("password", old_hash)
+    assert valid
+    assert new_hash is not None and new_hash.startswith("$2b$05$")
+
+    assert await hasher.verify_and_update("wrong", old_hash) == (False, None)
+    hasher.shutdown()
@@ -0,0 +1,44 @@
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from app.config import settings
+from app.infraestructure.database.mongodb import client_options
+from app.infraestructure.database.pool_metrics import PoolMetricsListener
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_listener_records_checkout_waits() -> None:
+    listener = PoolMetricsListener()
+    listener.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, 1))
+    listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.002))
+    listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.3))
+    listener.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+    listener.connection_check_out_failed(
+        monitoring.ConnectionCheckOutFailedEvent(ADDRESS, "timeout", 2.0)
+    )
+
+    stats = listener.stats
+    assert (stats.connections_open, stats.connections_in_use) == (1, 1)
+    assert (stats.checkouts, stats.checkout_failures) == (2, 1)
+    assert stats.checkout_wait_seconds_max == 2.0
+    assert stats.checkout_wait_seconds_mean == (0.002 + 0.3 + 2.0) / 3
+    # Cumulative: <=1ms, <=5ms, ..., <=0.25s, <=0.5s, ..., <=2.5s, +Inf
+    assert stats.checkout_wait_buckets == [0, 1, 1, 1, 1, 1, 1, 2, 2, 3, 3, 3]
+
+
+def test_client_options_are_applied(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "mongo_max_pool_size", 20)
+    monkeypatch.setattr(settings, "mongo_min_pool_size", 5)
+    monkeypatch.setattr(settings, "mongo_wait_queue_timeout_ms", 500)
+    monkeypatch.setattr(settings, "mongo_compressors", ["zlib"])
+    monkeypatch.setattr(settings, "mongo_read_preference", "secondaryPreferred")
+    monkeypatch.setattr(settings, "mongo_write_concern", "majority")
+
+    client = AsyncIOMotorClient("mongodb://localhost:27017", connect=False, **client_options())
+    pool_options = client.delegate.options.pool_options
+    assert (pool_options.max_pool_size, pool_options.min_pool_size) == (20, 5)
+    assert pool_options.wait_queue_timeout == 0.5
+    assert client.delegate.options.read_preference.mongos_mode == "secondaryPreferred"
+    assert client.write_concern.document == {"w": "majority"}
+    client.close()
@@ -0,0 +1,59 @@
+import contextvars
+
+import httpx
+from fastapi import FastAPI
+from pydantic import SecretStr
+
+from app.api.profiling import ProfilingMiddleware, profiles
+from app.config import settings
+from app.infraestructure.monitoring import command_metrics
+
+SECRET = "profiling-test-secret"
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        # Stands in for the MongoDB commands run by a route
+        for observer in command_metrics._observers:
+            observer("news_articles", "find", 0.002, True)
+            # Run by another request at the same time
+            contextvars.Context().run(observer, "users", "find", 0.001, True)
+        return {"id": item_id, "payload": [str(i) for i in range(1000)]}
+
+    app.add_middleware(ProfilingMiddleware)
+    return app
+
+
+async def _get(headers: dict[str, str]) -> httpx.Response:
+    transport = httpx.ASGITransport(app=_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get("/items/1", headers=headers)
+
+
+async def test_profiles_requests_sending_the_admin_secret(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "admin_secret", SecretStr(SECRET))
+
+    response = await _get({"X-Profile": "memory", "X-Admin-Secret": SECRET})
+
+    assert response.status_code == 200
+    profile = profiles.get(response.headers["X-Profile-Id"])
+    assert (profile["route"], profile["status_code"]) == ("/items/{item_id}", 200)
+    assert any("get_item" in entry["function"] for entry in profile["functions"])
+    assert profile["allocations"]["peak_bytes"] > 0
+    assert profile["mongo_commands"] == [
+        {"collection": "news_articles", "command": "find", "duration_ms": 2.0, "succeeded": True}
+    ]
+    assert profile["scope"]["mongo_commands"] == "request"
+    assert command_metrics._observers == ()
+
+
+async def test_ignores_requests_without_the_admin_secret(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "admin_secret", SecretStr(SECRET))
+
+    response = await _get({"X-Profile": "cpu", "X-Admin-Secret": "wrong"})
+
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
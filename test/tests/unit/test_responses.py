@@ -0,0 +1,43 @@
+import json
+from datetime import datetime
+from uuid import uuid4
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import SecretStr
+
+from app.api.responses import json_response
+from app.core.news.entities.news_article import NewsArticle
+from app.core.users.entities.user import User
+
+
+def test_json_response_matches_fastapi_encoding() -> None:
+    articles = [
+        NewsArticle.model_construct(
+            id=uuid4(),
+            title="Título",
+            content="Content",
+            categories=["science"],
+            created_at=datetime(2024, 1, 1, 12, 30),
+            updated_at=datetime(2024, 1, 2),
+            version=3,
+        )
+    ]
+    response = json_response(articles, list[NewsArticle])
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(articles)
+
+    user = User(id=uuid4(), username="user", password=SecretStr("hash"), email="user@example.com")
+    assert json.loads(json_response(user, User).body) == jsonable_encoder(user)
+
+
+def test_json_response_carries_injected_headers() -> None:
+    injected = Response()
+    del injected.headers["content-length"]
+    injected.status_code = None  # type: ignore[assignment]
+    injected.headers["X-Next-Cursor"] = "abc"
+
+    response = json_response([], list[NewsArticle], injected)
+    assert response.status_code == 200
+    assert response.headers["X-Next-Cursor"] == "abc"
+    assert response.headers["content-length"] == "2"
@@ -0,0 +1,29 @@
+from app import server
+from app.config import settings
+
+
+def test_workers_default_to_the_cpu_count(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "server_workers", None)
+    monkeypatch.setattr(server.os, "cpu_count", lambda: 6)
+    assert server.worker_count() == 6
+
+    monkeypatch.setattr(settings, "server_workers", 2)
+    assert server.worker_count() == 2
+
+
+def test_connection_budget_is_split_between_workers(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "mongo_connection_budget", None)
+    assert server.worker_environment(4) == {}
+
+    monkeypatch.setattr(settings, "mongo_connection_budget", 50)
+    assert server.worker_environment(4) == {"MONGO_MAX_POOL_SIZE": "12"}
+    assert server.worker_environment(100) == {"MONGO_MAX_POOL_SIZE": "1"}
+
+
+def test_uvicorn_options(monkeypatch) -> None:
+    monkeypatch.setattr(server, "_available", lambda module: module == "uvloop")
+    options = server.uvicorn_options(3)
+    assert options["workers"] == 3
+    assert (options["loop"], options["http"]) == ("uvloop", "h11")
+    assert options["reload"] is False
+    assert options["timeout_graceful_shutdown"] == settings.server_graceful_shutdown_seconds
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from app.infraestructure.coalescing import SingleFlight, SingleFlightRepository
+
+
+class _Repository:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.articles = {1: "first"}
+
+    async def fetch_by_id(self, id: int) -> str | None:
+        self.calls += 1
+        await self.release.wait()
+        if id < 0:
+            raise ValueError(id)
+        return self.articles.get(id)
+
+    async def update(self, id: int, title: str) -> None:
+        self.articles[id] = title
+
+
+async def _started() -> None:
+    # Lets the tasks run up to their first await
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+async def test_identical_concurrent_reads_share_one_call() -> None:
+    repository = _Repository()
+    coalesced = SingleFlightRepository(repository, name="news", reads=["fetch_by_id"])
+
+    tasks = [asyncio.create_task(coalesced.fetch_by_id(1)) for _ in range(3)]
+    other = asyncio.create_task(coalesced.fetch_by_id(id=2))
+    await _started()
+    repository.release.set()
+
+    assert await asyncio.gather(*tasks, other) == ["first"] * 3 + [None]
+    assert repository.calls == 2
+    stats = coalesced.flights["news.fetch_by_id"].stats
+    assert (stats.calls, stats.shared) == (2, 2)
+
+    # Finished calls are not shared anymore
+    assert await coalesced.fetch_by_id(1) == "first"
+    assert repository.calls == 3
+
+
+async def test_errors_reach_every_caller() -> None:
+    repository = _Repository()
+    coalesced = SingleFlightRepository(repository, name="news", reads=["fetch_by_id"])
+
+    tasks = [asyncio.create_task(coalesced.fetch_by_id(-1)) for _ in range(2)]
+    await _started()
+    repository.release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert repository.calls == 1
+
+
+async def test_cancelled_callers_do_not_cancel_the_others() -> None:
+    flight = SingleFlight()
+    release = asyncio.Event()
+    runs: list[str] = []
+
+    async def fetch() -> str:
+        runs.append("started")
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            runs.append("cancelled")
+            raise
+        return "done"
+
+    first = asyncio.create_task(flight.do("key", fetch))
+    second = asyncio.create_task(flight.do("key", fetch))
+    await _started()
+
+    first.cancel()
+    await asyncio.sleep(0)
+    assert first.cancelled()
+    release.set()
+    assert await second == "done"
+    assert runs == ["started"]
+
+    # Once every caller is cancelled, the call is cancelled too
+    release.clear()
+    third = asyncio.create_task(flight.do("key", fetch))
+    await _started()
+    third.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await third
+    await asyncio.sleep(0)
+    assert runs == ["started", "started", "cancelled"]
+
+
+async def test_reads_started_after_a_write_are_not_shared_with_earlier_ones() -> None:
+    repository = _Repository()
+    coalesced = SingleFlightRepository(repository, name="news", reads=["fetch_by_id"])
+
+    before = asyncio.create_task(coalesced.fetch_by_id(1))
+    await _started()
+    await coalesced.update(1, "second")
+    after = asyncio.create_task(coalesced.fetch_by_id(1))
+    await _started()
+    repository.release.set()
+
+    await asyncio.gather(before, after)
+    assert await after == "second"
+    assert repository.calls == 2
+
+
+def test_only_coroutine_methods_can_be_coalesced() -> None:
+    with pytest.raises(TypeError):
+        SingleFlightRepository(_Repository(), name="news", reads=["articles"])
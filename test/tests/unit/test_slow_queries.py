@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+from pymongo import monitoring
+
+from app.infraestructure.database import query_shapes
+from app.infraestructure.database.query_shapes import query_shape, query_source
+from app.infraestructure.database.models import NewsArticleModel
+from app.infraestructure.database.slow_queries import SlowQueryListener, normalize_command
+
+ADDRESS = ("localhost", 27017)
+
+
+def test_normalize_command_strips_values() -> None:
+    command = {
+        "find": "news_articles",
+        "filter": {"categories": {"$in": ["science", "health"]}, "created_at": {"$lt": 5}},
+        "sort": {"created_at": -1, "_id": -1},
+        "limit": 20,
+    }
+    assert normalize_command(command) == {
+        "filter": {"categories": {"$in": "?"}, "created_at": {"$lt": "?"}},
+        "sort": {"created_at": -1, "_id": -1},
+    }
+    # User input looking like a field path is a value too
+    assert normalize_command({"find": "news_articles", "filter": {"title": "$secret"}}) == {
+        "filter": {"title": "?"}
+    }
+
+    pipeline = [{"$unwind": "$categories"}, {"$group": {"_id": "$categories", "n": {"$sum": 1}}}]
+    assert normalize_command({"aggregate": "news_articles", "pipeline": pipeline}) == {
+        "pipeline": [
+            {"$unwind": "?"},
+            {"$group": {"_id": "?", "n": {"$sum": "?"}}},
+        ]
+    }
+
+
+def _run(listener: SlowQueryListener, request_id: int, username: str, milliseconds: int) -> None:
+    listener.started(
+        monitoring.CommandStartedEvent(
+            {"find": "users", "filter": {"username": username}}, "db", request_id, ADDRESS, 1
+        )
+    )
+    listener.succeeded(
+        monitoring.CommandSucceededEvent(
+            timedelta(milliseconds=milliseconds),
+            {"cursor": {"firstBatch": [{"username": username}]}},
+            "find",
+            request_id,
+            ADDRESS,
+            1,
+        )
+    )
+
+
+def test_slow_commands_are_aggregated_per_shape_and_function() -> None:
+    listener = SlowQueryListener(threshold=lambda: 0.1)
+
+    token = query_source.set("user_repository.fetch_by_username")
+    try:
+        _run(listener, 1, "alice", 150)
+        _run(listener, 2, "bob", 250)
+        _run(listener, 3, "carol", 5)
+    finally:
+        query_source.reset(token)
+
+    [stats] = listener.top(10)
+    assert (stats.collection, stats.command, stats.source) == (
+        "users",
+        "find",
+        "user_repository.fetch_by_username",
+    )
+    assert stats.shape == {"filter": {"username": "?"}}
+    assert (stats.count, stats.total_ms, stats.max_ms, stats.documents) == (2, 400, 250, 2)
+
+
+async def test_query_shape_sets_the_query_source(monkeypatch) -> None:
+    # Keep the shapes of this test out of the index coverage check
+    monkeypatch.setattr(query_shapes, "_query_shapes", [])
+
+    @query_shape(NewsArticleModel, filter=["_id"])
+    @query_shape(NewsArticleModel, filter=["categories"])
+    async def fetch() -> str | None:
+        return query_source.get()
+
+    @query_shape(NewsArticleModel, filter=["_id"])
+    async def iterate():
+        yield query_source.get()
+        yield query_source.get()
+
+    assert await fetch() == f"{__name__}.fetch"
+    assert [source async for source in iterate()] == [f"{__name__}.iterate"] * 2
+    assert query_source.get() is None
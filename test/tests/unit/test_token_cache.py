@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.api.auth.token_cache import TokenCache
+from app.core.users.entities.user import UserRegistry
+from app.infraestructure.cache import TTLCache
+
+
+def test_tokens_are_cached_until_the_signing_key_changes() -> None:
+    """Test that verified tokens are served from the cache until the key rotates."""
+    signing_key = ("first_secret", "HS256")
+    cache = TokenCache(TTLCache(max_size=10, ttl=0), signing_key=lambda: signing_key)
+    user = UserRegistry(id=uuid4())
+    cache.set("token", user, expires_at=datetime.now(timezone.utc) + timedelta(minutes=30))
+
+    assert cache.get("token") == user
+    assert cache.get("other-token") is None
+
+    signing_key = ("second_secret", "HS256")
+    assert cache.get("token") is None
+
+
+def test_expired_tokens_are_not_cached() -> None:
+    """Test that a token past its expiration is never cached."""
+    cache = TokenCache(TTLCache(max_size=10, ttl=0), signing_key=lambda: ("secret", "HS256"))
+    cache.set(
+        "token",
+        UserRegistry(id=uuid4()),
+        expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+    )
+
+    assert cache.get("token") is None
@@ -0,0 +1,70 @@
+from app.infraestructure.cache import MISSING, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_their_ttl() -> None:
+    """Test that entries expire after the default or their own TTL."""
+    clock = FakeClock()
+    cache: TTLCache[str, int | None] = TTLCache(max_size=10, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("missing", None, ttl=1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+    clock.now = 5
+    assert cache.get("a") == 1
+    assert cache.get("missing") is MISSING
+
+    clock.now = 10
+    assert cache.get("a") is MISSING
+    assert cache.stats.expirations == 2
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Test that the least recently used entry is evicted when the cache is full."""
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (3, 1, 1, 2)
+
+
+def test_values_read_before_an_invalidation_are_not_stored() -> None:
+    """Test that `set` skips the values read before their key was invalidated."""
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl=60)
+    epoch = cache.epoch()
+    cache.invalidate("a")
+    cache.set("a", 1, epoch=epoch)
+    cache.set("b", 2, epoch=epoch)
+    assert cache.get("a") is MISSING
+    assert cache.get("b") == 2
+
+    cache.set("a", 1, epoch=cache.epoch())
+    assert cache.get("a") == 1
+
+    epoch = cache.epoch()
+    cache.clear()
+    cache.set("b", 2, epoch=epoch)
+    assert cache.get("b") is MISSING
+
+    # Invalidations beyond max_size are forgotten, so older reads are skipped
+    epoch = cache.epoch()
+    for key in "cde":
+        cache.invalidate(key)
+    cache.set("b", 2, epoch=epoch)
+    assert cache.get("b") is MISSING